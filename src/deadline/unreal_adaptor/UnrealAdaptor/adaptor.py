@@ -8,7 +8,8 @@ import sys
 import time
 import logging
 import threading
-from typing import Callable
+from dataclasses import asdict
+from typing import Callable, Optional, Sequence
 
 from deadline.client.api import get_deadline_cloud_library_telemetry_client, TelemetryClient
 from openjd.adaptor_runtime._version import version as openjd_adaptor_version
@@ -20,7 +21,27 @@ from openjd.adaptor_runtime.application_ipc import ActionsQueue, AdaptorServer
 from openjd.adaptor_runtime.adaptors.configuration import AdaptorConfiguration
 
 from .._version import version as adaptor_version
-from .common import DataValidation, add_module_to_pythonpath
+from ..UnrealClient.events import (
+    EVENT_CHANNEL_OPEN,
+    EVENT_COMPLETE,
+    EVENT_ERROR,
+    EVENT_FRAME_DONE,
+    EVENT_PROGRESS,
+)
+from .server import (
+    CLIENT_EVENTS_SUPPORTED,
+    CLIENT_EVENTS_UNAVAILABLE_REASON,
+    UnrealAdaptorServer,
+)
+from .log_policy import UnrealLogPolicy, UnrealLogPolicyHandler
+from .common import (
+    ActivityWatchdog,
+    DataValidation,
+    LogMatchingStats,
+    StartupTimings,
+    add_module_to_pythonpath,
+    get_process_snapshot,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +52,162 @@ class UnrealNotRunningError(Exception):
     pass
 
 
-class UnrealSubprocessWithLogs(LoggingSubprocess): ...
+class UnrealStalledError(TimeoutError):
+    """Error that is raised when Unreal does not output anything longer than the stall timeout"""
+
+    pass
+
+
+class UnrealSubprocessWithLogs(LoggingSubprocess):
+    """
+    LoggingSubprocess of Unreal that sends the Unreal output to the task log through the log policy,
+    see :class:`UnrealLogPolicyHandler`
+    """
+
+    def __init__(self, *, log_policy_handler: Optional[UnrealLogPolicyHandler] = None, **kwargs):
+        """
+        :param log_policy_handler: Handler of the Unreal output, None to log all the output
+        :type log_policy_handler: UnrealLogPolicyHandler, optional
+        """
+        if log_policy_handler is not None:
+            kwargs["logger"] = log_policy_handler.logger
+        super().__init__(**kwargs)
+
+
+class PrefilteredRegexCallback(RegexCallback):
+    """
+    RegexCallback with the markers, substrings of which one is contained in every message
+    matched by its regex patterns. The patterns are not evaluated for the messages without markers.
+    """
+
+    def __init__(
+        self,
+        regex_list: Sequence[re.Pattern[str]],
+        callback: Callable[[re.Match], None],
+        markers: Sequence[str] = (),
+        **kwargs,
+    ) -> None:
+        """
+        :param regex_list: Regex patterns that invoke the callback if any of them matches the message
+        :type regex_list: Sequence[re.Pattern[str]]
+        :param callback: Callable that takes the re.Match object of the matched pattern
+        :type callback: Callable[[re.Match], None]
+        :param markers: Substrings of the matched messages, empty to evaluate the patterns for every message
+        :type markers: Sequence[str]
+        """
+        super().__init__(regex_list, callback, **kwargs)
+        self.markers = tuple(markers)
+
+    def accepts(self, message: str) -> bool:
+        """
+        Check if the regex patterns should be evaluated for the given message
+
+        :param message: Output line of Unreal
+        :type message: str
+
+        :return: True if the message contains one of the markers or there are no markers
+        :rtype: bool
+        """
+        return not self.markers or any(marker in message for marker in self.markers)
+
+
+class ActivityRegexHandler(RegexHandler):
+    """
+    RegexHandler that records each line of the Unreal output as the activity of Unreal
+    before matching it against the callbacks.
+
+    Only the callbacks of the step handler set by :meth:`set_step_handler` are active. The line is
+    matched in a single pass over them, and only if it contains one of their markers,
+    see :class:`PrefilteredRegexCallback`. The matching work is counted in :attr:`stats`.
+    """
+
+    def __init__(
+        self,
+        regex_callbacks: list[RegexCallback],
+        watchdog: ActivityWatchdog,
+        step_regex_callbacks: Optional[dict[str, list[RegexCallback]]] = None,
+    ):
+        """
+        :param regex_callbacks: Regex callbacks to match the output lines if no step handler is set
+        :type regex_callbacks: list[RegexCallback]
+        :param watchdog: Watchdog to record the activity to
+        :type watchdog: ActivityWatchdog
+        :param step_regex_callbacks: Regex callbacks of each step handler name
+        :type step_regex_callbacks: dict[str, list[RegexCallback]], optional
+        """
+        super().__init__(regex_callbacks)
+        self.watchdog = watchdog
+        self.stats = LogMatchingStats()
+        self._default_regex_callbacks = list(regex_callbacks)
+        self._step_regex_callbacks = step_regex_callbacks or {}
+        self._markers: Optional[tuple[str, ...]] = None
+        self._set_regex_callbacks(self._default_regex_callbacks)
+
+    def _set_regex_callbacks(self, regex_callbacks: list[RegexCallback]) -> None:
+        self.regex_callbacks = list(regex_callbacks)
+
+        # The line prefilter is only possible if each active callback has the markers
+        markers: list[str] = []
+        for regex_callback in self.regex_callbacks:
+            if (
+                not isinstance(regex_callback, PrefilteredRegexCallback)
+                or not regex_callback.markers
+            ):
+                self._markers = None
+                return
+            markers.extend(m for m in regex_callback.markers if m not in markers)
+        self._markers = tuple(markers)
+
+    def set_step_handler(self, handler_name: Optional[str]) -> None:
+        """
+        Match the output lines only against the regex callbacks of the given step handler
+
+        :param handler_name: Name of the step handler, e.g. render. The callbacks of all the handlers
+                             are active if the name is None or unknown
+        :type handler_name: str, optional
+        """
+        regex_callbacks = self._step_regex_callbacks.get(handler_name or "")
+        # The output is matched under the handler lock, see logging.Handler.handle()
+        self.acquire()
+        try:
+            self._set_regex_callbacks(
+                regex_callbacks if regex_callbacks is not None else self._default_regex_callbacks
+            )
+        finally:
+            self.release()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = str(record.msg)
+        self.watchdog.touch(message)
+        self.stats.lines += 1
+
+        if self._markers is not None and not any(marker in message for marker in self._markers):
+            return
+        self.stats.candidate_lines += 1
+
+        matched = False
+        for regex_callback in self.regex_callbacks:
+            if matched and regex_callback.only_run_if_first_matched:
+                continue
+            if isinstance(regex_callback, PrefilteredRegexCallback) and not regex_callback.accepts(
+                message
+            ):
+                continue
+
+            match = None
+            for regex in regex_callback.regex_list:
+                self.stats.regex_evaluations += 1
+                match = regex.search(message)
+                if match:
+                    break
+            if match is None:
+                continue
+
+            self.stats.matches += 1
+            regex_callback.callback(match)
+            if regex_callback.exit_if_matched:
+                break
+            matched = True
 
 
 class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
@@ -43,6 +219,13 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
     _SERVER_END_TIMEOUT_SECONDS = 30
     _UNREAL_START_TIMEOUT_SECONDS = 86400
     _UNREAL_END_TIMEOUT_SECONDS = 30
+    # Default time without any Unreal output after which Unreal is considered hung,
+    # can be overridden with "startup_stall_timeout" and "render_stall_timeout" of the init_data
+    _UNREAL_STARTUP_STALL_TIMEOUT_SECONDS = 3600
+    _UNREAL_RENDER_STALL_TIMEOUT_SECONDS = 1800
+    _WAIT_RESULT_INTERVAL_SECONDS = 1
+    # Step handlers which output is matched by the adaptor
+    _STEP_HANDLER_NAMES = ["render", "custom"]
 
     _server: AdaptorServer | None = None
 
@@ -50,6 +233,12 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     _unreal_client: UnrealSubprocessWithLogs | None = None
 
+    _log_handler: ActivityRegexHandler | None = None
+
+    _log_policy_handler: UnrealLogPolicyHandler | None = None
+
+    _unreal_exit_watcher_thread: threading.Thread | None = None
+
     _action_queue = ActionsQueue()
 
     _is_rendering: bool = False
@@ -65,6 +254,26 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         self.data_validation = DataValidation()
 
+        # Set when the current run can be finished: Unreal completed the render, reported
+        # an error or exited
+        self._run_finished_event = threading.Event()
+
+        self._startup_timings = StartupTimings()
+
+        self._activity_watchdog = ActivityWatchdog()
+
+        # Last progress and status message sent to the worker agent, to not send the same again
+        self._reported_progress: tuple[int, str | None] | None = None
+
+        # Set when the UnrealClient opened the event channel, see handle_client_event()
+        self._client_events_enabled = False
+        # Task of the current run and the task the Unreal log has reached, see _is_log_of_current_task
+        self._task_id = 0
+        self._log_task_id = 0
+        self._task_lock = threading.Lock()
+        self._task_completed = False
+        self._task_progress_events = False
+
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
         return SemanticVersion(major=0, minor=1)
@@ -97,6 +306,16 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         """
         return self._unreal_client is not None and self._unreal_client.is_running
 
+    @property
+    def _unreal_client_ready(self) -> bool:
+        """Property which indicates that the UnrealClient reached the adaptor server: it opened
+        the event channel or reported the first_client_poll startup phase
+
+        :return: True if the UnrealClient reached the adaptor server, false otherwise
+        :rtype: bool
+        """
+        return self._client_events_enabled or self._startup_timings.has_phase("first_client_poll")
+
     @property
     def _unreal_is_rendering(self) -> bool:
         """Property which indicates if unreal is rendering
@@ -157,28 +376,32 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
     def _wait_for_unreal_started(self):
         """
-        Performs a busy wait for the starting of the Unreal Engine with the UnrealClient script
+        Performs a busy wait for the starting of the Unreal Engine with the UnrealClient script.
+        Unreal is terminated if it does not output anything longer than the startup stall timeout
+        before the UnrealClient is ready.
 
         :raises RuntimeError: Raised when the UnrealClient encountered an error during initialization
         :raises TimeoutError: Raised when the UnrealClient doesn't complete the initial actions before timeout reached
+        :raises UnrealStalledError: Raised when Unreal is stalled before the UnrealClient is ready
         """
         is_not_timed_out = self.get_timer(self._UNREAL_START_TIMEOUT_SECONDS)
         while (
             self._unreal_is_running
             and not self._has_exception
-            and len(self._action_queue)
-            > 0  # for now the initializing actions in the action queue, defined by
-            # _populate_action_queue() method.
-            # So we wait for them to be done or for time is out.
+            # Wait for the UnrealClient to reach the server and take the initializing actions,
+            # defined by _populate_action_queue() method, or for time is out.
+            and (not self._unreal_client_ready or len(self._action_queue) > 0)
             and is_not_timed_out()
         ):
+            self._check_unreal_stalled("startup")
             time.sleep(0.1)
 
         self._get_deadline_telemetry_client().record_event(
             event_type="com.amazon.rum.deadline.adaptor.runtime.start", event_details={}
         )
 
-        if len(self._action_queue) > 0:  # if for some reason, all the actions are not complete
+        # if for some reason, the client is not ready or all the actions are not complete
+        if not self._unreal_client_ready or len(self._action_queue) > 0:
             if is_not_timed_out():  # and timeout is not reached
                 raise RuntimeError(  # <- we catch some exception - self._has_exception is True
                     "Unreal encountered an error and was not able to complete initialization actions."
@@ -189,12 +412,58 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
                     f"{self._UNREAL_START_TIMEOUT_SECONDS} seconds and failed to start."
                 )
 
+    def _check_unreal_stalled(self, phase: str) -> None:
+        """
+        Fail fast if Unreal did not output anything longer than the stall timeout of the given phase.
+        The last output lines and the process stats are logged and sent as the telemetry event,
+        then Unreal is terminated.
+
+        :param phase: "startup" or "render"
+        :type phase: str
+
+        :raises UnrealStalledError: If Unreal is stalled
+        """
+        if phase == "startup":
+            stall_timeout = self.init_data.get(
+                "startup_stall_timeout", self._UNREAL_STARTUP_STALL_TIMEOUT_SECONDS
+            )
+        else:
+            stall_timeout = self.init_data.get(
+                "render_stall_timeout", self._UNREAL_RENDER_STALL_TIMEOUT_SECONDS
+            )
+
+        if not self._activity_watchdog.is_stalled(stall_timeout):
+            return
+
+        last_lines = self._activity_watchdog.last_lines
+        snapshot = get_process_snapshot(self._unreal_client.pid) if self._unreal_client else {}
+        logger.error(
+            f"Unreal did not output anything for {stall_timeout} seconds during {phase}. "
+            f"Process: {snapshot}. Last output lines:\n" + "\n".join(last_lines)
+        )
+        self._get_deadline_telemetry_client().record_event(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.stall",
+            event_details={
+                "phase": phase,
+                "stall_timeout": stall_timeout,
+                "process": snapshot,
+                "last_line": last_lines[-1] if last_lines else "",
+            },
+        )
+
+        if self._unreal_client is not None and self._unreal_client.is_running:
+            self._unreal_client.terminate(grace_time_s=0)
+
+        raise UnrealStalledError(
+            f"Unreal stalled during {phase}: no output for {stall_timeout} seconds"
+        )
+
     def _start_unreal_server(self) -> None:
         """
         Starts a server with the given ActionsQueue, attaches the server to the adaptor and serves
         forever in a blocking call.
         """
-        self._server = AdaptorServer(self._action_queue, self)
+        self._server = UnrealAdaptorServer(self._action_queue, self)
         self._server.serve_forever()
 
     def _start_unreal_server_thread(self) -> None:
@@ -204,39 +473,195 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         on after the server has finished starting.
         """
 
+        if not CLIENT_EVENTS_SUPPORTED:
+            logger.warning(
+                f"UnrealClient events are not available: {CLIENT_EVENTS_UNAVAILABLE_REASON}. "
+                "Progress and completion of the tasks are matched in the Unreal log"
+            )
+
         self._server_thread = threading.Thread(
             target=self._start_unreal_server, name="UnrealAdaptorServerThread"
         )
         self._server_thread.start()
         os.environ["UNREAL_ADAPTOR_SOCKET_PATH"] = self._wait_for_adaptor_server_socket()
 
+    def _get_step_regex_callbacks(self, handler_name: str) -> list[RegexCallback]:
+        """
+        Returns a list of RegexCallbacks built from the regex patterns of the given UnrealClient handler
+        :param handler_name: Name of the step handler, e.g. render
+        :type handler_name: str
+        :return: List of Regex Callbacks to add
+        :rtype: list[RegexCallback]
+        """
+
+        from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class
+
+        handler_class = get_step_handler_class(handler_name)
+
+        logger.info(f"Gettings regex pattertns from step handler: {handler_class}...")
+
+        markers = handler_class.regex_markers()
+        callbacks: list[RegexCallback] = [
+            PrefilteredRegexCallback(
+                handler_class.regex_pattern_progress(), self._handle_progress, markers
+            ),
+            PrefilteredRegexCallback(
+                handler_class.regex_pattern_complete(), self._handle_complete, markers
+            ),
+            PrefilteredRegexCallback(
+                handler_class.regex_pattern_error(), self._handle_error, markers
+            ),
+        ]
+
+        if handler_class.regex_pattern_summary():
+            callbacks.append(
+                PrefilteredRegexCallback(
+                    handler_class.regex_pattern_summary(), self._handle_summary, markers
+                )
+            )
+
+        return callbacks
+
+    def _get_startup_regex_callbacks(self) -> list[RegexCallback]:
+        """
+        Returns a list of RegexCallbacks that match the tasks started by the UnrealClient
+        and the startup phases it reports
+        :return: List of Regex Callbacks to add
+        :rtype: list[RegexCallback]
+        """
+        return [
+            PrefilteredRegexCallback(
+                [re.compile('Performing action: {"name": "set_handler", .*"task_id": ([0-9]+)')],
+                self._handle_task_started,
+                ["Performing action:"],
+            ),
+            PrefilteredRegexCallback(
+                [re.compile(".*UnrealClient: Startup phase: ([a-z_]+)")],
+                self._handle_startup_phase,
+                ["UnrealClient: Startup phase:"],
+            ),
+        ]
+
     def _get_regex_callbacks(self) -> list[RegexCallback]:
         """
-        Returns a list of RegexCallbacks built from UnrealClient handler regex patterns
+        Returns a list of RegexCallbacks built from the regex patterns of all the UnrealClient handlers,
+        they are active until the step handler of the task is set
         :return: List of Regex Callbacks to add
         :rtype: list[RegexCallback]
         """
 
         callbacks = []
 
-        from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class
+        for handler_name in self._STEP_HANDLER_NAMES:
+            callbacks.extend(self._get_step_regex_callbacks(handler_name))
 
-        for handler_name in ["render", "custom"]:
-            handler_class = get_step_handler_class(handler_name)
+        callbacks.extend(self._get_startup_regex_callbacks())
 
-            logger.info(f"Gettings regex pattertns from step handler: {handler_class}...")
+        return callbacks
 
-            callbacks.append(
-                RegexCallback(handler_class.regex_pattern_progress(), self._handle_progress)
-            )
+    def _handle_task_started(self, match: re.Match) -> None:
+        """
+        Callback for stdout that indicates that the UnrealClient set the step handler of the task,
+        the following output belongs to this task
 
-            callbacks.append(
-                RegexCallback(handler_class.regex_pattern_complete(), self._handle_complete)
+        :param match: re.Match object from the regex pattern that was matched the message
+        :type match: re.Match
+        """
+        self._log_task_id = int(match.groups()[0])
+
+    @property
+    def _log_task(self) -> int:
+        """
+        Task the matched log line belongs to. When the event channel is open, the run may finish
+        on the event before the log of the task is matched, so the rest of that log should not
+        finish the next run.
+
+        :return: Task the Unreal log has reached if the event channel is open, the current task otherwise
+        :rtype: int
+        """
+        return self._log_task_id if self._client_events_enabled else self._task_id
+
+    @property
+    def _is_log_of_current_task(self) -> bool:
+        """
+        Check if the matched log line belongs to the current task, see :attr:`_log_task`
+
+        :return: True if the matched log line belongs to the current task
+        :rtype: bool
+        """
+        return self._log_task == self._task_id
+
+    def handle_client_event(self, event: dict) -> None:
+        """
+        Handle the event that the UnrealClient sent over the adaptor socket,
+        see :mod:`deadline.unreal_adaptor.UnrealClient.events`. The events of the previous tasks
+        are ignored. Progress from the log is ignored after the progress event of the task.
+
+        :param event: Event dictionary with the "type", "task_id" and the details
+        :type event: dict
+        """
+        event_type = event.get("type")
+        if event_type == EVENT_CHANNEL_OPEN:
+            logger.info("UnrealClient opened the event channel")
+            self._client_events_enabled = True
+            return
+
+        task_id = event.get("task_id")
+        if task_id != self._task_id:
+            logger.debug(f"Ignore the event of the previous task: {event}")
+            return
+
+        if event_type in (EVENT_PROGRESS, EVENT_FRAME_DONE):
+            self._task_progress_events = True
+            self._report_progress(
+                int(float(event["progress"])), self._parse_stats(event.get("stats", ""))
             )
+        elif event_type == EVENT_COMPLETE:
+            self._complete_task(task_id)
+        elif event_type == EVENT_ERROR:
+            if event.get("details"):
+                logger.error(f"Unreal Encountered an Error: {event['details']}")
+            self._fail_task(task_id, event.get("message", ""))
+        else:
+            logger.warning(f"Unknown event of the UnrealClient: {event}")
+
+    def _handle_startup_phase(self, match: re.Match) -> None:
+        """
+        Callback for stdout that indicates the end of the startup phase reported by the UnrealClient:
+        first_client_poll, asset_registry_ready, handler_set
 
-            callbacks.append(RegexCallback(handler_class.regex_pattern_error(), self._handle_error))
+        :param match: re.Match object from the regex pattern that was matched the message
+        :type match: re.Match
+        """
+        self._mark_startup_phase(match.groups()[0])
 
-        return callbacks
+    def _mark_startup_phase(self, phase: str) -> None:
+        """
+        Record the end of the given startup phase, log it, send the telemetry event and
+        write all the recorded phases to the "startup_timings_file" of the init_data if it is provided
+
+        :param phase: Name of the phase, e.g. server_socket_ready
+        :type phase: str
+        """
+        timing = self._startup_timings.mark(phase)
+        if timing is None:
+            return
+
+        logger.info(
+            f"Startup phase {phase} took {timing['duration']:.3f}s "
+            f"({timing['elapsed']:.3f}s since the adaptor start)"
+        )
+        self._get_deadline_telemetry_client().record_event(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.startup_phase",
+            event_details=timing,
+        )
+
+        startup_timings_file = self.init_data.get("startup_timings_file")
+        if startup_timings_file:
+            try:
+                self._startup_timings.save(startup_timings_file)
+            except OSError as e:
+                logger.warning(f"Failed to write startup timings to {startup_timings_file}: {e}")
 
     def _handle_complete(self, match: re.Match) -> None:
         """
@@ -245,18 +670,97 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         :param match: re.Match object from the regex pattern that was matched the message
         :type match: re.Match
         """
+        self._complete_task(self._log_task)
+
+    def _complete_task(self, task_id: int) -> None:
+        """
+        Finish the run of the task, reported either by the log or by the event.
+        Nothing is done if the next task is already running.
+
+        :param task_id: Task the completion belongs to
+        :type task_id: int
+        """
+        with self._task_lock:
+            if task_id != self._task_id or self._task_completed:
+                return
+            self._task_completed = True
+
         self._unreal_is_rendering = False
         self.update_status(progress=100)
+        self._run_finished_event.set()
+
+    @staticmethod
+    def _parse_stats(stats: str) -> dict[str, str]:
+        """
+        Parse the stats written by the UnrealClient as key=value pairs separated by spaces
+
+        :param stats: Stats string, e.g. "frame=3/10 frame_time=1.250 fpm=48.00 eta=8.8"
+        :type stats: str
+
+        :return: Dictionary of the stats values
+        :rtype: dict[str, str]
+        """
+        return dict(pair.split("=", 1) for pair in stats.split() if "=" in pair)
 
     def _handle_progress(self, match: re.Match) -> None:
         """
         Callback for stdout that indicate progress of a render.
+        If the progress is followed by the frame stats, they are reported as the status message,
+        see :meth:`_report_progress`
 
         :param match: re.Match object from the regex pattern that was matched the message
         :type match: re.Match
         """
-        progress = int(float(match.groups()[0]))
-        self.update_status(progress=progress)
+        if not self._is_log_of_current_task or self._task_progress_events:
+            return
+
+        groups = match.groups()
+        stats = self._parse_stats(groups[1]) if len(groups) > 1 and groups[1] else {}
+        self._report_progress(int(float(groups[0])), stats)
+
+    def _report_progress(self, progress: int, stats: dict[str, str]) -> None:
+        """
+        Send the progress and the frame stats as the status message to the worker agent.
+        The progress and status message that were already reported are not sent again
+
+        :param progress: Progress of the task from 0 to 100
+        :type progress: int
+        :param stats: Frame stats, see :meth:`_parse_stats`
+        :type stats: dict[str, str]
+        """
+        status_message = None
+        if "frame" in stats:
+            status_message = f"Rendered frame {stats['frame']}"
+            if "frame_time" in stats:
+                status_message += f", {stats['frame_time']}s per frame"
+            if "fpm" in stats:
+                status_message += f", {stats['fpm']} frames per minute"
+            if "eta" in stats:
+                status_message += f", ETA {stats['eta']}s"
+
+        # Unreal may report the same percentage many times, the worker agent gets it only once
+        if (progress, status_message) == self._reported_progress:
+            return
+        self._reported_progress = (progress, status_message)
+
+        if status_message is None:
+            self.update_status(progress=progress)
+        else:
+            self.update_status(progress=progress, status_message=status_message)
+
+    def _handle_summary(self, match: re.Match) -> None:
+        """
+        Callback for stdout that indicates the summary of a render, e.g. the frame time percentiles
+
+        :param match: re.Match object from the regex pattern that was matched the message
+        :type match: re.Match
+        """
+        summary = self._parse_stats(match.groups()[0])
+        logger.info(f"Render summary: {summary}")
+        self._get_deadline_telemetry_client().record_event(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.render_summary",
+            event_details=summary,
+        )
 
     def _handle_error(self, match: re.Match) -> None:
         """
@@ -267,11 +771,46 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         :raises RuntimeError: Always raises a runtime error to halt the adaptor.
         """
-        self._exc_info = RuntimeError(f"Unreal Encountered an Error: {match.group(0)}")
+        self._fail_task(self._log_task, match.group(0))
+
+    def _fail_task(self, task_id: int, message: str) -> None:
+        """
+        Fail the run of the task with the error reported either by the log or by the event.
+        Nothing is done if the next task is already running.
+
+        :param task_id: Task the error belongs to
+        :type task_id: int
+        :param message: Error message
+        :type message: str
+        """
+        with self._task_lock:
+            if task_id != self._task_id:
+                return
+            self._exc_info = RuntimeError(f"Unreal Encountered an Error: {message}")
+            self._run_finished_event.set()
+
+    def _wait_for_unreal_exit(self) -> None:
+        """
+        Waits for the Unreal client process to exit and notifies the waiting run about it
+        """
+        if self._unreal_client is not None:
+            self._unreal_client.wait()
+        self._run_finished_event.set()
+
+    def _start_unreal_exit_watcher_thread(self) -> None:
+        """
+        Starts the thread that waits for the Unreal client process to exit
+        """
+        self._unreal_exit_watcher_thread = threading.Thread(
+            target=self._wait_for_unreal_exit, name="UnrealAdaptorExitWatcherThread", daemon=True
+        )
+        self._unreal_exit_watcher_thread.start()
 
     def _start_unreal_client(self) -> None:
         """
         Starts the Unreal client by launching UnrealEditor-Cmd with the unreal_client.py file.
+        Sets the environment variable "UNREAL_CLIENT_MAX_RETRY_INTERVAL" if the "max_retry_interval"
+        is provided in the init_data.
 
         UnrealEditor-Cmd must be on the system PATH, for example due to a Rez environment being active.
 
@@ -295,11 +834,41 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         args.extend(log_args)
         args.append(f"-execcmds=r.HLOD 0,py {client_path}")
 
-        regexhandler = RegexHandler(self._get_regex_callbacks())
+        if "max_retry_interval" in self.init_data:
+            os.environ["UNREAL_CLIENT_MAX_RETRY_INTERVAL"] = str(
+                self.init_data["max_retry_interval"]
+            )
+
+        self._log_handler = self._create_log_handler()
+        self._log_policy_handler = UnrealLogPolicyHandler(
+            UnrealLogPolicy.from_init_data(self.init_data.get("log_policy", {})),
+            logging.getLogger(LoggingSubprocess.__module__),
+        )
+        self._activity_watchdog.touch()
         self._unreal_client = UnrealSubprocessWithLogs(
             args=args,
-            stdout_handler=regexhandler,
-            stderr_handler=regexhandler,
+            stdout_handler=self._log_handler,
+            stderr_handler=self._log_handler,
+            log_policy_handler=self._log_policy_handler,
+        )
+        self._start_unreal_exit_watcher_thread()
+
+    def _create_log_handler(self) -> ActivityRegexHandler:
+        """
+        Creates the handler of the Unreal output that matches it against the regex callbacks
+        of all the step handlers until the step handler of the task is set
+
+        :return: Handler of the Unreal stdout and stderr
+        :rtype: ActivityRegexHandler
+        """
+        startup_regex_callbacks = self._get_startup_regex_callbacks()
+        return ActivityRegexHandler(
+            self._get_regex_callbacks(),
+            self._activity_watchdog,
+            step_regex_callbacks={
+                handler_name: self._get_step_regex_callbacks(handler_name) + startup_regex_callbacks
+                for handler_name in self._STEP_HANDLER_NAMES
+            },
         )
 
     def _populate_action_queue(self) -> None:
@@ -339,21 +908,30 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         """
         For job stickiness. Will start everything required for the Task.
 
+        Durations of the startup phases are logged, sent as the telemetry events and written
+        to the "startup_timings_file" of the init_data. The phases after the editor process is
+        spawned are reported by the UnrealClient, see :meth:`_handle_startup_phase`.
+
         :raises:
             jsonschema.ValidationError: When init_data fails validation against the adaptor schema.
             jsonschema.SchemaError: When the adaptor schema itself is nonvalid.
             RuntimeError: If Unreal did not complete initialization actions due to an exception
             TimeoutError: If Unreal did not complete initialization actions due to timing out.
+            UnrealStalledError: If Unreal did not output anything longer than the startup stall timeout.
             FileNotFoundError: If the unreal_client.py file could not be found.
         """
 
+        self._startup_timings.start()
+
         self.data_validation.validate_init_data(self.init_data)
+        self._mark_startup_phase("init_data_validated")
 
         # Notify worker agent about starting Unreal
         self.update_status(progress=0, status_message="Initializing Unreal Engine")
 
         # Starts the unreal adaptor server
         self._start_unreal_server_thread()
+        self._mark_startup_phase("server_socket_ready")
 
         self._populate_action_queue()
 
@@ -376,12 +954,18 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
         add_module_to_pythonpath(os.path.dirname(os.path.dirname(deadline.unreal_adaptor.__file__)))
 
         self._start_unreal_client()
+        self._mark_startup_phase("editor_process_spawned")
 
         self._wait_for_unreal_started()
 
     def on_run(self, run_data: dict) -> None:
         """
-        This starts a render in Unreal for the given frame and performs a busy wait until the render completes.
+        This starts a render in Unreal for the given frame and waits until the render completes,
+        fails or Unreal exits. Unreal is terminated if it does not output anything longer than
+        the render stall timeout.
+
+        In the daemon mode the same Unreal session is reused by the tasks of the step,
+        so each run sets up its own step handler.
 
         :param run_data: Dictionary containing Run Data
         :type run_data: dict
@@ -391,23 +975,37 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
 
         self.data_validation.validate_run_data(run_data)
 
-        # Set up the step handler
+        # Error of the previous task run in the same session should not fail this one
+        self._reported_progress = None
+        with self._task_lock:
+            self._exc_info = None
+            self._run_finished_event.clear()
+            self._task_id += 1
+            self._task_completed = False
+            self._task_progress_events = False
+
+        # Set up the step handler and match only its output
+        handler_name = run_data.get("handler", "base")
+        if self._log_handler is not None:
+            self._log_handler.set_step_handler(handler_name)
         self._action_queue.enqueue_action(
-            Action("set_handler", {"handler": run_data.get("handler", "base")})
+            Action("set_handler", {"handler": handler_name, "task_id": self._task_id})
         )
 
         self._unreal_is_rendering = True
+        # Unreal may be idle between the tasks of the reused session, start the stall timer over
+        self._activity_watchdog.touch()
         self._action_queue.enqueue_action(Action("run_script", run_data))
 
         while self._unreal_is_rendering and not self._has_exception:
-            time.sleep(1)
-            # Wait for:
-            #   1. set_handler to be executed
-            #   2. run_script to be executed (launch render process in separate thread by UE API)
-            # by UnrealClient and don't spam before
-            if len(self._action_queue) == 0:
-                logger.info("Enqueue wait result")
-                self._action_queue.enqueue_action(Action("wait_result", {}))
+            if self._run_finished_event.wait(timeout=self._WAIT_RESULT_INTERVAL_SECONDS):
+                self._run_finished_event.clear()
+                continue
+
+            # UnrealClient requests the next action on a background thread, so the request held
+            # by the server until the next task doesn't block the game thread and the queue
+            # doesn't need to be fed while the render is in progress
+            self._check_unreal_stalled("render")
 
         if (
             not self._unreal_is_running and self._unreal_client
@@ -451,6 +1049,22 @@ class UnrealAdaptor(Adaptor[AdaptorConfiguration]):
             )
             self._unreal_client.terminate(0)
 
+        if self._log_handler is not None:
+            logger.info(f"Unreal output matching: {self._log_handler.stats}")
+            self._get_deadline_telemetry_client().record_event(
+                event_type="com.amazon.rum.deadline.adaptor.runtime.log_matching",
+                event_details=asdict(self._log_handler.stats),
+            )
+
+        if self._log_policy_handler is not None:
+            # The output still read after this is logged without the policy
+            self._log_policy_handler.close()
+            logger.info(f"Unreal log policy: {self._log_policy_handler.stats}")
+            self._get_deadline_telemetry_client().record_event(
+                event_type="com.amazon.rum.deadline.adaptor.runtime.log_policy",
+                event_details=asdict(self._log_policy_handler.stats),
+            )
+
         # Terminate AdaptorServer instance
         if self._server:
             self._server.shutdown()
@@ -1,7 +1,14 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 import os
+import json
+import time
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
 
+import psutil
 from openjd.adaptor_runtime.adaptors import AdaptorDataValidators
 
 
@@ -50,3 +57,183 @@ class DataValidation:
         """
 
         self.validators.run_data.validate(run_data)
+
+
+class StartupTimings:
+    """
+    Durations of the adaptor startup phases, measured from the adaptor start.
+    Each phase is recorded once, so the phases reported again by the reused session are ignored.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._start_time = time.monotonic()
+        self._last_time = self._start_time
+        self.phases: list[dict] = []
+
+    def start(self):
+        """Start measuring the phases from now"""
+        with self._lock:
+            self._start_time = time.monotonic()
+            self._last_time = self._start_time
+            self.phases = []
+
+    def mark(self, phase: str) -> Optional[dict]:
+        """
+        Record the end of the given phase
+
+        :param phase: Name of the phase, e.g. server_socket_ready
+        :type phase: str
+
+        :return: Dictionary with the phase name, its duration and the time elapsed since the start
+                 in seconds, None if the phase was already recorded
+        :rtype: Optional[dict]
+        """
+        now = time.monotonic()
+        with self._lock:
+            if any(recorded_phase["name"] == phase for recorded_phase in self.phases):
+                return None
+
+            timing = {
+                "name": phase,
+                "duration": round(now - self._last_time, 3),
+                "elapsed": round(now - self._start_time, 3),
+            }
+            self._last_time = now
+            self.phases.append(timing)
+            return timing
+
+    def has_phase(self, phase: str) -> bool:
+        """
+        Check if the given phase is recorded
+
+        :param phase: Name of the phase, e.g. first_client_poll
+        :type phase: str
+
+        :return: True if the phase is recorded
+        :rtype: bool
+        """
+        with self._lock:
+            return any(recorded_phase["name"] == phase for recorded_phase in self.phases)
+
+    def save(self, file_path: str):
+        """
+        Write the recorded phases to the JSON file
+
+        :param file_path: Path of the JSON file
+        :type file_path: str
+        """
+        with self._lock:
+            timings = {"phases": list(self.phases)}
+
+        tmp_file_path = f"{file_path}.tmp"
+        with open(tmp_file_path, "w") as f:
+            json.dump(timings, f, indent=2)
+        os.replace(tmp_file_path, file_path)
+
+
+@dataclass
+class LogMatchingStats:
+    """Counters of the work done to match the Unreal output lines against the regex callbacks"""
+
+    #: Output lines handled
+    lines: int = 0
+    #: Lines that contained one of the regex markers, so the regex patterns were evaluated for them
+    candidate_lines: int = 0
+    #: Evaluations of the regex patterns
+    regex_evaluations: int = 0
+    #: Lines matched by the regex callbacks
+    matches: int = 0
+
+
+class ActivityWatchdog:
+    """
+    Tracks the time since the last line of the Unreal output and keeps the last lines
+    to report them if Unreal stalls
+    """
+
+    def __init__(self, max_lines: int = 50):
+        """
+        :param max_lines: Number of the last output lines to keep
+        :type max_lines: int
+        """
+        self._lock = threading.Lock()
+        self._last_activity_time = time.monotonic()
+        self._last_lines: deque[str] = deque(maxlen=max_lines)
+
+    def touch(self, line: Optional[str] = None):
+        """
+        Record the activity of Unreal
+
+        :param line: Output line of Unreal, None to only restart the stall timer
+        :type line: str, optional
+        """
+        with self._lock:
+            self._last_activity_time = time.monotonic()
+            if line is not None:
+                self._last_lines.append(line)
+
+    @property
+    def seconds_since_activity(self) -> float:
+        """Seconds since the last activity of Unreal"""
+        with self._lock:
+            return time.monotonic() - self._last_activity_time
+
+    @property
+    def last_lines(self) -> list[str]:
+        """Last output lines of Unreal, the oldest first"""
+        with self._lock:
+            return list(self._last_lines)
+
+    def is_stalled(self, stall_timeout: float) -> bool:
+        """
+        Check if there was no activity longer than the given timeout
+
+        :param stall_timeout: Stall timeout in seconds
+        :type stall_timeout: float
+
+        :return: True if Unreal is stalled
+        :rtype: bool
+        """
+        return self.seconds_since_activity > stall_timeout
+
+
+def get_process_snapshot(pid: int) -> dict:
+    """
+    Returns the CPU usage and memory of the given process and its children,
+    e.g. ShaderCompileWorker processes of the Unreal Editor.
+    The "error" is returned instead of the stats if the process is not found or not accessible.
+
+    :param pid: Process id
+    :type pid: int
+
+    :return: Dictionary with the process stats
+    :rtype: dict
+    """
+    snapshot: dict = {"pid": pid}
+    try:
+        process = psutil.Process(pid)
+        with process.oneshot():
+            snapshot["status"] = process.status()
+            snapshot["rss"] = process.memory_info().rss
+            snapshot["num_threads"] = process.num_threads()
+        snapshot["cpu_percent"] = process.cpu_percent(interval=0.5)
+
+        children = []
+        for child in process.children(recursive=True):
+            try:
+                children.append(
+                    {
+                        "pid": child.pid,
+                        "name": child.name(),
+                        "status": child.status(),
+                        "rss": child.memory_info().rss,
+                    }
+                )
+            except psutil.Error:
+                continue
+        snapshot["children"] = children
+    except psutil.Error as e:
+        snapshot["error"] = str(e)
+
+    return snapshot
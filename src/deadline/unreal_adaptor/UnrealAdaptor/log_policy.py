@@ -0,0 +1,255 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Policy of the Unreal output that goes to the task log.
+
+Unreal started with "-stdout" outputs thousands of lines of the categories like LogShaderCompilers
+and LogStreaming. :class:`UnrealLogPolicyHandler` forwards to the task log only the lines of
+the configured verbosity, collapses the repeated lines and periodically logs how many lines were
+suppressed. Every line is still written to the compressed full log, the "full_log_file" of
+the policy. The default step template writes it to the session directory, otherwise it is written
+to the temp directory, where the full logs older than a week are removed.
+
+The policy only applies to the task log, the Adaptor matches the progress, completion and errors
+against the complete Unreal output.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import glob
+import gzip
+import time
+import logging
+import tempfile
+from dataclasses import dataclass, field
+from typing import IO, Optional
+
+try:
+    from openjd.adaptor_runtime.process._logging import (
+        _STDERR_LEVEL as STDERR_LEVEL,
+        _STDOUT_LEVEL as STDOUT_LEVEL,
+    )
+except ImportError:  # The levels are not public, openjd-adaptor-runtime 0.7 and 0.8 use these
+    STDOUT_LEVEL = logging.ERROR + 1
+    STDERR_LEVEL = logging.ERROR + 2
+
+
+#: Age in seconds of the full logs in the temp directory that are removed
+TEMP_FULL_LOG_MAX_AGE = 7 * 24 * 60 * 60
+
+#: Unreal log verbosities, the most severe first
+UNREAL_VERBOSITIES = ["Fatal", "Error", "Warning", "Display", "Log", "Verbose", "VeryVerbose"]
+
+# "[2024.05.01-10.11.12:123][  0]LogStreaming: Display: Message", the time prefix is optional and
+# the lines without the verbosity are of the Log verbosity
+_UNREAL_LOG_LINE_REGEX = re.compile(
+    r"^(?P<prefix>\[[^\]]*\]\[[^\]]*\])?(?P<category>\w+): "
+    rf"(?:(?P<verbosity>{'|'.join(UNREAL_VERBOSITIES)}): )?"
+)
+
+
+@dataclass
+class UnrealLogPolicy:
+    """Which Unreal output lines go to the task log"""
+
+    #: Minimum verbosity of the lines of each log category, e.g. {"LogStreaming": "Warning"}.
+    #: Lines of the categories that are not listed are not filtered
+    category_verbosity: dict[str, str] = field(
+        default_factory=lambda: {"LogShaderCompilers": "Warning", "LogStreaming": "Warning"}
+    )
+    #: Log the repeated line once followed by the number of its repeats
+    collapse_repeats: bool = True
+    #: Seconds between the summaries of the suppressed lines
+    summary_interval: float = 60
+    #: Path of the gzip compressed full log, empty to not write the full log.
+    #: None to write it to the temp directory, see :meth:`get_full_log_file`
+    full_log_file: Optional[str] = None
+
+    @classmethod
+    def from_init_data(cls, log_policy: dict) -> UnrealLogPolicy:
+        """
+        Create the policy from the "log_policy" of the init_data, see init_data.schema.json
+
+        :param log_policy: Values of the policy that override the defaults
+        :type log_policy: dict
+
+        :return: Log policy
+        :rtype: UnrealLogPolicy
+        """
+        return cls(**log_policy)
+
+    def get_full_log_file(self) -> str:
+        """
+        Get the path of the full log file. If the full log is written to the temp directory,
+        the full logs of the previous sessions older than :data:`TEMP_FULL_LOG_MAX_AGE` are removed.
+
+        :return: Path of the full log, empty if the full log is not written
+        :rtype: str
+        """
+        if self.full_log_file is not None:
+            return self.full_log_file
+
+        temp_dir = tempfile.gettempdir()
+        remove_before = time.time() - TEMP_FULL_LOG_MAX_AGE
+        for old_full_log_file in glob.glob(os.path.join(temp_dir, "UnrealEditor-*.log.gz")):
+            try:
+                if os.path.getmtime(old_full_log_file) < remove_before:
+                    os.remove(old_full_log_file)
+            except OSError:
+                pass
+
+        return os.path.join(
+            temp_dir,
+            f"UnrealEditor-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}.log.gz",
+        )
+
+
+@dataclass
+class LogPolicyStats:
+    """Counters of the Unreal output lines handled by the log policy"""
+
+    #: Output lines of Unreal
+    lines: int = 0
+    #: Lines forwarded to the task log
+    forwarded_lines: int = 0
+    #: Lines suppressed by the verbosity of their category
+    suppressed_lines: int = 0
+    #: Repeated lines collapsed
+    collapsed_lines: int = 0
+
+
+class UnrealLogPolicyHandler(logging.Handler):
+    """
+    Handler of the Unreal output that forwards the lines allowed by the policy to the target logger
+    and writes all of them to the full log. Pass its :attr:`logger` to the LoggingSubprocess of Unreal.
+    """
+
+    def __init__(self, policy: UnrealLogPolicy, target: logging.Logger):
+        """
+        :param policy: Policy of the lines that are forwarded
+        :type policy: UnrealLogPolicy
+        :param target: Logger of the task log
+        :type target: logging.Logger
+        """
+        super().__init__()
+        self.policy = policy
+        self.target = target
+        self.stats = LogPolicyStats()
+        self.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+
+        # The logger is not registered, so the output reaches the task log only through the handler
+        self.logger = logging.Logger(f"{target.name}.UnrealEditor")
+        self.logger.propagate = False
+        self.logger.addHandler(self)
+
+        self._min_verbosity = {
+            category: UNREAL_VERBOSITIES.index(verbosity)
+            for category, verbosity in policy.category_verbosity.items()
+        }
+        self._suppressed_categories: dict[str, int] = {}
+        self._last_summary_time = time.monotonic()
+        self._last_line: Optional[str] = None
+        self._repeats = 0
+        self._closed = False
+
+        self.full_log_file = policy.get_full_log_file()
+        self._full_log: Optional[IO[str]] = None
+        if self.full_log_file:
+            try:
+                self._full_log = gzip.open(
+                    self.full_log_file, "wt", encoding="utf-8", compresslevel=6
+                )
+                self.target.info(f"Full Unreal log is written to {self.full_log_file}")
+            except OSError as e:
+                self.target.warning(f"Could not open the full Unreal log {self.full_log_file}: {e}")
+                self.full_log_file = ""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._closed:
+            self._forward(record)
+            return
+
+        if self._full_log is not None:
+            try:
+                self._full_log.write(f"{self.format(record)}\n")
+            except OSError:
+                self.handleError(record)
+
+        if record.levelno not in (STDOUT_LEVEL, STDERR_LEVEL):
+            self._forward(record)
+            return
+
+        self.stats.lines += 1
+        message = str(record.msg)
+        match = _UNREAL_LOG_LINE_REGEX.match(message)
+
+        if match is not None and self._is_suppressed(match):
+            self.stats.suppressed_lines += 1
+            category = match.group("category")
+            self._suppressed_categories[category] = self._suppressed_categories.get(category, 0) + 1
+        else:
+            # The repeated lines differ only by the time prefix
+            line = (
+                message[match.end("prefix") :]
+                if match is not None and match.group("prefix")
+                else message
+            )
+            if self.policy.collapse_repeats and line == self._last_line:
+                self.stats.collapsed_lines += 1
+                self._repeats += 1
+            else:
+                self._flush_repeats()
+                self._last_line = line
+                self.stats.forwarded_lines += 1
+                self._forward(record)
+
+        if time.monotonic() - self._last_summary_time >= self.policy.summary_interval:
+            self._log_summary()
+
+    def close(self) -> None:
+        """Log the pending repeats and the summary and close the full log"""
+        self.acquire()
+        try:
+            if not self._closed:
+                self._closed = True
+                self._log_summary()
+                if self._full_log is not None:
+                    self._full_log.close()
+                    self._full_log = None
+        finally:
+            self.release()
+        super().close()
+
+    def _is_suppressed(self, match: re.Match) -> bool:
+        min_verbosity = self._min_verbosity.get(match.group("category"))
+        if min_verbosity is None:
+            return False
+        return UNREAL_VERBOSITIES.index(match.group("verbosity") or "Log") > min_verbosity
+
+    def _forward(self, record: logging.LogRecord) -> None:
+        if self.target.isEnabledFor(record.levelno):
+            self.target.handle(record)
+
+    def _flush_repeats(self) -> None:
+        if self._repeats:
+            self.target.info(f"Unreal log policy: last line repeated {self._repeats} more times")
+            self._repeats = 0
+
+    def _log_summary(self) -> None:
+        self._flush_repeats()
+        self._last_summary_time = time.monotonic()
+        if self._suppressed_categories:
+            categories = ", ".join(
+                f"{category}: {count}" for category, count in self._suppressed_categories.items()
+            )
+            full_log = f", full log: {self.full_log_file}" if self.full_log_file else ""
+            self.target.info(
+                f"Unreal log policy: suppressed {sum(self._suppressed_categories.values())} "
+                f"lines ({categories}){full_log}"
+            )
+            self._suppressed_categories = {}
+        if self._full_log is not None:
+            # Keep the full log readable up to this point if the adaptor doesn't close it
+            self._full_log.flush()
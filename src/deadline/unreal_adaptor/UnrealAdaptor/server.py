@@ -0,0 +1,90 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+import json
+from http import HTTPStatus
+from importlib.metadata import PackageNotFoundError, version
+from socketserver import ThreadingMixIn
+
+from openjd.adaptor_runtime.application_ipc import AdaptorServer
+
+from ..UnrealClient.events import EVENT_PATH
+
+#: Versions of openjd-adaptor-runtime the event endpoint is checked against. The endpoint relies on
+#: its internals: the request handler routes the requests to the subclasses of
+#: AdaptorResourceRequestHandler and supports PUT. The Adaptor matches the log with other versions.
+CLIENT_EVENTS_RUNTIME_VERSIONS = ("0.7.0", "0.7.2", "0.8.0", "0.8.1", "0.8.2")
+
+#: True if the adaptor server receives the events of the UnrealClient
+CLIENT_EVENTS_SUPPORTED = False
+#: Why the adaptor server doesn't receive the events of the UnrealClient
+CLIENT_EVENTS_UNAVAILABLE_REASON = ""
+
+try:
+    _runtime_version = version("openjd-adaptor-runtime")
+except PackageNotFoundError:
+    _runtime_version = "unknown"
+
+if os.name != "posix":
+    CLIENT_EVENTS_UNAVAILABLE_REASON = "the named pipe server on Windows doesn't route the events"
+elif _runtime_version not in CLIENT_EVENTS_RUNTIME_VERSIONS:
+    CLIENT_EVENTS_UNAVAILABLE_REASON = (
+        f"openjd-adaptor-runtime {_runtime_version} is not checked to route the events, "
+        f"checked versions: {', '.join(CLIENT_EVENTS_RUNTIME_VERSIONS)}"
+    )
+else:
+    try:
+        from openjd.adaptor_runtime._http import HTTPResponse
+        from openjd.adaptor_runtime._http.request_handler import RequestHandler
+        from openjd.adaptor_runtime.application_ipc._http_request_handler import (
+            AdaptorResourceRequestHandler,
+        )
+
+        CLIENT_EVENTS_SUPPORTED = hasattr(RequestHandler, "do_PUT")
+        if not CLIENT_EVENTS_SUPPORTED:
+            CLIENT_EVENTS_UNAVAILABLE_REASON = "the adaptor server doesn't support PUT requests"
+    except ImportError as e:
+        CLIENT_EVENTS_UNAVAILABLE_REASON = str(e)
+
+if CLIENT_EVENTS_SUPPORTED:
+
+    class ClientEventEndpoint(AdaptorResourceRequestHandler):
+        """
+        Endpoint of the adaptor server that receives the events of the UnrealClient,
+        see :mod:`deadline.unreal_adaptor.UnrealClient.events`
+        """
+
+        path = EVENT_PATH
+
+        def put(self) -> HTTPResponse:
+            """
+            PUT handler that passes the event from the "event" query string parameter
+            to the handle_client_event() of the Adaptor
+
+            :return: Response to send to the UnrealClient
+            :rtype: HTTPResponse
+            """
+            handle_client_event = getattr(self.server.adaptor, "handle_client_event", None)
+            if handle_client_event is None:
+                return HTTPResponse(HTTPStatus.NOT_IMPLEMENTED)
+
+            try:
+                event = json.loads(self.query_string_params["event"][0])
+            except (KeyError, IndexError, ValueError) as e:
+                return HTTPResponse(HTTPStatus.BAD_REQUEST, f"Invalid event: {e}")
+
+            handle_client_event(event)
+            return HTTPResponse(HTTPStatus.OK)
+
+    class UnrealAdaptorServer(ThreadingMixIn, AdaptorServer):
+        """
+        AdaptorServer that handles each request in its own thread. The action request of
+        the UnrealClient is held until the next action is available, so the events of the
+        UnrealClient would wait for it on the single threaded server.
+        """
+
+        daemon_threads = True
+
+else:
+    # The Adaptor matches the Unreal log instead of the events
+    UnrealAdaptorServer = AdaptorServer  # type: ignore
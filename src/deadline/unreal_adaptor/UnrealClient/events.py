@@ -0,0 +1,55 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Events that the UnrealClient and the step handlers send to the UnrealAdaptor over the adaptor socket.
+
+The events reach the Adaptor as soon as they are sent, unlike the log lines that go through
+the Unreal log and the stdout buffers. The step handlers still log the same progress, completion
+and errors, so the Adaptor falls back to matching the log if the event channel is not open
+(e.g. on Windows, where the named pipe server doesn't route the events).
+"""
+
+from typing import Any, Callable, Optional
+
+
+#: Path of the adaptor server endpoint the events are sent to
+EVENT_PATH = "/event"
+
+#: Sent once by the UnrealClient, the Adaptor stops using the log for progress and completion
+EVENT_CHANNEL_OPEN = "channel_open"
+#: Progress of the task, "progress" from 0 to 100
+EVENT_PROGRESS = "progress"
+#: Progress of the task after the frame is rendered, "stats" are the frame stats as key=value pairs
+EVENT_FRAME_DONE = "frame_done"
+#: Task is complete
+EVENT_COMPLETE = "complete"
+#: Task failed, "message" and optional "details", e.g. the traceback
+EVENT_ERROR = "error"
+
+
+_event_sender: Optional[Callable[[dict], None]] = None
+
+
+def set_event_sender(event_sender: Optional[Callable[[dict], None]]) -> None:
+    """
+    Set the function that sends the events to the Adaptor, None to stop sending the events
+
+    :param event_sender: Function that takes the event dictionary
+    """
+    global _event_sender
+    _event_sender = event_sender
+
+
+def send_event(event_type: str, **details: Any) -> bool:
+    """
+    Send the event to the Adaptor if the event channel is open
+
+    :param event_type: Type of the event, e.g. EVENT_PROGRESS
+    :param details: JSON serializable details of the event
+
+    :return: True if the event was sent, False if the event channel is not open
+    """
+    if _event_sender is None:
+        return False
+    _event_sender({"type": event_type, **details})
+    return True
@@ -49,3 +49,20 @@ class BaseStepHandler(ABC):
     def regex_pattern_error() -> list[re.Pattern]:
         """Returns a list of regex Patterns that match the errors messages"""
         raise NotImplementedError("Abstract method, need to be implemented")
+
+    @staticmethod
+    def regex_pattern_summary() -> list[re.Pattern]:
+        """
+        Returns a list of regex Patterns that match the summary messages written at completion,
+        the first group should contain the summary as key=value pairs
+        """
+        return []
+
+    @staticmethod
+    def regex_markers() -> list[str]:
+        """
+        Returns a list of substrings, one of which is contained in every message matched by
+        the handler's regex Patterns. The Adaptor doesn't evaluate the Patterns for the messages
+        without any of them. Empty list means that the Patterns are evaluated for every message.
+        """
+        return []
@@ -10,6 +10,7 @@ from typing import Optional
 from types import ModuleType
 
 from .base_step_handler import BaseStepHandler
+from ..events import EVENT_COMPLETE, EVENT_ERROR, send_event
 
 
 class UnrealCustomStepHandler(BaseStepHandler):
@@ -25,6 +26,10 @@ class UnrealCustomStepHandler(BaseStepHandler):
     def regex_pattern_error() -> list[re.Pattern]:
         return [re.compile(".*Exception:.*|.*Custom Step Executor: Error:.*")]
 
+    @staticmethod
+    def regex_markers() -> list[str]:
+        return ["Custom Step Executor:", "Exception:"]
+
     @staticmethod
     def validate_script(script_path: str) -> ModuleType:
         """
@@ -39,7 +44,14 @@ class UnrealCustomStepHandler(BaseStepHandler):
         if not _script_path.exists() or not _script_path.is_file():
             raise FileNotFoundError(f"Script {script_path} does not exist or it is not a file")
 
-        sys.path.append(str(_script_path.parent))
+        # Unreal session can be reused by the tasks of the step, so make sure the given script
+        # is imported from its own directory and executed again instead of the cached module
+        script_directory = str(_script_path.parent)
+        if script_directory in sys.path:
+            sys.path.remove(script_directory)
+        sys.path.insert(0, script_directory)
+        sys.modules.pop(_script_path.stem, None)
+        importlib.invalidate_caches()
         script_module = importlib.import_module(_script_path.stem)
 
         has_main_method = False
@@ -68,13 +80,13 @@ class UnrealCustomStepHandler(BaseStepHandler):
             script_module = UnrealCustomStepHandler.validate_script(script_path=args["script_path"])
             script_args = args.get("script_args", {})
             result = script_module.main(**script_args)
+            send_event(EVENT_COMPLETE, result=str(result))
             unreal.log(f"Custom Step Executor: Complete: {result}")
             return True
         except Exception as e:
-            unreal.log(
-                f"Custom Step Executor: Error: "
-                f'Error occured while executing the given script {args.get("script_path")}: {str(e)}\n'
-            )
+            message = f'Error occured while executing the given script {args.get("script_path")}: {str(e)}'
+            send_event(EVENT_ERROR, message=message, details=traceback.format_exc())
+            unreal.log(f"Custom Step Executor: Error: {message}\n")
             unreal.log(traceback.format_exc())
             return False
 
@@ -1,7 +1,9 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 import re
+import time
 from pathlib import Path
+from collections import deque
 
 try:
     import unreal
@@ -14,6 +16,184 @@ except Exception:
 from typing import Optional
 
 from .base_step_handler import BaseStepHandler
+from ..events import EVENT_COMPLETE, EVENT_ERROR, EVENT_FRAME_DONE, EVENT_PROGRESS, send_event
+
+
+class RenderFrameTimings:
+    """
+    Wall time of the rendered frames, measured between the beginnings of the consecutive frames.
+    The last frame is measured until the end of the render, see :meth:`end_frame`.
+    Provides the rolling frames per minute over the last minute, ETA and the frame time percentiles.
+    """
+
+    ROLLING_WINDOW_SECONDS = 60.0
+
+    def __init__(self, total_frames: int = 0):
+        self.reset(total_frames)
+
+    def reset(self, total_frames: int = 0):
+        """
+        Start measuring the new render
+
+        :param total_frames: Number of the frames to render, 0 if unknown
+        """
+        self.total_frames = total_frames
+        self.frame_times: list[float] = []
+        self._last_frame_start: Optional[float] = None
+        # (frame end time, frame time) of the frames rendered in the rolling window
+        self._recent_frames: deque[tuple[float, float]] = deque()
+
+    def begin_frame(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Record the beginning of the next frame, so the end of the previous one
+
+        :param now: Current monotonic time in seconds
+        :return: Wall time of the previous frame in seconds, None if it is the first frame
+        """
+        now = time.monotonic() if now is None else now
+        frame_time = self.end_frame(now)
+        self._last_frame_start = now
+        return frame_time
+
+    def end_frame(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Record the end of the running frame, e.g. the last frame when the render is finished
+
+        :param now: Current monotonic time in seconds
+        :return: Wall time of the frame in seconds, None if no frame is running
+        """
+        if self._last_frame_start is None:
+            return None
+        now = time.monotonic() if now is None else now
+        frame_time = now - self._last_frame_start
+        self._last_frame_start = None
+        self.frame_times.append(frame_time)
+        self._recent_frames.append((now, frame_time))
+        while now - self._recent_frames[0][0] > self.ROLLING_WINDOW_SECONDS:
+            self._recent_frames.popleft()
+        return frame_time
+
+    @property
+    def frames_per_minute(self) -> float:
+        """Frames rendered per minute over the rolling window"""
+        recent_time = sum(frame_time for _, frame_time in self._recent_frames)
+        if recent_time <= 0:
+            return 0.0
+        return len(self._recent_frames) * 60 / recent_time
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Estimated time in seconds to render the remaining frames, None if it is unknown"""
+        frames_per_minute = self.frames_per_minute
+        if not self.total_frames or not frames_per_minute:
+            return None
+        remaining_frames = max(self.total_frames - len(self.frame_times), 0)
+        return remaining_frames * 60 / frames_per_minute
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns the frame time percentile using the nearest-rank method
+
+        :param percent: Percentile from 0 to 100, e.g. 95
+        :return: Frame time in seconds, 0 if no frames were rendered
+        """
+        if not self.frame_times:
+            return 0.0
+        sorted_frame_times = sorted(self.frame_times)
+        rank = max(int(-(-percent * len(sorted_frame_times) // 100)), 1)
+        return sorted_frame_times[rank - 1]
+
+    def format_stats(self) -> str:
+        """Returns the stats of the last rendered frame as key=value pairs"""
+        frame_time = self.frame_times[-1] if self.frame_times else 0.0
+        stats = (
+            f"frame={len(self.frame_times)}/{self.total_frames} "
+            f"frame_time={frame_time:.3f} fpm={self.frames_per_minute:.2f}"
+        )
+        eta = self.eta
+        if eta is not None:
+            stats += f" eta={eta:.1f}"
+        return stats
+
+    def format_summary(self) -> str:
+        """Returns the summary of all the rendered frames as key=value pairs"""
+        total_time = sum(self.frame_times)
+        mean = total_time / len(self.frame_times) if self.frame_times else 0.0
+        return (
+            f"frames={len(self.frame_times)} total={total_time:.3f} mean={mean:.3f} "
+            f"p50={self.percentile(50):.3f} p95={self.percentile(95):.3f} "
+            f"max={max(self.frame_times, default=0.0):.3f}"
+        )
+
+
+class RenderProgressTracker:
+    """
+    Render progress based on the Movie Render Queue pipeline state.
+
+    MRQ reports the output frame index over all the shots and the completion percentage that
+    accounts for the warm-up frames, temporal and spatial samples. If the pipeline state
+    is not available, progress is estimated from the engine ticks over the frame range.
+    Progress is always clamped to 0-100.
+    """
+
+    def __init__(self, fallback_total_frames: int = 0):
+        self.reset(fallback_total_frames)
+
+    def reset(self, fallback_total_frames: int = 0):
+        """
+        Start tracking the new render
+
+        :param fallback_total_frames: Number of the frames to estimate the progress from the ticks
+        """
+        self.fallback_total_frames = fallback_total_frames
+        self.ticks = 0
+        #: Index of the current output frame over all the shots, -1 until it is known
+        self.output_frame = -1
+        #: Number of the output frames of all the shots, 0 until it is known
+        self.total_output_frames = 0
+        self.progress = 0.0
+        #: Movie pipeline that renders the job, found on the first ticks of the render
+        self.movie_pipeline = None
+
+    def update(
+        self,
+        output_frames: Optional[tuple[int, int]] = None,
+        completion: Optional[float] = None,
+    ) -> bool:
+        """
+        Update the progress on the engine tick with the pipeline state
+
+        :param output_frames: Current output frame index and the total number of the output frames,
+            None if the pipeline state is not available
+        :param completion: Completion of the pipeline from 0 to 1, None if it is not available
+        :return: True if the new output frame began, so the previous one (if any) was rendered
+        """
+        self.ticks += 1
+
+        output_frame_began = False
+        if output_frames is not None:
+            current_frame, total_frames = output_frames
+            output_frame_began = current_frame > self.output_frame
+            self.output_frame = current_frame
+            self.total_output_frames = total_frames
+
+        if completion is not None:
+            progress = completion * 100
+        elif self.total_output_frames > 0:
+            progress = self.output_frame / self.total_output_frames * 100
+        elif self.fallback_total_frames > 0:
+            progress = self.ticks / self.fallback_total_frames * 100
+        else:
+            progress = 0.0
+
+        # MRQ keeps ticking after the last frame to finish the outputs, so never go above 100
+        self.progress = min(max(progress, 0.0), 100.0)
+        return output_frame_began
+
+    @property
+    def uses_output_frames(self) -> bool:
+        """True if the progress is based on the MRQ output frames, not on the engine ticks"""
+        return self.total_output_frames > 0
 
 
 if unreal:
@@ -23,6 +203,10 @@ if unreal:
         totalFrameRange = unreal.uproperty(int)  # Total frame range of the job's level sequence
         currentFrame = unreal.uproperty(int)  # Current frame handler that will be updating later
 
+        # Frame timings and progress of the current render, only one render is executed at a time
+        frame_timings = RenderFrameTimings()
+        render_progress = RenderProgressTracker()
+
         def _post_init(self):
             """
             Constructor that gets called when created either via C++ or Python
@@ -83,35 +267,91 @@ if unreal:
                     "Render Executor: Error: Cannot render the Queue with frame range of zero length"
                 )
 
+            self.frame_timings.reset(self.totalFrameRange)
+            self.render_progress.reset(self.totalFrameRange)
+
             # don't forget to call parent's execute to run the render process
             super().execute(queue)
 
+        def _find_movie_pipeline(self):
+            """
+            Returns the movie pipeline that is rendering the job, None if it is not found
+            """
+            if self.render_progress.movie_pipeline is not None:
+                return self.render_progress.movie_pipeline
+
+            try:
+                for movie_pipeline in unreal.ObjectIterator(unreal.MoviePipeline):
+                    state = unreal.MoviePipelineLibrary.get_pipeline_state(movie_pipeline)
+                    if state == unreal.MovieRenderPipelineState.PRODUCING_FRAMES:
+                        self.render_progress.movie_pipeline = movie_pipeline
+                        break
+            except Exception as e:
+                unreal.log_warning(f"Render Executor: Can't find the movie pipeline: {e}")
+
+            return self.render_progress.movie_pipeline
+
+        def _get_pipeline_progress(self) -> tuple[Optional[tuple[int, int]], Optional[float]]:
+            """
+            Returns the output frames (current index, total) and the completion (from 0 to 1)
+            of the movie pipeline, (None, None) if the pipeline state is not available
+            """
+            movie_pipeline = self._find_movie_pipeline()
+            if movie_pipeline is None:
+                return None, None
+
+            try:
+                current_frame, total_frames = unreal.MoviePipelineLibrary.get_overall_output_frames(
+                    movie_pipeline
+                )
+                completion = unreal.MoviePipelineLibrary.get_completion_percentage(movie_pipeline)
+            except Exception as e:
+                unreal.log_warning(f"Render Executor: Can't get the movie pipeline progress: {e}")
+                return None, None
+
+            return (current_frame, total_frames), completion
+
         @unreal.ufunction(override=True)
         def on_begin_frame(self):
             """
             Called once at the beginning of each engine frame (e.g. tick, fps)
             Since the executor will work with Play in Editor widget, each rendered frame will match with widget frame tick.
+            Progress and frame stats are reported from the MRQ pipeline state when it is available,
+            see :class:`RenderProgressTracker`
             """
 
             super(RemoteRenderMoviePipelineEditorExecutor, self).on_begin_frame()
 
             # Since PIEExecutor launching Play in Editor before mrq is rendering, we should ensure, that
             # executor actually rendering the sequence.
-            if self.is_rendering():
-                self.currentFrame += 1
-                progress = self.currentFrame / self.totalFrameRange * 100
+            if not self.is_rendering():
+                return
 
-                # Executor work with the render queue after all frames are rendered - do all
-                # support stuff, handle safe quit, etc, so we should ignore progress that more than 100.
-                # TODO refactor if possible, check shot/job finished callbacks
-                if progress <= 100:
-                    unreal.log(f"Render Executor: Progress: {progress}")
+            self.currentFrame += 1
+            previous_progress = self.render_progress.progress
+            output_frames, completion = self._get_pipeline_progress()
+            output_frame_began = self.render_progress.update(output_frames, completion)
+
+            # Time the output frames if they are known, the engine ticks otherwise
+            if self.render_progress.uses_output_frames:
+                self.frame_timings.total_frames = self.render_progress.total_output_frames
+            else:
+                output_frame_began = True
+
+            if output_frame_began and self.frame_timings.begin_frame() is not None:
+                stats = self.frame_timings.format_stats()
+                send_event(EVENT_FRAME_DONE, progress=self.render_progress.progress, stats=stats)
+                unreal.log(f"Render Executor: Progress: {self.render_progress.progress} {stats}")
+            elif self.render_progress.progress != previous_progress or self.currentFrame == 1:
+                send_event(EVENT_PROGRESS, progress=self.render_progress.progress)
+                unreal.log(f"Render Executor: Progress: {self.render_progress.progress}")
 
 
 class UnrealRenderStepHandler(BaseStepHandler):
     @staticmethod
     def regex_pattern_progress() -> list[re.Pattern]:
-        return [re.compile(".*Render Executor: Progress: ([0-9.]+)")]
+        # Progress is followed by the frame stats as key=value pairs, see RenderFrameTimings
+        return [re.compile(".*Render Executor: Progress: ([0-9.]+)(?: (frame=.*))?")]
 
     @staticmethod
     def regex_pattern_complete() -> list[re.Pattern]:
@@ -126,10 +366,31 @@ class UnrealRenderStepHandler(BaseStepHandler):
 
     @staticmethod
     def executor_failed_callback(executor, pipeline, is_fatal, error):
+        send_event(EVENT_ERROR, message=f"Render Executor: Error: {error}", fatal=bool(is_fatal))
         unreal.log_error(f"Render Executor: Error: {error}")
 
+    @staticmethod
+    def regex_pattern_summary() -> list[re.Pattern]:
+        return [re.compile(".*Render Executor: Frame summary: (frames=.*)")]
+
+    @staticmethod
+    def regex_markers() -> list[str]:
+        return ["Render Executor:", " jobs in ", "Exception:", "LogPython: Error:"]
+
     @staticmethod
     def executor_finished_callback(movie_pipeline=None, results=None):
+        frame_timings = RemoteRenderMoviePipelineEditorExecutor.frame_timings
+        render_progress = RemoteRenderMoviePipelineEditorExecutor.render_progress
+
+        # No frame begins after the last one, so it ends with the render
+        if frame_timings.end_frame() is not None:
+            stats = frame_timings.format_stats()
+            send_event(EVENT_FRAME_DONE, progress=render_progress.progress, stats=stats)
+            unreal.log(f"Render Executor: Progress: {render_progress.progress} {stats}")
+
+        unreal.log(f"Render Executor: Frame summary: {frame_timings.format_summary()}")
+        # Adaptor gets the completion right away, not after the log is flushed
+        send_event(EVENT_COMPLETE)
         unreal.log("Render Executor: Rendering is complete")
 
     @staticmethod
@@ -187,6 +448,30 @@ class UnrealRenderStepHandler(BaseStepHandler):
         name = job_name or Path(level_sequence_path).stem
         render_job.job_name = name
 
+    @staticmethod
+    def set_frame_chunk(
+        movie_pipeline_queue_subsystem, chunk_start_frame: int, chunk_end_frame: int
+    ):
+        """
+        Override the frame range of the jobs in the unreal.MoviePipelineQueue
+        with the custom playback range of the chunk to render
+
+        :param movie_pipeline_queue_subsystem: The unreal.MoviePipelineQueueSubsystem instance
+        :param chunk_start_frame: First frame of the chunk (inclusive)
+        :param chunk_end_frame: Last frame of the chunk (exclusive)
+        """
+        for job in movie_pipeline_queue_subsystem.get_queue().get_jobs():
+            output_settings = job.get_configuration().find_or_add_setting_by_class(
+                unreal.MoviePipelineOutputSetting
+            )
+            output_settings.use_custom_playback_range = True
+            output_settings.custom_start_frame = chunk_start_frame
+            output_settings.custom_end_frame = chunk_end_frame
+
+        unreal.log(
+            f"Render Executor: Rendering chunk of frames {chunk_start_frame}-{chunk_end_frame - 1}"
+        )
+
     def run_script(self, args: dict) -> bool:
         """
         Create the unreal.MoviePipelineQueue object and render it with the render executor
@@ -215,6 +500,18 @@ class UnrealRenderStepHandler(BaseStepHandler):
                 job_configuration_path=args.get("job_configuration_path", ""),
             )
 
+        if args.get("chunk_size") and args.get("chunk_start_frame") is not None:
+            chunk_start_frame = args["chunk_start_frame"]
+            chunk_end_frame = chunk_start_frame + args["chunk_size"]
+            if args.get("chunk_end_frame") is not None:
+                chunk_end_frame = min(chunk_end_frame, args["chunk_end_frame"])
+
+            UnrealRenderStepHandler.set_frame_chunk(
+                movie_pipeline_queue_subsystem=subsystem,
+                chunk_start_frame=chunk_start_frame,
+                chunk_end_frame=chunk_end_frame,
+            )
+
         # Initialize Render executor
         executor = RemoteRenderMoviePipelineEditorExecutor()
 
@@ -2,7 +2,9 @@
 
 import os
 import sys
+import json
 from http import HTTPStatus
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from typing import Optional
 
@@ -14,37 +16,162 @@ if "PYTHONPATH" in os.environ:
 for p in sys.path:
     print(p)
 
-from openjd.adaptor_runtime_client.win_client_interface import WinClientInterface  # noqa: E402
+# Named pipe client on Windows, UNIX socket client on Linux and macOS
+from openjd.adaptor_runtime_client import ClientInterface  # noqa: E402
 from deadline.unreal_adaptor.UnrealClient.step_handlers.base_step_handler import (  # noqa: E402
     BaseStepHandler,
 )
 from deadline.unreal_adaptor.UnrealClient.step_handlers import get_step_handler_class  # noqa: E402
+from deadline.unreal_adaptor.UnrealClient.events import (  # noqa: E402
+    EVENT_CHANNEL_OPEN,
+    EVENT_PATH,
+    set_event_sender,
+)
+from openjd.adaptor_runtime_client import Action  # noqa: E402
 
 
-class UnrealClient(WinClientInterface):
+class UnrealClient(ClientInterface):
     """
     Socket DCC client implementation for UnrealEngine that send requests for actions and execute them.
+
+    Actions are requested on a background thread, since the Adaptor server holds the request until
+    the next action is available, and performed on the Unreal game thread in :meth:`tick()`.
+    The next action is requested right away after the response. When the request fails,
+    the interval before the retry is doubled up to the maximum retry interval and it is reset
+    by the next successful request.
+
+    The end of the startup phases (first_client_poll, asset_registry_ready, handler_set) is printed
+    once as "UnrealClient: Startup phase: <phase>", so the Adaptor can measure their durations.
+    The first_client_poll phase ends when the client first reaches the Adaptor server, i.e. on
+    the response to the channel_open event or when the first action is requested.
+
+    Progress, completion and errors of the task are sent to the Adaptor as the events
+    if the event channel is open, see :meth:`open_event_channel`. The events are sent on another
+    background thread, so they are not delayed by the action request held by the Adaptor.
     """
 
-    def __init__(self, socket_path: str) -> None:
+    MIN_RETRY_INTERVAL_SECONDS = 0.05
+    DEFAULT_MAX_RETRY_INTERVAL_SECONDS = 1.0
+
+    def __init__(
+        self, socket_path: str, max_retry_interval: float = DEFAULT_MAX_RETRY_INTERVAL_SECONDS
+    ) -> None:
         super().__init__(socket_path)
         self.handler: BaseStepHandler
         self.actions.update({"set_handler": self.set_handler})
 
+        self.max_retry_interval = max_retry_interval
+        self.retry_interval = 0.0
+        self._time_since_poll = 0.0
+        self._request_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="UnrealClientRequest"
+        )
+        self._pending_request: Optional[Future] = None
+        self._reported_startup_phases: set[str] = set()
+
+        # Task the events are sent for, set by the Adaptor with the step handler
+        self.task_id: Optional[int] = None
+        self._event_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="UnrealClientEvent"
+        )
+
     def set_handler(self, handler_dict: dict) -> None:
         """Set the current Step Handler"""
 
         handler_class = get_step_handler_class(handler_dict.get("handler", "base"))
         self.handler = handler_class()
+        self.task_id = handler_dict.get("task_id")
         # This is an abstract method in a base class and isn't callable but the actual handler will implement this as callable.
         # TODO: Properly type hint self.handler
         self.actions.update(self.handler.action_dict)  # type: ignore
+        self._report_startup_phase("handler_set")
+
+    def open_event_channel(self) -> bool:
+        """
+        Send the channel_open event to the Adaptor and let the step handlers send their events,
+        see :mod:`deadline.unreal_adaptor.UnrealClient.events`. If the Adaptor server
+        doesn't accept the events, they are not sent and the Adaptor matches the log instead.
+
+        :return: True if the event channel is open
+        """
+        try:
+            response = self._send_event_request({"type": EVENT_CHANNEL_OPEN})
+            # Any response means the server is reached, even if it doesn't accept the events
+            self._report_startup_phase("first_client_poll")
+            error = (
+                "" if response.status == HTTPStatus.OK else f"{response.status} {response.reason}"
+            )
+        except Exception as e:
+            error = str(e)
+
+        if error:
+            print(f"UnrealClient: Event channel is not available: {error}", flush=True)
+            set_event_sender(None)
+            return False
+
+        set_event_sender(self.send_event)
+        return True
+
+    def send_event(self, event: dict) -> None:
+        """
+        Send the event of the current task to the Adaptor in the background.
+        The events are sent one by one in the order they are given.
+
+        :param event: Event dictionary with the "type" and the details
+        """
+        self._event_executor.submit(self._put_event, {**event, "task_id": self.task_id})
+
+    def _send_event_request(self, event: dict):
+        return self._send_request(
+            "PUT", EVENT_PATH, query_string_params={"event": json.dumps(event)}
+        )
+
+    def _put_event(self, event: dict) -> None:
+        try:
+            response = self._send_event_request(event)
+            error = (
+                "" if response.status == HTTPStatus.OK else f"{response.status} {response.reason}"
+            )
+        except Exception as e:
+            error = str(e)
+
+        if error:
+            print(
+                f"ERROR: Failed to send the event {event['type']} to the server: {error}",
+                file=sys.stderr,
+                flush=True,
+            )
+
+    def _report_startup_phase(self, phase: str) -> None:
+        """
+        Print the end of the given startup phase for the Adaptor if it was not printed yet
+
+        :param phase: Name of the phase, e.g. first_client_poll
+        """
+        if phase in self._reported_startup_phases:
+            return
+        self._reported_startup_phases.add(phase)
+        print(f"UnrealClient: Startup phase: {phase}", flush=True)
+
+    def _check_asset_registry_ready(self) -> None:
+        """
+        Report the asset_registry_ready phase once the Asset Registry finished the initial scan
+        """
+        if "asset_registry_ready" in self._reported_startup_phases:
+            return
+
+        import unreal
+
+        if not unreal.AssetRegistryHelpers.get_asset_registry().is_loading_assets():
+            self._report_startup_phase("asset_registry_ready")
 
     def close(self, args: Optional[dict] = None) -> None:
         """Close the Unreal Engine"""
         import unreal
 
         unreal.log("Quit the Editor: normal shutdown")
+        set_event_sender(None)
+        self._event_executor.shutdown(wait=True)
         unreal.SystemLibrary.quit_editor()
 
     def graceful_shutdown(self, *args, **kwargs) -> None:
@@ -56,12 +183,58 @@ class UnrealClient(WinClientInterface):
 
     def poll(self) -> None:
         """
-        This function will poll the server for the next task. If the server is in between Subtasks
-        (no actions in the queue), a backoff function will be called to add a delay between the
-        requests.
+        This function will poll the server for the next task and perform it.
+        The call is blocked until the server has an action in the queue.
         """
+        self._report_startup_phase("first_client_poll")
         status, reason, action = self._request_next_action()
-        if status == HTTPStatus.OK:
+        self._handle_response(status, reason, action)
+
+    def tick(self, delta_time: float) -> None:
+        """
+        Non-blocking poll that is called on each Unreal tick.
+        Requests the next action in the background once the current poll interval is elapsed
+        and performs the received action on the calling thread.
+
+        :param delta_time: Time in seconds since the previous tick
+        """
+        self._check_asset_registry_ready()
+
+        if self._pending_request is None:
+            self._time_since_poll += delta_time
+            if self._time_since_poll >= self.retry_interval:
+                self._time_since_poll = 0.0
+                self._report_startup_phase("first_client_poll")
+                self._pending_request = self._request_executor.submit(self._request_next_action)
+            return
+
+        if not self._pending_request.done():
+            return
+
+        pending_request, self._pending_request = self._pending_request, None
+        try:
+            status, reason, action = pending_request.result()
+        except Exception as e:
+            print(
+                f"ERROR: An error was raised when trying to connect to the server: {e}",
+                file=sys.stderr,
+                flush=True,
+            )
+            self._update_retry_interval(succeeded=False)
+            return
+
+        self._handle_response(status, reason, action)
+
+    def _handle_response(self, status: int, reason: str, action: Optional[Action]) -> None:
+        """
+        Perform the action received from the server and adapt the retry interval
+
+        :param status: HTTP status of the response
+        :param reason: HTTP status reason of the response
+        :param action: Action to perform, if any
+        """
+        succeeded = status == HTTPStatus.OK
+        if succeeded:
             if action is not None:
                 print(
                     f"Performing action: {action}",
@@ -76,6 +249,23 @@ class UnrealClient(WinClientInterface):
                 flush=True,
             )
 
+        self._update_retry_interval(succeeded)
+
+    def _update_retry_interval(self, succeeded: bool) -> None:
+        """
+        Request the next action right away after the successful request and back off
+        exponentially, up to the max retry interval, while the requests fail
+
+        :param succeeded: True if the last request succeeded
+        """
+        if succeeded:
+            self.retry_interval = 0.0
+        else:
+            self.retry_interval = min(
+                max(self.retry_interval * 2, self.MIN_RETRY_INTERVAL_SECONDS),
+                self.max_retry_interval,
+            )
+
 
 def main():
     import unreal
@@ -95,25 +285,26 @@ def main():
             f"{os.environ['UNREAL_ADAPTOR_SOCKET_PATH']}"
         )
 
+    max_retry_interval = float(
+        os.environ.get(
+            "UNREAL_CLIENT_MAX_RETRY_INTERVAL", UnrealClient.DEFAULT_MAX_RETRY_INTERVAL_SECONDS
+        )
+    )
+
     @unreal.uclass()
     class OnTickThreadExecutorImplementation(unreal.PythonGameThreadExecutor):
         """
         Python implementation of the OnTickThreadExecutor class that runs the
-        :meth:`deadline.unreal_adaptor.UnrealClient.unreal_client.UnrealClient.poll()`
+        :meth:`deadline.unreal_adaptor.UnrealClient.unreal_client.UnrealClient.tick()`
         """
 
-        client = UnrealClient(socket_path)
-        time_elapsed = unreal.uproperty(float)
-
-        def _post_init(self):
-            self.time_elapsed = 0
+        client = UnrealClient(socket_path, max_retry_interval=max_retry_interval)
 
         @unreal.ufunction(override=True)
         def execute(self, delta_time: float):
-            self.time_elapsed += delta_time
-            if self.time_elapsed >= 1:
-                self.time_elapsed = 0
-                self.client.poll()
+            self.client.tick(delta_time)
+
+    OnTickThreadExecutorImplementation.client.open_event_channel()
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,7 +1,13 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
+import re
+import time
+import shutil
+import hashlib
 import unreal
 from pathlib import Path
+from typing import Optional
 
 
 def get_project_file_path() -> str:
@@ -44,3 +50,123 @@ def soft_obj_path_to_str(soft_obj_path: unreal.SoftObjectPath) -> str:
     """
     obj_ref = unreal.SystemLibrary.conv_soft_obj_path_to_soft_obj_ref(soft_obj_path)
     return unreal.SystemLibrary.conv_soft_object_reference_to_string(obj_ref)
+
+
+def get_mrq_job_frame_range(mrq_job: unreal.MoviePipelineExecutorJob) -> tuple[int, int]:
+    """
+    Returns the frame range that the given MRQ Job renders.
+    Custom playback range of the job configuration is used if it is set,
+    playback range of the job's level sequence otherwise.
+    The configuration of the job is only read, the output setting is not added to it.
+
+    :param mrq_job: unreal.MoviePipelineExecutorJob instance
+    :type mrq_job: unreal.MoviePipelineExecutorJob
+    :return: Start frame (inclusive) and end frame (exclusive) of the job
+    :rtype: tuple[int, int]
+    """
+
+    output_settings = mrq_job.get_configuration().find_setting_by_class(
+        unreal.MoviePipelineOutputSetting
+    )
+    if output_settings is not None and output_settings.use_custom_playback_range:
+        return output_settings.custom_start_frame, output_settings.custom_end_frame
+
+    level_sequence = unreal.EditorAssetLibrary.load_asset(soft_obj_path_to_str(mrq_job.sequence))
+    if level_sequence is None:
+        raise RuntimeError(
+            f"Failed to load the level sequence {mrq_job.sequence} of the job {mrq_job.job_name}"
+        )
+
+    return level_sequence.get_playback_start(), level_sequence.get_playback_end()
+
+
+def get_default_manifests_directory() -> str:
+    """
+    Returns the directory of the content-addressed queue manifests in the project's Saved folder,
+    e.g. C:/UE_project/Saved/DeadlineCloud/Manifests
+
+    :return: Manifests directory OS path
+    :rtype: str
+    """
+    saved_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved_dir, "DeadlineCloud", "Manifests").replace("\\", "/")
+
+
+#: Age in seconds of the content addressed files that are removed, they are uploaded by the
+#: submission and only reused by the following submissions
+CONTENT_ADDRESSED_FILE_MAX_AGE = 7 * 24 * 60 * 60
+
+_CONTENT_ADDRESSED_FILE_REGEX = re.compile(r"^[0-9a-f]{64}(\.[^.]+)?(\.\d+\.tmp)?$")
+
+
+def remove_old_content_addressed_files(
+    directory: str, max_age: float = CONTENT_ADDRESSED_FILE_MAX_AGE
+):
+    """
+    Remove the content addressed files of the directory that were not stored or reused
+    longer than the given age
+
+    :param directory: Directory of the content addressed files
+    :type directory: str
+    :param max_age: Age in seconds of the files to remove
+    :type max_age: float
+    """
+    remove_before = time.time() - max_age
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+
+    for entry in entries:
+        if not _CONTENT_ADDRESSED_FILE_REGEX.match(entry.name):
+            continue
+        try:
+            if entry.is_file() and entry.stat().st_mtime < remove_before:
+                os.remove(entry.path)
+        except OSError:
+            continue
+
+
+def store_content_addressed_file(file_path: str, directory: Optional[str] = None) -> str:
+    """
+    Copy the given file to the directory under the name of its content hash,
+    e.g. Manifests/<sha256>.utxt. Files with the same content are stored once,
+    so the jobs with identical queue manifests share the same attachment.
+    Files of the directory that were not stored or reused for a week are removed,
+    see :func:`remove_old_content_addressed_files`.
+
+    :param file_path: OS path of the file to store
+    :type file_path: str
+    :param directory: Directory to store the file in, project's Saved/DeadlineCloud/Manifests by default
+    :type directory: str, optional
+    :return: OS path of the stored file
+    :rtype: str
+    """
+
+    directory = directory or get_default_manifests_directory()
+    remove_old_content_addressed_files(directory)
+
+    file_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            file_hash.update(chunk)
+
+    stored_file_path = os.path.join(
+        directory, file_hash.hexdigest() + os.path.splitext(file_path)[1]
+    ).replace("\\", "/")
+    if os.path.isfile(stored_file_path):
+        # Keep the reused file from being removed as the old one
+        try:
+            os.utime(stored_file_path)
+        except OSError:
+            pass
+        return stored_file_path
+
+    os.makedirs(directory, exist_ok=True)
+
+    # Copy to the temporary file first so the other jobs never see the partially written file
+    tmp_file_path = f"{stored_file_path}.{os.getpid()}.tmp"
+    shutil.copyfile(file_path, tmp_file_path)
+    os.replace(tmp_file_path, stored_file_path)
+
+    return stored_file_path
@@ -0,0 +1,263 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+import json
+import threading
+import unreal
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Iterable, Optional
+
+from deadline.client.config import config_file
+from deadline.job_attachments.caches import HashCache, HashCacheEntry
+from deadline.job_attachments.asset_manifests import HashAlgorithm
+
+
+def get_default_submission_history_path() -> str:
+    """
+    Returns the path of the submission history file in the project's Saved folder,
+    e.g. C:/UE_project/Saved/DeadlineCloud/SubmissionHistory.json
+
+    :return: Submission history file path
+    :rtype: str
+    """
+    saved_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved_dir, "DeadlineCloud", "SubmissionHistory.json").replace("\\", "/")
+
+
+@dataclass
+class AssetReferencesDelta:
+    """
+    Difference between the input files of the job and the files of the previous submission
+    """
+
+    #: Files that were not submitted before
+    added: list[str] = field(default_factory=list)
+    #: Files that changed size or modification time since the previous submission
+    modified: list[str] = field(default_factory=list)
+    #: Files of the previous submission that are not referenced anymore
+    removed: list[str] = field(default_factory=list)
+    #: Files that did not change since the previous submission
+    unchanged: list[str] = field(default_factory=list)
+
+
+class SubmissionHistory:
+    """
+    Persistent history of the input files submitted for each project and shot (level sequence).
+
+    Each file is stored with its size, modification time and the job attachments hash
+    computed on submission. The next submission of the same shot is compared against the history
+    and the hashes of the unchanged files are put back to the job attachments hash cache,
+    so they are not hashed again even if the hash cache lost them.
+    """
+
+    VERSION = 1
+
+    def __init__(self, history_path: Optional[str] = None, hash_cache_dir: Optional[str] = None):
+        """
+        Load the history from the given file path if it exists
+
+        :param history_path: Path of the history file, project's Saved folder is used by default
+        :type history_path: str, optional
+        :param hash_cache_dir: Job attachments hash cache directory, Deadline Cloud cache directory is used by default
+        :type hash_cache_dir: str, optional
+        """
+        self.history_path = history_path or get_default_submission_history_path()
+        self.hash_cache_dir = hash_cache_dir
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, dict]] = {}
+        self._modified = False
+        self.load()
+
+    @staticmethod
+    def get_history_key(project_file_path: str, level_sequence_path: str) -> str:
+        """
+        Returns the key of the submission history entry
+
+        :param project_file_path: OS path of the Unreal project file
+        :type project_file_path: str
+        :param level_sequence_path: Unreal path of the rendered level sequence (shot)
+        :type level_sequence_path: str
+
+        :return: History key
+        :rtype: str
+        """
+        return f"{project_file_path}|{level_sequence_path}"
+
+    @staticmethod
+    def get_file_stamp(file_path: str) -> Optional[dict]:
+        """
+        Returns the size and the modification time of the given file
+
+        :param file_path: OS path of the file
+        :type file_path: str
+
+        :return: Dictionary with the size and mtime, None if the file is not found
+        :rtype: Optional[dict]
+        """
+        try:
+            stat_result = os.stat(file_path)
+        except OSError:
+            return None
+        return {"size": stat_result.st_size, "mtime": stat_result.st_mtime_ns}
+
+    def _get_hash_cache_dir(self) -> str:
+        return self.hash_cache_dir or config_file.get_cache_directory()
+
+    def load(self):
+        """Load the history entries from the history file. Start with the empty history if the file is not valid"""
+        self._entries = {}
+        self._modified = False
+
+        if not os.path.isfile(self.history_path):
+            return
+
+        try:
+            with open(self.history_path, "r") as f:
+                history_data = json.load(f)
+        except (OSError, ValueError) as e:
+            unreal.log_warning(
+                f"SubmissionHistory: Can't read the history {self.history_path}: {e}"
+            )
+            return
+
+        if not isinstance(history_data, dict) or history_data.get("version") != self.VERSION:
+            unreal.log(f"SubmissionHistory: Outdated history {self.history_path} is ignored")
+            return
+
+        self._entries = history_data.get("entries", {})
+
+    def save(self):
+        """Write the history entries to the history file if they were modified"""
+        with self._lock:
+            if not self._modified:
+                return
+
+            os.makedirs(os.path.dirname(self.history_path), exist_ok=True)
+
+            # Write to the temporary file first so the interrupted write doesn't break the history
+            tmp_history_path = f"{self.history_path}.tmp"
+            with open(tmp_history_path, "w") as f:
+                json.dump({"version": self.VERSION, "entries": self._entries}, f)
+            os.replace(tmp_history_path, self.history_path)
+
+            self._modified = False
+
+    def get_delta(self, history_key: str, file_paths: Iterable[str]) -> AssetReferencesDelta:
+        """
+        Compare the given files with the files of the previous submission
+
+        :param history_key: Key of the history entry, see :meth:`get_history_key`
+        :type history_key: str
+        :param file_paths: OS paths of the input files of the job
+        :type file_paths: Iterable[str]
+
+        :return: Delta of the files
+        :rtype: AssetReferencesDelta
+        """
+        with self._lock:
+            submitted_files = dict(self._entries.get(history_key, {}))
+
+        delta = AssetReferencesDelta()
+        for file_path in file_paths:
+            submitted_file = submitted_files.pop(file_path, None)
+            if submitted_file is None:
+                delta.added.append(file_path)
+            elif submitted_file["stamp"] != self.get_file_stamp(file_path):
+                delta.modified.append(file_path)
+            else:
+                delta.unchanged.append(file_path)
+        delta.removed = sorted(submitted_files)
+
+        return delta
+
+    def seed_hash_cache(self, history_key: str, file_paths: Iterable[str]) -> int:
+        """
+        Put the hashes of the given unchanged files from the history to the job attachments hash cache
+        if the cache doesn't have the valid entries for them
+
+        :param history_key: Key of the history entry, see :meth:`get_history_key`
+        :type history_key: str
+        :param file_paths: OS paths of the files that did not change since the previous submission
+        :type file_paths: Iterable[str]
+
+        :return: Number of the added hash cache entries
+        :rtype: int
+        """
+        with self._lock:
+            submitted_files = self._entries.get(history_key, {})
+            hashed_files = {
+                file_path: submitted_files[file_path]
+                for file_path in file_paths
+                if submitted_files.get(file_path, {}).get("hash")
+            }
+
+        if not hashed_files:
+            return 0
+
+        seeded = 0
+        with HashCache(self._get_hash_cache_dir()) as hash_cache:
+            for file_path, submitted_file in hashed_files.items():
+                path = Path(file_path)
+                try:
+                    # Same key and mtime format as the job attachments upload uses
+                    full_path = str(path.resolve())
+                    modified_time = str(datetime.fromtimestamp(path.stat().st_mtime))
+                except OSError:
+                    continue
+
+                hash_algorithm = HashAlgorithm(submitted_file["hash_algorithm"])
+                entry = hash_cache.get_entry(full_path, hash_algorithm)
+                if entry is not None and entry.last_modified_time == modified_time:
+                    continue
+
+                hash_cache.put_entry(
+                    HashCacheEntry(
+                        file_path=full_path,
+                        hash_algorithm=hash_algorithm,
+                        file_hash=submitted_file["hash"],
+                        last_modified_time=modified_time,
+                    )
+                )
+                seeded += 1
+
+        return seeded
+
+    def record(self, history_key: str, file_paths: Iterable[str]):
+        """
+        Store the given submitted files with their current stamps and the hashes
+        from the job attachments hash cache
+
+        :param history_key: Key of the history entry, see :meth:`get_history_key`
+        :type history_key: str
+        :param file_paths: OS paths of the submitted input files
+        :type file_paths: Iterable[str]
+        """
+        submitted_files: dict[str, dict] = {}
+        with HashCache(self._get_hash_cache_dir()) as hash_cache:
+            for file_path in file_paths:
+                path = Path(file_path)
+                try:
+                    stat_result = path.stat()
+                except OSError:
+                    continue
+
+                submitted_file: dict = {
+                    "stamp": {"size": stat_result.st_size, "mtime": stat_result.st_mtime_ns}
+                }
+
+                modified_time = str(datetime.fromtimestamp(stat_result.st_mtime))
+                for hash_algorithm in HashAlgorithm:
+                    entry = hash_cache.get_entry(str(path.resolve()), hash_algorithm)
+                    # Hash of the file content that was submitted, not of the older version
+                    if entry is not None and entry.last_modified_time == modified_time:
+                        submitted_file["hash"] = entry.file_hash
+                        submitted_file["hash_algorithm"] = entry.hash_algorithm.value
+                        break
+
+                submitted_files[file_path] = submitted_file
+
+        with self._lock:
+            self._entries[history_key] = submitted_files
+            self._modified = True
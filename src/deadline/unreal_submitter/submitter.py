@@ -1,13 +1,18 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 import unreal
-import threading
 from enum import Enum
+from typing import Callable, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from deadline.client.api import (
     create_job_from_job_bundle,
+    get_boto3_client,
     get_deadline_cloud_library_telemetry_client,
 )
 from deadline.job_attachments.exceptions import AssetSyncCancelledError
 
+from deadline.unreal_submitter.submission_history import SubmissionHistory
 from deadline.unreal_submitter.unreal_open_job.open_job_description import OpenJobDescription
 
 from ._version import version
@@ -26,22 +31,119 @@ class UnrealSubmitStatus(Enum):
     UPLOADING = 3
 
 
+@dataclass
+class UnrealJobSubmission:
+    """
+    State and result of the single OpenJob submission
+    """
+
+    #: OpenJob to submit
+    job: OpenJobDescription
+    #: Current stage of the submission
+    status: UnrealSubmitStatus = UnrealSubmitStatus.HASHING
+    #: Progress of the current stage, from 0 to 100
+    progress: float = 0
+    #: Last progress message of the current stage
+    message: str = "Start submitting..."
+    #: Created job ID, None until the job is created
+    job_id: Optional[str] = None
+    #: Reason of the failed submission, empty if the job is not failed
+    failed_message: str = ""
+    #: Latest (status, progress, message) published by the submitting thread and not yet
+    #: applied by the UI. Appending and popping the deque are atomic, so the submitting thread
+    #: never waits for the UI and the older values are dropped
+    progress_channel: deque = field(default_factory=lambda: deque(maxlen=1))
+
+    def publish_progress(self, status: UnrealSubmitStatus, progress: float, message: str):
+        """
+        Publish the progress from the submitting thread, replacing the not applied one
+
+        :param status: Current stage of the submission
+        :type status: UnrealSubmitStatus
+        :param progress: Progress of the current stage, from 0 to 100
+        :type progress: float
+        :param message: Progress message
+        :type message: str
+        """
+        self.progress_channel.append((status, progress, message))
+
+    def apply_progress(self) -> bool:
+        """
+        Apply the latest published progress, if any
+
+        :return: True if the progress was updated
+        :rtype: bool
+        """
+        try:
+            self.status, self.progress, self.message = self.progress_channel.pop()
+        except IndexError:
+            return False
+        return True
+
+    @property
+    def overall_progress(self) -> float:
+        """
+        Progress of the whole submission, hashing and uploading take a half each
+
+        :return: Progress from 0 to 100
+        :rtype: float
+        """
+        if self.status == UnrealSubmitStatus.COMPLETED or self.failed_message:
+            return 100.0
+        if self.status == UnrealSubmitStatus.HASHING:
+            return self.progress / 2
+        return 50 + self.progress / 2
+
+
 class UnrealSubmitter:
     """
-    Execute the OpenJob submission
+    Execute the OpenJob submission.
+
+    Jobs are submitted by the bounded pool of workers, so the next job is hashed while
+    the previous one is uploaded. The progress of all the jobs is displayed in the single dialog,
+    or reported on the editor ticks when the jobs are submitted in the background.
+
+    OpenJobs are built on the game thread since they use Unreal API,
+    only hashing, uploading and creating the jobs run on the worker threads.
     """
 
-    def __init__(self, silent_mode: bool = False):
+    DEFAULT_MAX_PARALLEL_JOBS = 2
+    #: How often the progress dialog is updated
+    PROGRESS_UPDATE_INTERVAL_SECONDS = 1 / 20
+
+    def __init__(
+        self,
+        silent_mode: bool = False,
+        max_parallel_jobs: int = DEFAULT_MAX_PARALLEL_JOBS,
+        submission_history: Optional[SubmissionHistory] = None,
+    ):
+        """
+        :param silent_mode: Don't show the message dialogs if True
+        :type silent_mode: bool
+        :param max_parallel_jobs: Maximum number of the jobs submitted at the same time
+        :type max_parallel_jobs: int
+        :param submission_history: History of the submitted input files used to skip
+                                   hashing of the files that did not change since the previous submission
+        :type submission_history: SubmissionHistory, optional
+        """
         self._silent_mode = silent_mode
+        self._max_parallel_jobs = max(max_parallel_jobs, 1)
+        self._submission_history = submission_history
 
         self._jobs: list[OpenJobDescription] = []
-        self.submit_status: UnrealSubmitStatus = UnrealSubmitStatus.COMPLETED
-        self.submit_message: str = "Start submitting..."
-        self.progress_list: list[float] = []
+        self.job_submissions: list[UnrealJobSubmission] = []  # per job results of the last submit
 
         self.continue_submission = True  # affect all not submitted jobs
         self.submitted_job_ids: list[str] = []  # use after submit loop is ended
-        self._submission_failed_message = ""  # reset after each job in the loop
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: list[Future] = []
+
+        # Background submission state
+        self._tick_handle = None
+        self._time_since_progress_update = 0.0
+        self._on_progress: Optional[Callable[[float, str], None]] = None
+        self._on_finished: Optional[Callable[[list[str]], None]] = None
 
         # Initialize telemetry client, opt-out is respected
         get_deadline_cloud_library_telemetry_client().update_common_details(
@@ -51,9 +153,20 @@ class UnrealSubmitter:
             }
         )
 
+    @property
+    def is_submitting(self) -> bool:
+        """
+        Returns True if the jobs are being submitted
+        """
+        return self._executor is not None
+
     @property
     def submission_failed_message(self) -> str:
-        return self._submission_failed_message
+        return "\n".join(
+            f"Job {job_submission.job.name}: {job_submission.failed_message}"
+            for job_submission in self.job_submissions
+            if job_submission.failed_message
+        )
 
     def add_job(self, mrq_job: unreal.MoviePipelineExecutorJob):
         """
@@ -64,105 +177,208 @@ class UnrealSubmitter:
         """
         self._jobs.append(OpenJobDescription(mrq_job=mrq_job))
 
-    def _display_progress(self, check_submit_status, message):
+    def _get_progress_message(self) -> str:
         """
-        Display the operation progress in the UI.
+        Build the message about the submission stages of all the jobs
 
-        :param check_submit_status: :class:`deadline.unreal_submitter.submitter.UnrealSubmitStatus` value
-        :type check_submit_status: :class:`deadline.unreal_submitter.submitter.UnrealSubmitStatus`
-        :param message: Message to display
-        :type message: str
+        :return: Progress message
+        :rtype: str
+        """
+        hashing = uploading = finished = 0
+        for job_submission in self.job_submissions:
+            if (
+                job_submission.status == UnrealSubmitStatus.COMPLETED
+                or job_submission.failed_message
+            ):
+                finished += 1
+            elif job_submission.status == UnrealSubmitStatus.HASHING:
+                hashing += 1
+            else:
+                uploading += 1
+
+        return (
+            f"Submitted {finished}/{len(self.job_submissions)} jobs "
+            f"(hashing: {hashing}, uploading: {uploading})"
+        )
+
+    def _apply_progress(self) -> float:
+        """
+        Apply the latest published progress of all the jobs
+
+        :return: Average progress of the jobs, from 0 to 100
+        :rtype: float
+        """
+        for job_submission in self.job_submissions:
+            job_submission.apply_progress()
+
+        return sum(
+            job_submission.overall_progress for job_submission in self.job_submissions
+        ) / len(self.job_submissions)
+
+    def _display_progress(self, futures: list[Future]):
+        """
+        Display the aggregated progress of the submitted jobs in the UI until all of them are done
+        or the user cancels the submission.
+
+        The dialog is updated at the fixed rate with the latest progress of the jobs
+        and sleeps between the updates instead of polling the jobs continuously.
+
+        :param futures: Futures of the job submissions
+        :type futures: list[concurrent.futures.Future]
         """
         last_progress: float = 0
-        with unreal.ScopedSlowTask(100, message) as submit_task:
+        with unreal.ScopedSlowTask(100, "Submitting jobs") as submit_task:
             submit_task.make_dialog(True)
-            while self.submit_status == check_submit_status:
-                if self.submission_failed_message != "":
+            while True:
+                # Wake up earlier if all the jobs are done
+                _, not_done = wait(futures, timeout=self.PROGRESS_UPDATE_INTERVAL_SECONDS)
+
+                new_progress = self._apply_progress()
+                submit_task.enter_progress_frame(
+                    new_progress - last_progress, self._get_progress_message()
+                )
+                last_progress = new_progress
+
+                if not not_done:
                     break
 
                 if submit_task.should_cancel():
-                    self.continue_submission = False
+                    self.cancel()
                     break
 
-                if len(self.progress_list) > 0:
-                    new_progress = self.progress_list.pop(0)
-                else:
-                    new_progress = last_progress
-                submit_task.enter_progress_frame(new_progress - last_progress, self.submit_message)
-                last_progress = new_progress
-
-    def _start_submit(self, job_bundle_path):
+    def _start_submit(self, job_submission: UnrealJobSubmission):
         """
         Start the OpenJob submission
 
-        :param job_bundle_path: Path of the Job bundle to submit
-        :type job_bundle_path: str
+        :param job_submission: Submission of the job to submit
+        :type job_submission: UnrealJobSubmission
         """
         try:
+            self._prepare_incremental_submission(job_submission)
+
             job_id = create_job_from_job_bundle(
-                job_bundle_dir=job_bundle_path,
-                hashing_progress_callback=lambda hash_metadata: self._hash_progress(hash_metadata),
+                job_bundle_dir=job_submission.job.job_bundle_path,
+                hashing_progress_callback=lambda hash_metadata: self._hash_progress(
+                    job_submission, hash_metadata
+                ),
                 upload_progress_callback=lambda upload_metadata: self._upload_progress(
-                    upload_metadata
+                    job_submission, upload_metadata
                 ),
-                create_job_result_callback=lambda: self._create_job_result(),
+                create_job_result_callback=lambda: self._create_job_result(job_submission),
             )
             if job_id:
                 unreal.log(f"Job creation result: {job_id}")
-                self.submitted_job_ids.append(job_id)
+                job_submission.job_id = job_id
+                self._record_submission(job_submission)
 
         except AssetSyncCancelledError as e:
             unreal.log(str(e))
 
         except Exception as e:
             unreal.log(str(e))
-            self._submission_failed_message = str(e)
+            job_submission.failed_message = str(e)
+
+    def _prepare_incremental_submission(self, job_submission: UnrealJobSubmission):
+        """
+        Compare the input files of the job with the previous submission of the same shot
+        and put the hashes of the unchanged files to the job attachments hash cache,
+        so only the added and modified files are hashed
+
+        :param job_submission: Submission of the job to submit
+        :type job_submission: UnrealJobSubmission
+        """
+        if self._submission_history is None:
+            return
+
+        history_key = job_submission.job.submission_history_key
+        try:
+            delta = self._submission_history.get_delta(
+                history_key, job_submission.job.asset_references.input_filenames
+            )
+            seeded = self._submission_history.seed_hash_cache(history_key, delta.unchanged)
+        except Exception as e:
+            # History only speeds up the hashing, the job is submitted without it
+            unreal.log_warning(f"Failed to use the submission history: {e}")
+            return
 
-    def _hash_progress(self, hash_metadata) -> bool:
+        unreal.log(
+            f"Input files of {job_submission.job.name}: added {len(delta.added)}, "
+            f"modified {len(delta.modified)}, removed {len(delta.removed)}, "
+            f"unchanged {len(delta.unchanged)} (restored hashes: {seeded})"
+        )
+
+    def _record_submission(self, job_submission: UnrealJobSubmission):
+        """
+        Store the input files of the submitted job in the submission history
+
+        :param job_submission: Submission of the created job
+        :type job_submission: UnrealJobSubmission
+        """
+        if self._submission_history is None:
+            return
+
+        try:
+            self._submission_history.record(
+                job_submission.job.submission_history_key,
+                job_submission.job.asset_references.input_filenames,
+            )
+        except Exception as e:
+            unreal.log_warning(f"Failed to update the submission history: {e}")
+
+    def _hash_progress(self, job_submission: UnrealJobSubmission, hash_metadata) -> bool:
         """
         Hashing progress callback for displaying hash metadata on the progress bar
 
+        :param job_submission: Submission of the job the progress is reported for
+        :type job_submission: UnrealJobSubmission
         :param hash_metadata: :class:`deadline.job_attachments.progress_tracker.ProgressReportMetadata`
         :type hash_metadata: deadline.job_attachments.progress_tracker.ProgressReportMetadata
         :return: Continue submission or not
         :rtype: bool
         """
-        self.submit_status = UnrealSubmitStatus.HASHING
         unreal.log(
-            "Hash progress: {} {}".format(hash_metadata.progress, hash_metadata.progressMessage)
+            "Hash progress: {} {} {}".format(
+                job_submission.job.name, hash_metadata.progress, hash_metadata.progressMessage
+            )
+        )
+        job_submission.publish_progress(
+            UnrealSubmitStatus.HASHING, hash_metadata.progress, hash_metadata.progressMessage
         )
-        self.submit_message = hash_metadata.progressMessage
-        self.progress_list.append(hash_metadata.progress)
         return self.continue_submission
 
-    def _upload_progress(self, upload_metadata) -> bool:
+    def _upload_progress(self, job_submission: UnrealJobSubmission, upload_metadata) -> bool:
         """
         Uploading progress callback for displaying upload metadata on the progress bar
 
+        :param job_submission: Submission of the job the progress is reported for
+        :type job_submission: UnrealJobSubmission
         :param upload_metadata: :class:`deadline.job_attachments.progress_tracker.ProgressReportMetadata`
         :type upload_metadata: deadline.job_attachments.progress_tracker.ProgressReportMetadata
         :return: Continue submission or not
         :rtype: bool
         """
 
-        self.submit_status = UnrealSubmitStatus.UPLOADING
         unreal.log(
-            "Upload progress: {} {}".format(
-                upload_metadata.progress, upload_metadata.progressMessage
+            "Upload progress: {} {} {}".format(
+                job_submission.job.name, upload_metadata.progress, upload_metadata.progressMessage
             )
         )
-        self.submit_message = upload_metadata.progressMessage
-        self.progress_list.append(upload_metadata.progress)
+        job_submission.publish_progress(
+            UnrealSubmitStatus.UPLOADING, upload_metadata.progress, upload_metadata.progressMessage
+        )
         return self.continue_submission
 
-    def _create_job_result(self) -> bool:
+    def _create_job_result(self, job_submission: UnrealJobSubmission) -> bool:
         """
         Creates job result callback
+
+        :param job_submission: Submission of the created job
+        :type job_submission: UnrealJobSubmission
         :return: True
         """
 
-        self.submit_status = UnrealSubmitStatus.COMPLETED
-        unreal.log("Create job result...")
+        job_submission.publish_progress(UnrealSubmitStatus.COMPLETED, 100, "Job created")
+        unreal.log(f"Create job result: {job_submission.job.name}")
         return True
 
     def show_message_dialog(
@@ -184,44 +400,80 @@ class UnrealSubmitter:
 
         unreal.EditorDialog.show_message(title=title, message=message, message_type=message_type)
 
-    def submit_jobs(self):
+    def cancel(self):
         """
-        Submit OpenJobs to the Deadline Cloud
+        Cancel the submission. Not started jobs are canceled immediately,
+        running ones stop on their next progress callback
         """
-        for job in self._jobs:
-            unreal.log("Creating job from bundle...")
-            self.submit_status = UnrealSubmitStatus.HASHING
-            self.progress_list = []
-            self.submit_message = "Start submitting..."
-            self._submission_failed_message = ""
+        self.continue_submission = False
+        for future in self._futures:
+            future.cancel()
 
-            t = threading.Thread(
-                target=self._start_submit, args=(job.job_bundle_path,), daemon=True
-            )
-            t.start()
+    def _start_submission(self):
+        """
+        Start submitting the added jobs on the worker threads
+        """
+        if self.is_submitting:
+            raise RuntimeError("Jobs submission is already in progress")
 
-            self._display_progress(
-                check_submit_status=UnrealSubmitStatus.HASHING, message="Hashing"
-            )
-            if self.continue_submission:
-                self._display_progress(
-                    check_submit_status=UnrealSubmitStatus.UPLOADING, message="Uploading"
-                )
-            t.join()
+        unreal.log(f"Creating {len(self._jobs)} jobs from bundles...")
+        self.job_submissions = [UnrealJobSubmission(job=job) for job in self._jobs]
+        self.continue_submission = True
 
-            # current job failed, notify and continue
-            if self.submission_failed_message != "":
-                self.show_message_dialog(
-                    f"Job {job.name} unsubmitted for the reason:\n {self.submission_failed_message}"
-                )
+        # The boto3 session cached by the deadline API is not thread safe, so it is created
+        # with its deadline client on this thread and the workers only create their clients from it.
+        # Errors of the session are reported by the jobs
+        try:
+            get_boto3_client("deadline")
+        except Exception as e:
+            unreal.log_warning(f"Failed to create the Deadline Cloud client: {e}")
 
-            # User cancel submission, notify and quit submission queue
-            if not self.continue_submission:
-                self.show_message_dialog(
-                    f"Jobs submission canceled.\n"
-                    f"Number of unsubmitted jobs: {len(self._jobs) - len(self.submitted_job_ids)}"
-                )
-                break
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._max_parallel_jobs, thread_name_prefix="UnrealSubmitter"
+        )
+        self._futures = [
+            self._executor.submit(self._start_submit, job_submission)
+            for job_submission in self.job_submissions
+        ]
+
+    def _finish_submission(self) -> list[str]:
+        """
+        Wait for the running jobs, notify about the submission results and clear the submitted jobs
+
+        :return: IDs of the created jobs
+        :rtype: list[str]
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._futures = []
+
+        if self.job_submissions:
+            # Apply the progress published after the last progress update
+            self._apply_progress()
+
+        if self._submission_history is not None:
+            self._submission_history.save()
+
+        self.submitted_job_ids = [
+            job_submission.job_id
+            for job_submission in self.job_submissions
+            if job_submission.job_id is not None
+        ]
+        submitted_job_ids = list(self.submitted_job_ids)
+
+        # Some jobs failed, notify about all of them at once
+        if self.submission_failed_message != "":
+            self.show_message_dialog(
+                f"Jobs unsubmitted for the reasons:\n {self.submission_failed_message}"
+            )
+
+        # User cancel submission, notify about the unsubmitted jobs
+        if not self.continue_submission:
+            self.show_message_dialog(
+                f"Jobs submission canceled.\n"
+                f"Number of unsubmitted jobs: {len(self._jobs) - len(self.submitted_job_ids)}"
+            )
 
         # Summary notification about submission process
         self.show_message_dialog(
@@ -230,3 +482,65 @@ class UnrealSubmitter:
 
         del self.submitted_job_ids[:]
         del self._jobs[:]
+
+        return submitted_job_ids
+
+    def submit_jobs(self):
+        """
+        Submit OpenJobs to the Deadline Cloud and wait for them in the modal progress dialog
+        """
+        self._start_submission()
+        try:
+            if self._futures:
+                self._display_progress(self._futures)
+        finally:
+            self._finish_submission()
+
+    def submit_jobs_in_background(
+        self,
+        on_progress: Optional[Callable[[float, str], None]] = None,
+        on_finished: Optional[Callable[[list[str]], None]] = None,
+    ):
+        """
+        Submit OpenJobs to the Deadline Cloud without blocking the editor.
+        Progress and the result are reported on the game thread from the editor ticks.
+        Use :meth:`cancel` to stop the submission.
+
+        :param on_progress: Called with the overall progress (from 0 to 100) and the progress message
+        :type on_progress: typing.Callable[[float, str], None], optional
+        :param on_finished: Called with the IDs of the created jobs when the submission is finished
+        :type on_finished: typing.Callable[[list[str]], None], optional
+        """
+        self._start_submission()
+        self._on_progress = on_progress
+        self._on_finished = on_finished
+        self._time_since_progress_update = 0.0
+        self._tick_handle = unreal.register_slate_post_tick_callback(self._on_tick)
+
+    def _on_tick(self, delta_time: float):
+        """
+        Editor tick callback of the background submission.
+        Report the progress at the fixed rate and finish the submission when all the jobs are done
+
+        :param delta_time: Time since the previous tick in seconds
+        :type delta_time: float
+        """
+        if all(future.done() for future in self._futures):
+            unreal.unregister_slate_post_tick_callback(self._tick_handle)
+            self._tick_handle = None
+
+            submitted_job_ids = self._finish_submission()
+            if self._on_progress is not None:
+                self._on_progress(100.0, f"Submitted {len(submitted_job_ids)} jobs")
+            if self._on_finished is not None:
+                self._on_finished(submitted_job_ids)
+            return
+
+        self._time_since_progress_update += delta_time
+        if self._time_since_progress_update < self.PROGRESS_UPDATE_INTERVAL_SECONDS:
+            return
+        self._time_since_progress_update = 0.0
+
+        progress = self._apply_progress()
+        if self._on_progress is not None:
+            self._on_progress(progress, self._get_progress_message())
@@ -1,10 +1,12 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import json
 import unreal
 from typing import Callable, Optional
 
 from .common import os_path_from_unreal_path
-from .dependency_search_options import DependencySearchOptions
+from .dependency_cache import DependencyCache
+from .dependency_search_options import DependencySearchOptions, DependencyScanMode
 
 asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
 
@@ -12,7 +14,8 @@ asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
 class DependencyCollector:
     """
     A helper class to collect all dependencies of the given unreal asset (Level, LevelSequence, etc.).
-    Execute recursive collecting on the newly found dependency  until not found any other.
+    Walk the dependency graph breadth-first, collecting the newly found dependencies
+    until not found any other.
 
     For example, we want to collect dependencies of LevelSequence:
     1. LevelSequence depends on Level and Cube
@@ -21,8 +24,19 @@ class DependencyCollector:
     Output list will be: [Level, Cube, StatueSet, HorseAsset, RockAsset]
     """
 
-    def __init__(self):
-        self._collected_dependencies = list()
+    def __init__(self, dependency_cache: Optional[DependencyCache] = None):
+        """
+        :param dependency_cache: Cache of the packages direct dependencies to use instead of
+                                 the Asset Registry queries and rescans for the unchanged packages
+        :type dependency_cache: DependencyCache, optional
+        """
+        # Keeps the order the dependencies were found in
+        self._collected_dependencies: list = list()
+        # Names of the collected dependencies for the constant time lookups
+        self._collected_dependency_names: set[str] = set()
+
+        self._dependency_cache = dependency_cache
+        self._dependency_options_key = ""
 
     def collect(
         self,
@@ -30,6 +44,7 @@ class DependencyCollector:
         dependency_options=DependencySearchOptions(),
         filter_method: Optional[Callable] = None,
         on_found_dependency_callback: Optional[Callable] = None,
+        scan_mode: DependencyScanMode = DependencyScanMode.AUTO,
     ):
         """
         Collect all dependencies recursively of the given unreal asset.
@@ -42,11 +57,49 @@ class DependencyCollector:
         :type filter_method: typing.Callable, optional
         :param on_found_dependency_callback: Method used to invoke some operations on found dependencies list, for example sync them from VCS
         :type on_found_dependency_callback: typing.Callable, optional
+        :param scan_mode: How to rescan the Asset Registry for the found dependencies
+        :type scan_mode: DependencyScanMode
 
         :return: List of the collected dependencies
         :rtype: list
         """
+        return self.collect_many(
+            asset_paths=[asset_path],
+            dependency_options=dependency_options,
+            filter_method=filter_method,
+            on_found_dependency_callback=on_found_dependency_callback,
+            scan_mode=scan_mode,
+        )
+
+    def collect_many(
+        self,
+        asset_paths: list[str],
+        dependency_options=DependencySearchOptions(),
+        filter_method: Optional[Callable] = None,
+        on_found_dependency_callback: Optional[Callable] = None,
+        scan_mode: DependencyScanMode = DependencyScanMode.AUTO,
+    ):
+        """
+        Collect all dependencies recursively of the given unreal assets.
+        The dependencies shared by the assets are walked and returned only once.
+
+        :param asset_paths: Unreal paths of the assets to find dependencies, e.g. [/Game/Sequences/MyLevelSequence, /Game/Maps/MyLevel]
+        :type asset_paths: list[str]
+        :param dependency_options: Dataclass containing options for search dependency
+        :type dependency_options: DependencySearchOptions
+        :param filter_method: Method used to filter the found dependencies, for example, dependencies only in Game(Content) folder
+        :type filter_method: typing.Callable, optional
+        :param on_found_dependency_callback: Method used to invoke some operations on found dependencies list, for example sync them from VCS
+        :type on_found_dependency_callback: typing.Callable, optional
+        :param scan_mode: How to rescan the Asset Registry for the found dependencies
+        :type scan_mode: DependencyScanMode
+
+        :return: List of the collected dependencies without duplicates
+        :rtype: list
+        """
         self._collected_dependencies.clear()
+        self._collected_dependency_names.clear()
+        self._dependency_options_key = json.dumps(dependency_options.as_dict(), sort_keys=True)
 
         udependency_options = unreal.AssetRegistryDependencyOptions(**dependency_options.as_dict())
 
@@ -55,79 +108,198 @@ class DependencyCollector:
             "DependencyCollector: Source control is available: {}".format(source_control_available)
         )
 
+        if scan_mode == DependencyScanMode.AUTO:
+            scan_mode = (
+                DependencyScanMode.BATCHED if source_control_available else DependencyScanMode.SKIP
+            )
+        unreal.log(f"DependencyCollector: Scan mode: {scan_mode.value}")
+
         if source_control_available:
-            if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
-                os_asset_path = os_path_from_unreal_path(asset_path) + ".*"
-                unreal.SourceControl.sync_file(os_asset_path)
-                unreal.AssetRegistryHelpers().get_asset_registry().scan_modified_asset_files(
-                    [asset_path]
-                )
-                unreal.AssetRegistryHelpers().get_asset_registry().scan_paths_synchronous(
-                    [asset_path], True, True
-                )
+            for asset_path in asset_paths:
+                if not unreal.EditorAssetLibrary.does_asset_exist(asset_path):
+                    os_asset_path = os_path_from_unreal_path(asset_path) + ".*"
+                    unreal.SourceControl.sync_file(os_asset_path)
+                    self._scan_assets([asset_path])
 
         dependencies = self._get_dependencies(
-            asset_path=asset_path,
+            asset_paths=asset_paths,
             udependency_options=udependency_options,
             filter_method=filter_method,
             on_found_dependency_callback=on_found_dependency_callback,
+            scan_mode=scan_mode,
         )
 
+        if self._dependency_cache is not None:
+            self._dependency_cache.save()
+
         return dependencies
 
     def _get_dependencies(
         self,
-        asset_path: str,
+        asset_paths: list[str],
         udependency_options: unreal.AssetRegistryDependencyOptions,
         filter_method: Optional[Callable] = None,
         on_found_dependency_callback: Optional[Callable] = None,
+        scan_mode: DependencyScanMode = DependencyScanMode.PER_ASSET,
     ):
         """
-        Inner method that gets called recursively and execute the main collecting process
+        Inner method that execute the main collecting process.
+        Iterate over the dependency graph level by level starting from the given assets,
+        so the deep asset graphs don't hit the recursion limit.
 
-        :param asset_path: Unreal path of the asset to find dependencies, e.g. /Game/Sequences/MyLevelSequence
-        :type asset_path: str
+        :param asset_paths: Unreal paths of the assets to find dependencies, e.g. [/Game/Sequences/MyLevelSequence]
+        :type asset_paths: list[str]
         :param udependency_options: Asset Registry Dependency Options (https://docs.unrealengine.com/5.2/en-US/PythonAPI/class/AssetRegistryDependencyOptions.html)
         :type udependency_options: unreal.AssetRegistryDependencyOptions
         :param filter_method: Method used to filter the found dependencies, for example, dependencies only in Game(Content) folder
         :type filter_method: typing.Callable, optional
         :param on_found_dependency_callback: Method used to invoke some operations on found dependencies list, for example sync them from VCS
         :type on_found_dependency_callback: typing.Callable, optional
+        :param scan_mode: How to rescan the Asset Registry for the found dependencies, AUTO is not resolved here
+        :type scan_mode: DependencyScanMode
 
         :return: List of dependencies
         :rtype: list
         """
 
-        dependencies_raw = asset_registry.get_dependencies(
-            package_name=asset_path, dependency_options=udependency_options
-        )
+        assets_to_process = list(asset_paths)
+
+        while assets_to_process:
+            next_assets_to_process = list()
+
+            for asset_to_process in assets_to_process:
+                dependencies = self._get_new_dependencies(
+                    asset_to_process, udependency_options, filter_method
+                )
+                if scan_mode == DependencyScanMode.PER_ASSET:
+                    self._process_found_dependencies(
+                        dependencies, on_found_dependency_callback, scan=True
+                    )
+                next_assets_to_process.extend(dependencies)
+
+            if scan_mode != DependencyScanMode.PER_ASSET and next_assets_to_process:
+                self._process_found_dependencies(
+                    next_assets_to_process,
+                    on_found_dependency_callback,
+                    scan=scan_mode == DependencyScanMode.BATCHED,
+                )
+
+            assets_to_process = next_assets_to_process
+
+        return [str(d) for d in self._collected_dependencies]
+
+    def _get_new_dependencies(
+        self,
+        asset_path: str,
+        udependency_options: unreal.AssetRegistryDependencyOptions,
+        filter_method: Optional[Callable] = None,
+    ) -> list:
+        """
+        Get the direct dependencies of the given asset that pass the filter and were not collected yet
+        and add them to the collected dependencies
+
+        :param asset_path: Unreal path of the asset to find dependencies, e.g. /Game/Sequences/MyLevelSequence
+        :type asset_path: str
+        :param udependency_options: Asset Registry Dependency Options
+        :type udependency_options: unreal.AssetRegistryDependencyOptions
+        :param filter_method: Method used to filter the found dependencies
+        :type filter_method: typing.Callable, optional
+
+        :return: List of the new dependencies
+        :rtype: list
+        """
+        dependencies_raw = self._get_direct_dependencies(asset_path, udependency_options)
 
         dependencies = list()
         if dependencies_raw:
             for dependency_raw in dependencies_raw:
-                does_confirm_filter = filter_method(dependency_raw) if filter_method else True
-                is_not_collected = dependency_raw not in self._collected_dependencies
+                dependency_name = str(dependency_raw)
+                if dependency_name in self._collected_dependency_names:
+                    continue
 
-                if does_confirm_filter and is_not_collected:
+                does_confirm_filter = filter_method(dependency_raw) if filter_method else True
+                if does_confirm_filter:
                     dependencies.append(dependency_raw)
+                    self._collected_dependency_names.add(dependency_name)
 
         if dependencies:
             self._collected_dependencies.extend(dependencies)
 
+        return dependencies
+
+    def _get_direct_dependencies(
+        self, asset_path: str, udependency_options: unreal.AssetRegistryDependencyOptions
+    ) -> list:
+        """
+        Get the direct dependencies of the given asset from the dependency cache if the asset
+        did not change, from the Asset Registry otherwise
+
+        :param asset_path: Unreal path of the asset to find dependencies, e.g. /Game/Sequences/MyLevelSequence
+        :type asset_path: str
+        :param udependency_options: Asset Registry Dependency Options
+        :type udependency_options: unreal.AssetRegistryDependencyOptions
+
+        :return: List of the direct dependencies
+        :rtype: list
+        """
+        if self._dependency_cache is not None:
+            cached_dependencies = self._dependency_cache.get(
+                asset_path, self._dependency_options_key
+            )
+            if cached_dependencies is not None:
+                return cached_dependencies
+
+        dependencies_raw = (
+            asset_registry.get_dependencies(
+                package_name=asset_path, dependency_options=udependency_options
+            )
+            or []
+        )
+
+        if self._dependency_cache is not None:
+            self._dependency_cache.set(asset_path, self._dependency_options_key, dependencies_raw)
+
+        return dependencies_raw
+
+    def _process_found_dependencies(
+        self,
+        dependencies: list,
+        on_found_dependency_callback: Optional[Callable] = None,
+        scan: bool = True,
+    ):
+        """
+        Invoke the callback on the found dependencies and rescan them in the Asset Registry
+
+        :param dependencies: List of the found dependencies
+        :type dependencies: list
+        :param on_found_dependency_callback: Method used to invoke some operations on found dependencies list, for example sync them from VCS
+        :type on_found_dependency_callback: typing.Callable, optional
+        :param scan: Rescan the dependencies in the Asset Registry if True
+        :type scan: bool
+        """
         if on_found_dependency_callback:
             unreal.log(
                 f"Execute callable {on_found_dependency_callback.__name__} on the dependencies"
             )
             on_found_dependency_callback(dependencies)
 
-        unreal.AssetRegistryHelpers().get_asset_registry().scan_modified_asset_files(dependencies)
-        unreal.AssetRegistryHelpers().get_asset_registry().scan_paths_synchronous(
-            dependencies, True, True
-        )
+        if scan:
+            # The cached dependencies of unchanged assets are used, so there is no need to rescan them
+            if self._dependency_cache is not None:
+                dependencies = [
+                    dependency
+                    for dependency in dependencies
+                    if not self._dependency_cache.is_valid(dependency, self._dependency_options_key)
+                ]
+            self._scan_assets(dependencies)
 
-        for dependency in dependencies:
-            self._get_dependencies(
-                dependency, udependency_options, filter_method, on_found_dependency_callback
-            )
+    @staticmethod
+    def _scan_assets(asset_paths: list):
+        """
+        Synchronously rescan the given assets in the Asset Registry
 
-        return [str(d) for d in self._collected_dependencies]
+        :param asset_paths: Unreal paths of the assets to rescan
+        :type asset_paths: list
+        """
+        asset_registry.scan_modified_asset_files(asset_paths)
+        asset_registry.scan_paths_synchronous(asset_paths, True, True)
@@ -2,6 +2,7 @@
 
 import os
 import unreal
+from concurrent.futures import ThreadPoolExecutor
 
 
 content_dir = unreal.Paths.project_content_dir()
@@ -68,6 +69,75 @@ def os_path_from_unreal_path(unreal_path, with_ext: bool = False):
     return os_path
 
 
+def os_paths_from_unreal_paths(unreal_paths: list[str], with_ext: bool = False) -> list[str]:
+    """
+    Convert the list of Unreal paths to OS paths, the same way as :meth:`os_path_from_unreal_path()`
+
+    if parameter with_ext is set to True, gets the asset types of all the given packages
+    with the single Asset Registry query instead of the query per asset
+
+    :param unreal_paths: Unreal Paths of the assets, e.g. [/Game/Assets/MyAsset, /Game/Maps/MyLevel]
+    :type unreal_paths: list[str]
+    :param with_ext: if True, build the paths with extension (.uasset or .umap), set asterisk "*" otherwise.
+    :type with_ext: bool
+
+    :return: the OS paths of the assets in the same order
+    :rtype: list[str]
+    """
+    os_paths = [str(unreal_path).replace("/Game/", content_dir) for unreal_path in unreal_paths]
+
+    if not with_ext:
+        return [os_path + ".*" for os_path in os_paths]
+
+    asset_registry = unreal.AssetRegistryHelpers.get_asset_registry()
+    assets_data = asset_registry.get_assets(
+        unreal.ARFilter(
+            package_names=[str(unreal_path) for unreal_path in unreal_paths],
+            include_only_on_disk_assets=True,
+        )
+    )
+
+    world_packages = set()
+    for asset_data in assets_data:
+        asset_class_name = (
+            asset_data.asset_class_path.asset_name
+            if hasattr(asset_data, "asset_class_path")
+            else asset_data.asset_class
+        )  # support older version of UE python API
+        if str(asset_class_name) == "World":
+            world_packages.add(str(asset_data.package_name))
+
+    # Packages without asset data (e.g. not in the project / on disk) get ".uasset"
+    return [
+        os_path + (".umap" if str(unreal_path) in world_packages else ".uasset")
+        for unreal_path, os_path in zip(unreal_paths, os_paths)
+    ]
+
+
+def get_existing_paths(os_paths: list[str], max_workers: int = 16) -> list[str]:
+    """
+    Filter the given OS paths that exist on the disk. Paths are checked in parallel,
+    since each check is a round-trip when the project is on the network drive.
+
+    :param os_paths: OS paths to check
+    :type os_paths: list[str]
+    :param max_workers: Number of the threads checking the paths
+    :type max_workers: int
+
+    :return: Existing paths in the same order
+    :rtype: list[str]
+    """
+    if len(os_paths) < 2:
+        return [os_path for os_path in os_paths if os.path.exists(os_path)]
+
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(os_paths)), thread_name_prefix="PathExistsCheck"
+    ) as executor:
+        exists = list(executor.map(os.path.exists, os_paths))
+
+    return [os_path for os_path, os_path_exists in zip(os_paths, exists) if os_path_exists]
+
+
 def os_abs_from_relative(os_path):
     if os.path.isabs(os_path):
         return str(os_path)
@@ -0,0 +1,201 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+import json
+import unreal
+from typing import Optional
+
+from .common import content_dir
+
+
+def get_default_dependency_cache_path() -> str:
+    """
+    Returns the path of the dependency cache file in the project's Saved folder,
+    e.g. C:/UE_project/Saved/DeadlineCloud/DependencyCache.json
+
+    :return: Dependency cache file path
+    :rtype: str
+    """
+    saved_dir = unreal.Paths.convert_relative_path_to_full(unreal.Paths.project_saved_dir())
+    return os.path.join(saved_dir, "DeadlineCloud", "DependencyCache.json").replace("\\", "/")
+
+
+class DependencyCache:
+    """
+    Persistent cache of the direct dependencies of the project packages.
+
+    Each entry is stored with the size and modification time of the package file (.uasset/.umap)
+    and is valid until the file changes. Entries are kept separately for each
+    :class:`deadline.unreal_submitter.unreal_dependency_collector.dependency_search_options.DependencySearchOptions`
+    since the options define which dependencies the Asset Registry returns.
+    Only the packages of the Game (Content) folder are cached. Entries of the deleted, renamed
+    or changed packages that were not visited since the cache was loaded are removed on save.
+    """
+
+    VERSION = 1
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Load the cache from the given file path if it exists
+
+        :param cache_path: Path of the cache file, project's Saved folder is used by default
+        :type cache_path: str, optional
+        """
+        self.cache_path = cache_path or get_default_dependency_cache_path()
+        self._entries: dict[str, dict[str, dict]] = {}
+        self._visited: set[tuple[str, str]] = set()
+        self._modified = False
+        self.load()
+
+    @staticmethod
+    def get_package_file_path(package_name: str) -> Optional[str]:
+        """
+        Returns the OS path of the file of the given package that exists on the disk
+
+        :param package_name: Unreal path of the package, e.g. /Game/Assets/MyAsset
+        :type package_name: str
+
+        :return: Package file path, None if the package is not in the Game folder or not on the disk
+        :rtype: Optional[str]
+        """
+        package_name = str(package_name)
+        if not package_name.startswith("/Game/"):
+            return None
+
+        package_path = package_name.replace("/Game/", content_dir, 1)
+        for extension in [".uasset", ".umap"]:
+            if os.path.isfile(package_path + extension):
+                return package_path + extension
+        return None
+
+    @staticmethod
+    def get_package_file_stamp(package_name: str) -> Optional[dict]:
+        """
+        Returns the size and the modification time of the given package file
+
+        :param package_name: Unreal path of the package, e.g. /Game/Assets/MyAsset
+        :type package_name: str
+
+        :return: Dictionary with the size and mtime, None if the package file is not found
+        :rtype: Optional[dict]
+        """
+        package_file_path = DependencyCache.get_package_file_path(package_name)
+        if package_file_path is None:
+            return None
+
+        stat_result = os.stat(package_file_path)
+        return {"size": stat_result.st_size, "mtime": stat_result.st_mtime_ns}
+
+    def load(self):
+        """Load the cache entries from the cache file. Start with the empty cache if the file is not valid"""
+        self._entries = {}
+        self._visited = set()
+        self._modified = False
+
+        if not os.path.isfile(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path, "r") as f:
+                cache_data = json.load(f)
+        except (OSError, ValueError) as e:
+            unreal.log_warning(f"DependencyCache: Can't read the cache {self.cache_path}: {e}")
+            return
+
+        if not isinstance(cache_data, dict) or cache_data.get("version") != self.VERSION:
+            unreal.log(f"DependencyCache: Outdated cache {self.cache_path} is ignored")
+            return
+
+        self._entries = cache_data.get("entries", {})
+
+    def remove_outdated(self):
+        """
+        Remove the entries that were not visited since the cache was loaded and whose package file
+        no longer exists or changed. Visited entries are already checked by :meth:`get`
+        or stored by :meth:`set`.
+        """
+        for options_key, entries in self._entries.items():
+            outdated = [
+                package_name
+                for package_name, entry in entries.items()
+                if (options_key, package_name) not in self._visited
+                and entry["stamp"] != self.get_package_file_stamp(package_name)
+            ]
+            for package_name in outdated:
+                del entries[package_name]
+            self._modified |= bool(outdated)
+
+    def save(self):
+        """Remove the outdated cache entries and write the cache to the cache file if it was modified"""
+        self.remove_outdated()
+        if not self._modified:
+            return
+
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+
+        # Write to the temporary file first so the interrupted write doesn't break the cache
+        tmp_cache_path = f"{self.cache_path}.tmp"
+        with open(tmp_cache_path, "w") as f:
+            json.dump({"version": self.VERSION, "entries": self._entries}, f)
+        os.replace(tmp_cache_path, self.cache_path)
+
+        self._modified = False
+
+    def is_valid(self, package_name: str, options_key: str) -> bool:
+        """
+        Check if the cached dependencies of the given package exist and its file did not change
+
+        :param package_name: Unreal path of the package, e.g. /Game/Assets/MyAsset
+        :type package_name: str
+        :param options_key: Key of the dependency search options the dependencies were found with
+        :type options_key: str
+
+        :return: True if the cache entry is valid, False otherwise
+        :rtype: bool
+        """
+        return self.get(package_name, options_key) is not None
+
+    def get(self, package_name: str, options_key: str) -> Optional[list[str]]:
+        """
+        Returns the cached direct dependencies of the given package
+
+        :param package_name: Unreal path of the package, e.g. /Game/Assets/MyAsset
+        :type package_name: str
+        :param options_key: Key of the dependency search options the dependencies were found with
+        :type options_key: str
+
+        :return: List of the dependencies, None if there is no valid cache entry
+        :rtype: Optional[list[str]]
+        """
+        entry = self._entries.get(options_key, {}).get(str(package_name))
+        if entry is None:
+            return None
+
+        if entry["stamp"] != self.get_package_file_stamp(package_name):
+            return None
+
+        self._visited.add((options_key, str(package_name)))
+        return entry["dependencies"]
+
+    def set(self, package_name: str, options_key: str, dependencies: list[str]):
+        """
+        Store the direct dependencies of the given package with the current stamp of its file.
+        Packages without the file on the disk are not stored.
+
+        :param package_name: Unreal path of the package, e.g. /Game/Assets/MyAsset
+        :type package_name: str
+        :param options_key: Key of the dependency search options the dependencies were found with
+        :type options_key: str
+        :param dependencies: Direct dependencies of the package
+        :type dependencies: list[str]
+        """
+        stamp = self.get_package_file_stamp(package_name)
+        if stamp is None:
+            return
+
+        self._entries.setdefault(options_key, {})[str(package_name)] = {
+            "stamp": stamp,
+            "dependencies": [str(d) for d in dependencies],
+        }
+        self._visited.add((options_key, str(package_name)))
+        self._modified = True
@@ -1,8 +1,25 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+from enum import Enum
 from dataclasses import dataclass, asdict
 
 
+class DependencyScanMode(Enum):
+    """
+    Defines how the Asset Registry is rescanned for the found dependencies during the collecting
+
+    AUTO - BATCHED if source control is available, SKIP otherwise
+    PER_ASSET - rescan the new dependencies of each processed asset separately
+    BATCHED - rescan all the new dependencies of the processed dependency graph level at once
+    SKIP - don't rescan, the Asset Registry already knows about all the assets on the disk
+    """
+
+    AUTO = "auto"
+    PER_ASSET = "per_asset"
+    BATCHED = "batched"
+    SKIP = "skip"
+
+
 @dataclass
 class DependencySearchOptions:
     """
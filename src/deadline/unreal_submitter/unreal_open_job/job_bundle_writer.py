@@ -0,0 +1,162 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import yaml
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator
+
+
+def _represent_str(representer: yaml.representer.SafeRepresenter, data: str) -> yaml.ScalarNode:
+    """
+    Represent the multi-line strings with the "|" style like
+    :func:`deadline.client.job_bundle.deadline_yaml_dump` does
+    """
+    if "\n" in data:
+        return representer.represent_scalar("tag:yaml.org,2002:str", data, style="|")
+    return representer.represent_scalar("tag:yaml.org,2002:str", data)
+
+
+class JobBundleDumper(yaml.SafeDumper):
+    """Pure python YAML dumper of the job bundle files"""
+
+
+JobBundleDumper.add_representer(str, _represent_str)
+
+
+if yaml.__with_libyaml__:
+
+    class CJobBundleDumper(yaml.CSafeDumper):
+        """YAML dumper of the job bundle files that uses the libyaml emitter"""
+
+    CJobBundleDumper.add_representer(str, _represent_str)
+
+
+def get_yaml_dumper(use_libyaml: bool = True) -> type:
+    """
+    Returns the YAML dumper class to write the job bundle files with
+
+    :param use_libyaml: Use the faster libyaml emitter if PyYAML is built with it
+    :type use_libyaml: bool
+
+    :return: YAML dumper class
+    :rtype: type
+    """
+    if use_libyaml and yaml.__with_libyaml__:
+        return CJobBundleDumper
+    return JobBundleDumper
+
+
+def iter_yaml_events(data: Any, dumper) -> Iterator[yaml.Event]:
+    """
+    Generate the YAML events of the given data item by item.
+    Unlike yaml.dump(), the node graph of the whole data is not built,
+    so the large lists are emitted without holding their representation in memory.
+    The dictionaries keep their order.
+
+    :param data: Dictionaries, lists and scalars to emit
+    :type data: Any
+    :param dumper: YAML dumper instance used to represent and resolve the scalars
+
+    :return: Iterator of the YAML events
+    :rtype: Iterator[yaml.Event]
+    """
+    if isinstance(data, dict):
+        yield yaml.MappingStartEvent(anchor=None, tag=None, implicit=True, flow_style=False)
+        for key, value in data.items():
+            yield from iter_yaml_events(key, dumper)
+            yield from iter_yaml_events(value, dumper)
+        yield yaml.MappingEndEvent()
+    elif isinstance(data, (list, tuple)):
+        yield yaml.SequenceStartEvent(anchor=None, tag=None, implicit=True, flow_style=False)
+        for item in data:
+            yield from iter_yaml_events(item, dumper)
+        yield yaml.SequenceEndEvent()
+    else:
+        node = dumper.represent_data(data)
+        implicit = (
+            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (True, False)),
+            node.tag == dumper.resolve(yaml.ScalarNode, node.value, (False, True)),
+        )
+        yield yaml.ScalarEvent(
+            anchor=None, tag=node.tag, implicit=implicit, value=node.value, style=node.style
+        )
+
+
+def dump_yaml(data: Any, stream, use_libyaml: bool = True, indent: int = 1):
+    """
+    Stream the given data to the stream as the YAML document
+
+    :param data: Dictionaries, lists and scalars to write
+    :type data: Any
+    :param stream: Text stream to write to, e.g. opened file
+    :param use_libyaml: Use the faster libyaml emitter if PyYAML is built with it
+    :type use_libyaml: bool
+    :param indent: Indentation of the nested items
+    :type indent: int
+    """
+    dumper = get_yaml_dumper(use_libyaml)(stream, indent=indent)
+    try:
+        dumper.emit(yaml.StreamStartEvent())
+        dumper.emit(yaml.DocumentStartEvent(explicit=False))
+        for event in iter_yaml_events(data, dumper):
+            dumper.emit(event)
+        dumper.emit(yaml.DocumentEndEvent(explicit=False))
+        dumper.emit(yaml.StreamEndEvent())
+    finally:
+        dumper.dispose()
+
+
+class JobBundleWriter:
+    """
+    Writes the job bundle files (template.yaml, parameter_values.yaml, asset_references.yaml, etc.).
+    Each file is streamed straight to the disk and the files are written concurrently.
+    """
+
+    def __init__(self, job_bundle_path: str, use_libyaml: bool = True):
+        """
+        :param job_bundle_path: Path of the job bundle directory
+        :type job_bundle_path: str
+        :param use_libyaml: Use the faster libyaml emitter if PyYAML is built with it
+        :type use_libyaml: bool
+        """
+        self.job_bundle_path = job_bundle_path
+        self.use_libyaml = use_libyaml
+
+    def write_file(self, file_name: str, data: Any) -> str:
+        """
+        Write the given data to the YAML file of the job bundle
+
+        :param file_name: Name of the file, e.g. template.yaml
+        :type file_name: str
+        :param data: Data to write
+        :type data: Any
+
+        :return: Path of the written file
+        :rtype: str
+        """
+        file_path = f"{self.job_bundle_path}/{file_name}"
+        with open(file_path, "w", encoding="utf8") as f:
+            dump_yaml(data, f, use_libyaml=self.use_libyaml)
+        return file_path
+
+    def write_files(self, files: dict[str, Any]) -> list[str]:
+        """
+        Write the given files to the job bundle concurrently.
+        Raise the first error that occurred while writing the files.
+
+        :param files: Dictionary of the file names and the data to write
+        :type files: dict[str, Any]
+
+        :return: Paths of the written files in the given order
+        :rtype: list[str]
+        """
+        if not files:
+            return []
+
+        with ThreadPoolExecutor(
+            max_workers=len(files), thread_name_prefix="JobBundleWriter"
+        ) as executor:
+            futures = [
+                executor.submit(self.write_file, file_name, data)
+                for file_name, data in files.items()
+            ]
+            return [future.result() for future in futures]
@@ -1,12 +1,13 @@
 import os
-import yaml
+import math
 import unreal
-from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any, Optional
 
 from deadline.unreal_submitter.settings import DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
+from deadline.unreal_submitter.common import get_mrq_job_frame_range
 from deadline.unreal_submitter.unreal_dependency_collector.common import os_abs_from_relative
+from deadline.unreal_submitter.unreal_open_job.template_registry import TemplateRegistry
 
 
 class HostRequirements:
@@ -112,15 +113,20 @@ class JobStep:
     Represents a OpenJob Step
     """
 
-    def __init__(self, step_template, step_settings, host_requirements, queue_manifest_path):
+    def __init__(
+        self, step_template, step_settings, host_requirements, queue_manifest_path, mrq_job=None
+    ):
         """
         Build JobStep, set its name and fill dependencies list
 
-        :param step_template: Step default template to use for this step
+        :param step_template: Step default template to use for this step. The step is modified in place,
+                              so pass the own copy, e.g. from :meth:`JobStepFactory.get_step_template()`
         :type step_template: dict
         :param step_settings: Deadline Cloud Step Setting object
+        :param mrq_job: unreal.MoviePipelineExecutorJob instance the step is built for
+        :type mrq_job: unreal.MoviePipelineExecutorJob, optional
         """
-        self._job_step = deepcopy(step_template)
+        self._job_step = step_template
 
         self._set_name(step_settings)
         self._fill_step_dependency_list(step_settings)
@@ -190,11 +196,15 @@ class CustomScriptJobStep(JobStep):
     Represents a OpenJob Step for Custom Script executing
     """
 
-    def __init__(self, step_template, step_settings, host_requirements, queue_manifest_path):
+    def __init__(
+        self, step_template, step_settings, host_requirements, queue_manifest_path, mrq_job=None
+    ):
         """
         Build JobStep, set its name, fill dependencies list and set script path parameter
         """
-        super().__init__(step_template, step_settings, host_requirements, queue_manifest_path)
+        super().__init__(
+            step_template, step_settings, host_requirements, queue_manifest_path, mrq_job
+        )
 
         self._set_script_path_parameter(os_abs_from_relative(step_settings.script.file_path))
 
@@ -241,14 +251,25 @@ class RenderJobStep(JobStep):
     Represents a OpenJob Step for Render executing
     """
 
-    def __init__(self, step_template, step_settings, host_requirements, queue_manifest_path):
+    def __init__(
+        self, step_template, step_settings, host_requirements, queue_manifest_path, mrq_job=None
+    ):
         """
-        Build JobStep, set its name, fill dependencies list and set queue manifest path parameter
+        Build JobStep, set its name, fill dependencies list and set queue manifest path parameter.
+        If the step settings define a chunk size, split the job's frame range into chunks
+        rendered by separate tasks.
         """
-        super().__init__(step_template, step_settings, host_requirements, queue_manifest_path)
+        super().__init__(
+            step_template, step_settings, host_requirements, queue_manifest_path, mrq_job
+        )
 
         self._set_queue_manifest_path_parameter(queue_manifest_path)
 
+        chunk_size = getattr(step_settings, "chunk_size", 0)
+        if chunk_size > 0 and mrq_job is not None:
+            start_frame, end_frame = get_mrq_job_frame_range(mrq_job)
+            self._set_frame_chunks(start_frame, end_frame, chunk_size)
+
     def _set_name(self, step_settings):
         """
         Override the behavior of the JobStep._set_name() method and setup name as "Render"
@@ -268,6 +289,57 @@ class RenderJobStep(JobStep):
             parameter_name="QueueManifestPath", path_value=queue_manifest_path
         )
 
+    @staticmethod
+    def get_chunk_count(start_frame: int, end_frame: int, chunk_size: int) -> int:
+        """
+        Returns the number of chunks the given frame range is split into
+
+        :param start_frame: First frame of the range (inclusive)
+        :type start_frame: int
+        :param end_frame: Last frame of the range (exclusive)
+        :type end_frame: int
+        :param chunk_size: Number of frames in the chunk
+        :type chunk_size: int
+
+        :return: Number of chunks
+        :rtype: int
+        """
+        return max(math.ceil((end_frame - start_frame) / chunk_size), 1)
+
+    def _set_frame_chunks(self, start_frame: int, end_frame: int, chunk_size: int):
+        """
+        Add "ChunkStartFrame" task parameter with the first frame of each chunk
+        and pass the chunk parameters to the run data of the step.
+
+        :param start_frame: First frame of the job (inclusive)
+        :type start_frame: int
+        :param end_frame: Last frame of the job (exclusive)
+        :type end_frame: int
+        :param chunk_size: Number of frames rendered by one task
+        :type chunk_size: int
+        """
+        chunk_count = RenderJobStep.get_chunk_count(start_frame, end_frame, chunk_size)
+        last_chunk_start_frame = start_frame + (chunk_count - 1) * chunk_size
+
+        self._job_step["parameterSpace"]["taskParameterDefinitions"].append(
+            {
+                "name": "ChunkStartFrame",
+                "type": "INT",
+                "range": f"{start_frame}-{last_chunk_start_frame}:{chunk_size}",
+            }
+        )
+
+        run_data = next(
+            embedded_file
+            for embedded_file in self._job_step["script"]["embeddedFiles"]
+            if embedded_file["name"] == "runData"
+        )
+        run_data["data"] += (
+            f"chunk_size: {chunk_size}\n"
+            f"chunk_end_frame: {end_frame}\n"
+            "chunk_start_frame: {{Task.Param.ChunkStartFrame}}\n"
+        )
+
 
 @dataclass
 class JobStepDescriptor:
@@ -286,10 +358,6 @@ class JobStepDescriptor:
 class JobStepFactory:
     """Build JobStep with the given context"""
 
-    with open(DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH) as f:
-        #: Job Step default template that contains unfilled description of the Job's steps
-        DEFAULT_JOB_STEP_TEMPLATE = yaml.safe_load(f)
-
     #: Common Step mapping list of the :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStepDescriptor`
     #: instances for the Render and CustomScript steps
     JOB_STEP_MAPPING = [
@@ -330,7 +398,8 @@ class JobStepFactory:
     @staticmethod
     def get_step_template(step_descriptor: JobStepDescriptor):
         """
-        Read the JobStep template file and get the appropriate JobStep
+        Get the copy of the appropriate JobStep from the default JobStep template,
+        parsed once by :class:`deadline.unreal_submitter.unreal_open_job.template_registry.TemplateRegistry`
 
         :param step_descriptor: :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStepDescriptor` instance
         :type step_descriptor: :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStepDescriptor`
@@ -339,15 +408,9 @@ class JobStepFactory:
         :rtype: dict
         """
 
-        step_template = next(
-            (
-                step_template
-                for step_template in JobStepFactory.DEFAULT_JOB_STEP_TEMPLATE["steps"]
-                if step_template["name"] == step_descriptor.step_type
-            ),
-            None,
+        return TemplateRegistry.get_step_template(
+            DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH, step_descriptor.step_type
         )
-        return step_template
 
     @classmethod
     def create_steps(
@@ -355,6 +418,7 @@ class JobStepFactory:
         job_settings: list[unreal.MoviePipelineSetting],
         queue_manifest_path: str,
         host_requirements,
+        mrq_job: Optional[unreal.MoviePipelineExecutorJob] = None,
     ) -> list[JobStep]:
         """
         Create the Job Steps list using the provided job settings and other parameters
@@ -364,6 +428,8 @@ class JobStepFactory:
         :param queue_manifest_path: OS path for the queue manifest file
         :type queue_manifest_path: str
         :param host_requirements: AWS Host requirements settings
+        :param mrq_job: unreal.MoviePipelineExecutorJob instance the steps are built for
+        :type mrq_job: unreal.MoviePipelineExecutorJob, optional
 
         :return: list of the :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep` instances
         :rtype: :class:`deadline.unreal_submitter.unreal_open_job.job_step.JobStep`
@@ -386,6 +452,7 @@ class JobStepFactory:
                             step_settings=script_step_setting,
                             host_requirements=host_requirements,
                             queue_manifest_path=queue_manifest_path,
+                            mrq_job=mrq_job,
                         )
                     )
 
@@ -396,6 +463,7 @@ class JobStepFactory:
                         step_settings=setting,
                         host_requirements=host_requirements,
                         queue_manifest_path=queue_manifest_path,
+                        mrq_job=mrq_job,
                     )
                 )
 
@@ -1,25 +1,29 @@
 import os
-import yaml
 import unreal
-from copy import deepcopy
 from typing import Dict, Any, List
 
-from deadline.client.job_bundle import deadline_yaml_dump, create_job_history_bundle_dir
+from deadline.client.job_bundle import create_job_history_bundle_dir
 from deadline.client.job_bundle.submission import AssetReferences
 from deadline.unreal_submitter.settings import DEFAULT_JOB_TEMPLATE_FILE_PATH
 from deadline.unreal_submitter.common import (
     get_project_directory,
     get_project_file_path,
     soft_obj_path_to_str,
+    store_content_addressed_file,
 )
 from deadline.unreal_submitter.unreal_dependency_collector.common import (
     DependencyFilters,
-    os_path_from_unreal_path,
+    get_existing_paths,
+    os_paths_from_unreal_paths,
 )
 from deadline.unreal_submitter.unreal_dependency_collector.common import os_abs_from_relative
 from deadline.unreal_submitter.unreal_dependency_collector.collector import DependencyCollector
+from deadline.unreal_submitter.unreal_dependency_collector.dependency_cache import DependencyCache
 
+from deadline.unreal_submitter.submission_history import SubmissionHistory
 from deadline.unreal_submitter.unreal_open_job.job_step import JobStep, JobStepFactory
+from deadline.unreal_submitter.unreal_open_job.job_bundle_writer import JobBundleWriter
+from deadline.unreal_submitter.unreal_open_job.template_registry import TemplateRegistry
 
 
 class JobSharedSettings:
@@ -127,10 +131,7 @@ class OpenJobDescription:
         :param manifest_path: Path to the QueueManifest file with the Job parameters
         :type manifest_path: str
         """
-        with open(DEFAULT_JOB_TEMPLATE_FILE_PATH) as f:
-            self.default_job_template = yaml.safe_load(f)
-
-        self._dependency_collector = DependencyCollector()
+        self._dependency_collector = DependencyCollector(dependency_cache=DependencyCache())
 
         self._open_job: Dict
         self._manifest_path: str
@@ -138,6 +139,7 @@ class OpenJobDescription:
         self._steps: list[JobStep] = []
         self._parameter_values_dict: Dict[Any, Any] = {}
         self._asset_references = AssetReferences()
+        self._submission_history_key = ""
         self._job_bundle_path: str
 
         self._create_open_job_from_mrq_job(mrq_job)
@@ -156,6 +158,21 @@ class OpenJobDescription:
         """
         return self._job_bundle_path
 
+    @property
+    def asset_references(self) -> AssetReferences:
+        """
+        Returns the OpenJob asset references
+        """
+        return self._asset_references
+
+    @property
+    def submission_history_key(self) -> str:
+        """
+        Returns the key of the OpenJob project and shot in the
+        :class:`deadline.unreal_submitter.submission_history.SubmissionHistory`
+        """
+        return self._submission_history_key
+
     def _create_open_job_from_mrq_job(self, mrq_job: unreal.MoviePipelineExecutorJob) -> None:
         """
         Creates an OpenJob representation from the unreal.MoviePipelineExecutorJob.
@@ -166,7 +183,7 @@ class OpenJobDescription:
         :type mrq_job: unreal.MoviePipelineExecutorJob
         """
 
-        self._open_job = deepcopy(self.default_job_template)
+        self._open_job = TemplateRegistry.get_template(DEFAULT_JOB_TEMPLATE_FILE_PATH)
         shared_settings = mrq_job.preset_overrides.job_shared_settings
 
         self._open_job["name"] = (
@@ -205,15 +222,17 @@ class OpenJobDescription:
         level_path = soft_obj_path_to_str(mrq_job.map)
         level_path = os.path.splitext(level_path)[0]
 
-        level_sequence_dependencies = self._dependency_collector.collect(
-            level_sequence_path, filter_method=DependencyFilters.dependency_in_game_folder
+        dependencies = self._dependency_collector.collect_many(
+            [level_sequence_path, level_path],
+            filter_method=DependencyFilters.dependency_in_game_folder,
         )
 
-        level_dependencies = self._dependency_collector.collect(
-            level_path, filter_method=DependencyFilters.dependency_in_game_folder
-        )
-
-        return level_sequence_dependencies + level_dependencies + [level_sequence_path, level_path]
+        collected_dependencies = set(dependencies)
+        return dependencies + [
+            asset_path
+            for asset_path in [level_sequence_path, level_path]
+            if asset_path not in collected_dependencies
+        ]
 
     def _build_parameter_values_dict(self, mrq_job: unreal.MoviePipelineExecutorJob) -> dict:
         """
@@ -281,13 +300,15 @@ class OpenJobDescription:
         :rtype: :class:`deadline.client.job_bundle.submission.AssetReferences`
         """
 
+        self._submission_history_key = SubmissionHistory.get_history_key(
+            get_project_file_path(), soft_obj_path_to_str(mrq_job.sequence)
+        )
+
         # add dependencies to attachments
-        os_dependencies = []
         job_dependencies = self._collect_mrq_job_dependencies(mrq_job)
-        for dependency in job_dependencies:
-            os_dependency = os_path_from_unreal_path(dependency, with_ext=True)
-            if os.path.exists(os_dependency):
-                os_dependencies.append(os_dependency)
+        os_dependencies = get_existing_paths(
+            os_paths_from_unreal_paths(job_dependencies, with_ext=True)
+        )
 
         self._asset_references.input_filenames.update(os_dependencies)
 
@@ -364,6 +385,7 @@ class OpenJobDescription:
                 job_settings=mrq_job.get_configuration().get_all_settings(),
                 host_requirements=preset_overrides.host_requirements,
                 queue_manifest_path=self._manifest_path,
+                mrq_job=mrq_job,
             )
             return self._steps
 
@@ -376,6 +398,8 @@ class OpenJobDescription:
     def _build_job_bundle(self) -> str:
         """
         Convert OpenJob to the bundle and write it on the disk.
+        The bundle files are streamed to the disk concurrently by
+        :class:`deadline.unreal_submitter.unreal_open_job.job_bundle_writer.JobBundleWriter`
 
         :return: OpenJob bundle path
         :rtype: str
@@ -384,14 +408,13 @@ class OpenJobDescription:
         job_bundle_path = create_job_history_bundle_dir("Unreal", self._open_job["name"])
         unreal.log(f"Job bundle path: {job_bundle_path}")
 
-        with open(job_bundle_path + "/template.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(self._open_job, f, indent=1)
-
-        with open(job_bundle_path + "/parameter_values.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(self._parameter_values_dict, f, indent=1)
-
-        with open(job_bundle_path + "/asset_references.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(self._asset_references.to_dict(), f, indent=1)
+        JobBundleWriter(job_bundle_path).write_files(
+            {
+                "template.yaml": self._open_job,
+                "parameter_values.yaml": self._parameter_values_dict,
+                "asset_references.yaml": self._asset_references.to_dict(),
+            }
+        )
 
         self._job_bundle_path = job_bundle_path
 
@@ -412,4 +435,7 @@ class OpenJobDescription:
             manifest_path,
         ) = unreal.MoviePipelineEditorLibrary.save_queue_to_manifest_file(new_queue)
         manifest_path = unreal.Paths.convert_relative_path_to_full(manifest_path)
-        self._manifest_path = manifest_path
+
+        # Editor saves every queue to the same manifest file, so keep the content-addressed copy
+        # that is not overwritten by the next job and shared by the jobs with identical manifests
+        self._manifest_path = store_content_addressed_file(manifest_path)
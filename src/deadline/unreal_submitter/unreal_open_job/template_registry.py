@@ -0,0 +1,103 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import os
+import yaml
+import threading
+from typing import Any, Optional
+
+
+def copy_template(template: Any) -> Any:
+    """
+    Copy the parsed template. Only dictionaries and lists are copied,
+    other values (strings, numbers, etc.) are immutable and shared with the source template.
+    That is much cheaper than copy.deepcopy() that tracks all the copied objects.
+
+    :param template: Parsed template or its part
+    :type template: Any
+
+    :return: Copy of the template
+    :rtype: Any
+    """
+    if isinstance(template, dict):
+        return {key: copy_template(value) for key, value in template.items()}
+    if isinstance(template, list):
+        return [copy_template(value) for value in template]
+    return template
+
+
+class TemplateRegistry:
+    """
+    Registry of the parsed OpenJob templates shared by all the jobs.
+
+    Each template file is parsed once and parsed again only if the file was modified.
+    The steps of the templates are indexed by name.
+    """
+
+    _lock = threading.Lock()
+    #: Template file path -> (file modification time, parsed template)
+    _templates: dict[str, tuple[float, dict]] = {}
+    #: Template file path -> step name -> step template
+    _steps: dict[str, dict[str, dict]] = {}
+
+    @classmethod
+    def _load(cls, template_path: str) -> dict:
+        """
+        Returns the parsed template, parse the template file if it was not parsed yet or modified
+
+        :param template_path: Path to the template file
+        :type template_path: str
+
+        :return: Shared parsed template, must not be modified
+        :rtype: dict
+        """
+        mtime = os.path.getmtime(template_path)
+        with cls._lock:
+            cached = cls._templates.get(template_path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
+            with open(template_path) as f:
+                template = yaml.safe_load(f)
+
+            cls._templates[template_path] = (mtime, template)
+            cls._steps[template_path] = {
+                step_template["name"]: step_template for step_template in template.get("steps", [])
+            }
+            return template
+
+    @classmethod
+    def get_template(cls, template_path: str) -> dict:
+        """
+        Returns the copy of the template that can be modified
+
+        :param template_path: Path to the template file
+        :type template_path: str
+
+        :return: Parsed template
+        :rtype: dict
+        """
+        return copy_template(cls._load(template_path))
+
+    @classmethod
+    def get_step_template(cls, template_path: str, step_name: str) -> Optional[dict]:
+        """
+        Returns the copy of the template's step with the given name
+
+        :param template_path: Path to the template file
+        :type template_path: str
+        :param step_name: Name of the step, for example "Render" or "CustomScript"
+        :type step_name: str
+
+        :return: Step template, None if there is no step with the given name
+        :rtype: Optional[dict]
+        """
+        cls._load(template_path)
+        step_template = cls._steps[template_path].get(step_name)
+        return copy_template(step_template) if step_template is not None else None
+
+    @classmethod
+    def clear(cls):
+        """Remove all the parsed templates"""
+        with cls._lock:
+            cls._templates.clear()
+            cls._steps.clear()
@@ -4,9 +4,11 @@ import unreal
 
 from deadline.unreal_submitter.common import soft_obj_path_to_str
 from deadline.unreal_submitter.unreal_dependency_collector.collector import DependencyCollector
+from deadline.unreal_submitter.unreal_dependency_collector.dependency_cache import DependencyCache
 from deadline.unreal_submitter.unreal_dependency_collector.common import (
     DependencyFilters,
     os_path_from_unreal_path,
+    os_paths_from_unreal_paths,
 )
 
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
@@ -22,19 +24,15 @@ class DeadlineCloudJobBundleLibraryImplementation(unreal.DeadlineCloudJobBundleL
         level_sequence_path, _ = os.path.splitext(level_sequence_path)
         level_path, _ = os.path.splitext(level_path)
 
-        dependency_collector = DependencyCollector()
+        dependency_collector = DependencyCollector(dependency_cache=DependencyCache())
         unreal.log("Level sequence: " + level_sequence_path)
         unreal.log("Level: " + level_path)
 
-        unreal_dependencies = dependency_collector.collect(
-            asset_path=level_sequence_path,
+        unreal_dependencies = dependency_collector.collect_many(
+            asset_paths=[level_sequence_path, level_path],
             filter_method=DependencyFilters.dependency_in_game_folder,
         )
 
-        unreal_dependencies += dependency_collector.collect(
-            asset_path=level_path, filter_method=DependencyFilters.dependency_in_game_folder
-        )
-
         unreal_dependencies += [level_sequence_path, level_path]
 
         unreal.log(
@@ -43,7 +41,7 @@ class DeadlineCloudJobBundleLibraryImplementation(unreal.DeadlineCloudJobBundleL
 
         unreal_dependencies = list(set(unreal_dependencies))
 
-        return [os_path_from_unreal_path(d, with_ext=True) for d in unreal_dependencies]
+        return os_paths_from_unreal_paths(unreal_dependencies, with_ext=True)
 
     @unreal.ufunction(override=True)
     def get_cpu_architectures(self):
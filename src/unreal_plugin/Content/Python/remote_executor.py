@@ -1,6 +1,9 @@
 # Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 import unreal
+from typing import Optional
+
 from deadline.unreal_submitter.submitter import UnrealSubmitter
+from deadline.unreal_submitter.submission_history import SubmissionHistory
 
 
 @unreal.uclass()
@@ -9,6 +12,9 @@ class MoviePipelineDeadlineCloudRemoteExecutor(unreal.MoviePipelineExecutorBase)
     pipeline_queue = unreal.uproperty(unreal.MoviePipelineQueue)
     job_ids = unreal.uproperty(unreal.Array(str))
 
+    # Submitter of the queue, only one queue can be executed at a time
+    unreal_submitter: Optional[UnrealSubmitter] = None
+
     @unreal.ufunction(override=True)
     def execute(self, pipeline_queue):
         unreal.log(f"Asked to execute Queue: {pipeline_queue}")
@@ -18,6 +24,16 @@ class MoviePipelineDeadlineCloudRemoteExecutor(unreal.MoviePipelineExecutorBase)
             self.on_executor_finished_impl()
             return
 
+        active_submitter = MoviePipelineDeadlineCloudRemoteExecutor.unreal_submitter
+        if active_submitter is not None and active_submitter.is_submitting:
+            message = "Previous queue is still being submitted to Deadline Cloud"
+            unreal.log_error(message)
+            unreal.EditorDialog.show_message(
+                "Submission in progress", message, unreal.AppMsgType.OK
+            )
+            self.on_executor_finished_impl()
+            return
+
         if not self.check_dirty_packages():
             return
 
@@ -33,13 +49,34 @@ class MoviePipelineDeadlineCloudRemoteExecutor(unreal.MoviePipelineExecutorBase)
 
         # TODO Custom commandline arguments
 
-        unreal_submitter = UnrealSubmitter()
+        unreal_submitter = UnrealSubmitter(submission_history=SubmissionHistory())
 
+        # Jobs are built on the game thread since they use Unreal API
         for job in self.pipeline_queue.get_jobs():
             unreal.log(f"Submitting Job `{job.job_name}` to Deadline Cloud...")
             unreal_submitter.add_job(job)
 
-        unreal_submitter.submit_jobs()
+        # Hash, upload and create the jobs in the background so the editor stays responsive
+        MoviePipelineDeadlineCloudRemoteExecutor.unreal_submitter = unreal_submitter
+        unreal_submitter.submit_jobs_in_background(
+            on_progress=self.on_submission_progress, on_finished=self.on_submission_finished
+        )
+
+    def on_submission_progress(self, progress: float, message: str):
+        self.set_status_progress(progress / 100)
+        self.set_status_message(message)
+
+    def on_submission_finished(self, job_ids: list[str]):
+        self.job_ids = job_ids
+        MoviePipelineDeadlineCloudRemoteExecutor.unreal_submitter = None
+        self.on_executor_finished_impl()
+
+    @unreal.ufunction(override=True)
+    def cancel_all_jobs(self):
+        unreal_submitter = MoviePipelineDeadlineCloudRemoteExecutor.unreal_submitter
+        if unreal_submitter is not None and unreal_submitter.is_submitting:
+            unreal.log("Canceling the Deadline Cloud jobs submission...")
+            unreal_submitter.cancel()
 
     @unreal.ufunction(override=True)
     def is_rendering(self):
@@ -15,6 +15,14 @@ class UNREALDEADLINECLOUDSERVICE_API UDeadlineCloudRenderStepSetting : public UD
 	GENERATED_BODY()
 
 public:
+	/**
+	 * Number of frames rendered by a single Render task.
+	 * When greater than zero the frame range is split into chunks that are rendered as separate tasks,
+	 * otherwise the whole frame range is rendered by one task.
+	 */
+	UPROPERTY(EditAnywhere, BlueprintReadWrite, Category = "Rendering", meta = (ClampMin = "0", UIMin = "0"))
+	int32 ChunkSize = 0;
+
 #if WITH_EDITOR
 	virtual FText GetDisplayText() const override { return NSLOCTEXT("MovieRenderPipeline", "DeadlineCloudRenderStepSettingDisplayName", "Render"); }
 #endif
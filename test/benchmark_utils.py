@@ -0,0 +1,80 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Baselines of the benchmarks (deselected by default, run them with "hatch run benchmark").
+
+A benchmark fails if it is slower than its baseline multiplied by UNREAL_BENCHMARK_THRESHOLD
+(1.5 by default) and by more than MIN_REGRESSION_SECONDS. The baselines depend on the machine,
+so store them again on the reference machine after the intended performance changes with
+UNREAL_BENCHMARK_UPDATE_BASELINES=1.
+
+The checked time is the median of the rounds of :func:`measure`, the durations reported by pytest
+include all the rounds and the setup of the benchmark.
+"""
+
+import os
+import json
+import time
+import statistics
+from typing import Any, Callable, Optional
+
+
+REGRESSION_THRESHOLD = float(os.environ.get("UNREAL_BENCHMARK_THRESHOLD", "1.5"))
+UPDATE_BASELINES = os.environ.get("UNREAL_BENCHMARK_UPDATE_BASELINES") == "1"
+#: Slowdowns below this time are the timer and scheduling noise of the benchmarks that take
+#: a few milliseconds, not regressions
+MIN_REGRESSION_SECONDS = 0.015
+
+
+class BenchmarkBaselines:
+    """Baseline times of the benchmarks stored in the JSON file"""
+
+    def __init__(self, baselines_path: str):
+        self.baselines_path = baselines_path
+        self.baselines: dict[str, float] = {}
+        if os.path.isfile(baselines_path):
+            with open(baselines_path, "r") as f:
+                self.baselines = json.load(f)
+        self.measured: dict[str, float] = {}
+
+    def check(self, name: str, seconds: float):
+        """Fail if the measured time is slower than the baseline multiplied by the threshold"""
+        self.measured[name] = round(seconds, 4)
+
+        baseline = self.baselines.get(name)
+        print(f"{name}: {seconds:.4f}s, baseline: {baseline if baseline is not None else '-'}")
+        if baseline is None or UPDATE_BASELINES:
+            return
+
+        assert (
+            seconds <= baseline * REGRESSION_THRESHOLD
+            or seconds - baseline < MIN_REGRESSION_SECONDS
+        ), (
+            f"{name} took {seconds:.4f}s, it is more than {REGRESSION_THRESHOLD} times slower "
+            f"than the baseline {baseline:.4f}s"
+        )
+
+    def save(self):
+        """Store the measured times as the new baselines"""
+        self.baselines.update(self.measured)
+        with open(self.baselines_path, "w") as f:
+            json.dump(dict(sorted(self.baselines.items())), f, indent=4)
+            f.write("\n")
+
+
+def measure(
+    func: Callable[[], Any], rounds: int = 5, setup: Optional[Callable[[], Any]] = None
+) -> tuple[float, Any]:
+    """
+    Returns the median time of the given function over the rounds and its last result.
+    The setup is called before each round and is not measured.
+    """
+    times = []
+    result = None
+    for _ in range(rounds):
+        if setup is not None:
+            setup()
+        start_time = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start_time)
+    return statistics.median(times), result
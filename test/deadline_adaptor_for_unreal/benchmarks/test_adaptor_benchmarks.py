@@ -0,0 +1,152 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Benchmarks of the fixed overhead the UnrealAdaptor adds to each task. The real adaptor,
+AdaptorServer and UnrealClient run end-to-end with the fake UnrealEditor-Cmd, see
+:mod:`..fake_editor`, so the measured times don't include Unreal itself.
+
+The benchmarks are deselected by default, run them with:
+
+    hatch run benchmark
+
+The number of tasks run in the session is set by UNREAL_ADAPTOR_BENCHMARK_TASKS (20 by default).
+Each metric is compared with its baseline from baselines.json, see :mod:`...benchmark_utils`.
+"""
+
+import os
+import time
+from typing import Optional
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
+from openjd.adaptor_runtime_client import Action
+
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealAdaptor
+
+from ...benchmark_utils import UPDATE_BASELINES, BenchmarkBaselines
+from ..fake_editor import FAKE_EDITOR_SUPPORTED, fake_unreal_editor_on_path, scripted_task_run_data
+
+
+pytestmark = [
+    pytest.mark.benchmark,
+    pytest.mark.skipif(not FAKE_EDITOR_SUPPORTED, reason="Fake UnrealEditor-Cmd is POSIX only"),
+]
+
+BASELINES_PATH = f"{os.path.dirname(__file__)}/baselines.json"
+
+TASKS_COUNT = int(os.environ.get("UNREAL_ADAPTOR_BENCHMARK_TASKS", "20"))
+
+
+class TimedActionsQueue(ActionsQueue):
+    """ActionsQueue that records when the actions are enqueued and taken by the UnrealClient"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.enqueued: list[tuple[str, float]] = []
+        self.dequeued: list[tuple[str, float]] = []
+
+    def enqueue_action(self, a: Action, front: bool = False) -> None:
+        self.enqueued.append((a.name, time.perf_counter()))
+        super().enqueue_action(a, front=front)
+
+    def dequeue_action(self) -> Optional[Action]:
+        action = super().dequeue_action()
+        if action is not None:
+            self.dequeued.append((action.name, time.perf_counter()))
+        return action
+
+    def last_enqueued(self, name: str) -> float:
+        return next(t for action_name, t in reversed(self.enqueued) if action_name == name)
+
+
+def percentile(values: list[float], percent: int) -> float:
+    """Returns the nearest-rank percentile of the given values"""
+    ordered = sorted(values)
+    return ordered[max(0, -(-len(ordered) * percent // 100) - 1)]
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    benchmark_baselines = BenchmarkBaselines(BASELINES_PATH)
+    yield benchmark_baselines
+    if UPDATE_BASELINES:
+        benchmark_baselines.save()
+
+
+def test_task_overhead(tmp_path, baselines: BenchmarkBaselines):
+    """
+    Session of many tasks and the failed task: on_start, first action taken by the UnrealClient,
+    run_script round trip, on_run return latency after the completion and on_cleanup
+    """
+    adaptor = UnrealAdaptor(
+        {
+            "project_path": str(tmp_path / "FakeProject.uproject"),
+            "log_policy": {"full_log_file": str(tmp_path / "UnrealEditor.log.gz")},
+        }
+    )
+    actions_queue = TimedActionsQueue()
+    adaptor._action_queue = actions_queue
+
+    # Task is completed by the event or by the log, whichever comes first
+    completed_times: dict[int, float] = {}
+    complete_task = adaptor._complete_task
+
+    def timed_complete_task(task_id: int):
+        if task_id == adaptor._task_id:
+            completed_times.setdefault(task_id, time.perf_counter())
+        complete_task(task_id)
+
+    adaptor._complete_task = timed_complete_task  # type: ignore[method-assign]
+
+    round_trips: list[float] = []
+    return_latencies: list[float] = []
+    on_run_times: list[float] = []
+
+    with (
+        fake_unreal_editor_on_path(str(tmp_path / "bin")),
+        patch.object(UnrealAdaptor, "_get_deadline_telemetry_client", return_value=MagicMock()),
+    ):
+        start_time = time.perf_counter()
+        adaptor.on_start()
+        on_start_seconds = time.perf_counter() - start_time
+
+        try:
+            for _ in range(TASKS_COUNT):
+                run_start_time = time.perf_counter()
+                adaptor.on_run(scripted_task_run_data())
+                run_end_time = time.perf_counter()
+
+                completed_time = completed_times[adaptor._task_id]
+                on_run_times.append(run_end_time - run_start_time)
+                round_trips.append(completed_time - actions_queue.last_enqueued("run_script"))
+                return_latencies.append(run_end_time - completed_time)
+
+            first_action_name, first_action_time = actions_queue.dequeued[0]
+
+            run_start_time = time.perf_counter()
+            with pytest.raises(RuntimeError, match="Scripted error"):
+                adaptor.on_run(scripted_task_run_data(error="Scripted error"))
+            error_on_run_seconds = time.perf_counter() - run_start_time
+        finally:
+            cleanup_start_time = time.perf_counter()
+            adaptor.on_cleanup()
+            on_cleanup_seconds = time.perf_counter() - cleanup_start_time
+
+    assert first_action_name == "set_handler"
+    assert len(completed_times) == TASKS_COUNT
+    assert not adaptor._unreal_is_running
+
+    # The first task includes the editor startup, the rest show the steady per-task overhead
+    baselines.check("on_start", on_start_seconds)
+    baselines.check("first_action", first_action_time - start_time)
+    baselines.check("first_on_run", on_run_times[0])
+    baselines.check("on_run[p50]", percentile(on_run_times[1:], 50))
+    baselines.check("on_run[p95]", percentile(on_run_times[1:], 95))
+    baselines.check("run_script_round_trip[p50]", percentile(round_trips[1:], 50))
+    baselines.check("run_script_round_trip[p95]", percentile(round_trips[1:], 95))
+    baselines.check("on_run_return_latency[p50]", percentile(return_latencies, 50))
+    baselines.check("on_run_return_latency[p95]", percentile(return_latencies, 95))
+    baselines.check("error_on_run", error_on_run_seconds)
+    baselines.check("on_cleanup", on_cleanup_seconds)
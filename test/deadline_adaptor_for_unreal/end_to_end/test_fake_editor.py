@@ -0,0 +1,87 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import gzip
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealAdaptor import server
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealAdaptor
+
+from ..fake_editor import FAKE_EDITOR_SUPPORTED, fake_unreal_editor_on_path, scripted_task_run_data
+
+
+@pytest.mark.skipif(not FAKE_EDITOR_SUPPORTED, reason="Fake UnrealEditor-Cmd is POSIX only")
+class TestUnrealAdaptorWithFakeEditor:
+    def test_session(self, tmp_path) -> None:
+        # GIVEN
+        full_log_file = tmp_path / "UnrealEditor.log.gz"
+        adaptor = UnrealAdaptor(
+            {
+                "project_path": str(tmp_path / "FakeProject.uproject"),
+                "log_policy": {"full_log_file": str(full_log_file)},
+            }
+        )
+
+        with (
+            fake_unreal_editor_on_path(str(tmp_path / "bin")),
+            patch.object(UnrealAdaptor, "_get_deadline_telemetry_client", return_value=MagicMock()),
+            patch.object(UnrealAdaptor, "update_status") as mock_update_status,
+        ):
+            # WHEN
+            adaptor.on_start()
+            try:
+                adaptor.on_run(scripted_task_run_data(progress_steps=2))
+                # THEN
+                assert adaptor._client_events_enabled
+                mock_update_status.assert_any_call(progress=50.0)
+                mock_update_status.assert_called_with(progress=100)
+
+                # The error of the task doesn't break the session
+                with pytest.raises(RuntimeError, match="Scripted error"):
+                    adaptor.on_run(scripted_task_run_data(error="Scripted error"))
+                adaptor.on_run(scripted_task_run_data())
+            finally:
+                adaptor.on_cleanup()
+
+        assert not adaptor._unreal_is_running
+        with gzip.open(full_log_file, "rt", encoding="utf-8") as f:
+            assert "STDOUT: LogPython: Custom Step Executor: Progress: 50.0" in f.read()
+
+    @pytest.mark.skipif(not server.CLIENT_EVENTS_SUPPORTED, reason="Event endpoint is not defined")
+    def test_session_without_event_channel(self, tmp_path) -> None:
+        """
+        Tests that the tasks are completed by matching the Unreal log when the adaptor server
+        rejects the events, like the named pipe server on Windows does
+        """
+        # GIVEN
+        adaptor = UnrealAdaptor(
+            {
+                "project_path": str(tmp_path / "FakeProject.uproject"),
+                "log_policy": {"full_log_file": ""},
+            }
+        )
+
+        with (
+            fake_unreal_editor_on_path(str(tmp_path / "bin")),
+            # PUT /event is not routed to the endpoint, so the server responds 404 Not Found
+            patch.object(server.ClientEventEndpoint, "path", "/unrouted"),
+            patch.object(UnrealAdaptor, "_get_deadline_telemetry_client", return_value=MagicMock()),
+            patch.object(UnrealAdaptor, "update_status") as mock_update_status,
+        ):
+            # WHEN
+            adaptor.on_start()
+            try:
+                adaptor.on_run(scripted_task_run_data(progress_steps=2))
+                # THEN
+                assert not adaptor._client_events_enabled
+                mock_update_status.assert_any_call(progress=50)
+                mock_update_status.assert_called_with(progress=100)
+
+                with pytest.raises(RuntimeError, match="Scripted error"):
+                    adaptor.on_run(scripted_task_run_data(error="Scripted error"))
+                adaptor.on_run(scripted_task_run_data())
+            finally:
+                adaptor.on_cleanup()
+
+        assert not adaptor._unreal_is_running
@@ -0,0 +1,77 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Fake UnrealEditor-Cmd to run the UnrealAdaptor end-to-end without Unreal:
+the adaptor launches the fake editor from PATH, the fake editor runs the real UnrealClient
+that polls the real AdaptorServer, and the custom step runs the scripted task.
+"""
+
+import os
+import sys
+import stat
+from contextlib import contextmanager
+from typing import Iterator
+from unittest.mock import patch
+
+
+FAKE_EDITOR_DIRECTORY = os.path.dirname(os.path.abspath(__file__)).replace("\\", "/")
+FAKE_EDITOR_SCRIPT_PATH = f"{FAKE_EDITOR_DIRECTORY}/editor.py"
+SCRIPTED_TASK_PATH = f"{FAKE_EDITOR_DIRECTORY}/scripted_task.py"
+
+#: The launcher is a shell script, Windows doesn't start it by the name without the extension
+FAKE_EDITOR_SUPPORTED = os.name == "posix"
+
+
+def scripted_task_run_data(
+    progress_steps: int = 4, step_seconds: float = 0.0, error: str = ""
+) -> dict:
+    """
+    Returns the run data of the custom step that runs the scripted task
+
+    :param progress_steps: Number of the progress lines
+    :param step_seconds: Time to wait before each progress line
+    :param error: Error message to fail the task with, the task completes if empty
+    """
+    return {
+        "handler": "custom",
+        "script_path": SCRIPTED_TASK_PATH,
+        "script_args": {
+            "progress_steps": progress_steps,
+            "step_seconds": step_seconds,
+            "error": error,
+        },
+    }
+
+
+def create_fake_editor_launcher(bin_directory: str) -> str:
+    """
+    Create the UnrealEditor-Cmd executable in the given directory
+    that starts the fake editor with the current Python
+
+    :param bin_directory: Directory to create the launcher in
+
+    :return: Path of the launcher
+    """
+    os.makedirs(bin_directory, exist_ok=True)
+    launcher_path = os.path.join(bin_directory, "UnrealEditor-Cmd")
+    with open(launcher_path, "w") as f:
+        f.write(f'#!/bin/sh\nexec "{sys.executable}" "{FAKE_EDITOR_SCRIPT_PATH}" "$@"\n')
+    os.chmod(launcher_path, os.stat(launcher_path).st_mode | stat.S_IXUSR | stat.S_IXGRP)
+    return launcher_path
+
+
+@contextmanager
+def fake_unreal_editor_on_path(bin_directory: str) -> Iterator[str]:
+    """
+    Put the fake UnrealEditor-Cmd on PATH. The environment variables set by the adaptor
+    (PYTHONPATH, UNREAL_ADAPTOR_SOCKET_PATH, etc.) are restored on exit.
+
+    :param bin_directory: Directory to create the launcher in
+
+    :return: Path of the launcher
+    """
+    launcher_path = create_fake_editor_launcher(bin_directory)
+    with patch.dict(
+        os.environ, {"PATH": f"{bin_directory}{os.pathsep}{os.environ.get('PATH', '')}"}
+    ):
+        yield launcher_path
@@ -0,0 +1,126 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Stand-in for UnrealEditor-Cmd that runs the UnrealClient without Unreal.
+
+It takes the same command line the UnrealAdaptor launches the editor with, installs the fake
+unreal module that prints the logs the way "-stdout" does and runs the "py <script>" of
+"-execcmds". Then it ticks the registered PythonGameThreadExecutor classes like the editor's
+game thread does until the client requests the editor to quit.
+"""
+
+import os
+import sys
+import time
+import runpy
+import signal
+from types import ModuleType, SimpleNamespace
+
+
+#: Time between the engine ticks, the editor runs about 60 frames per second
+TICK_SECONDS = float(os.environ.get("FAKE_UNREAL_EDITOR_TICK_SECONDS", 1 / 60))
+
+
+class FakeUnrealEngine(ModuleType):
+    """The unreal module of the editor process"""
+
+    class PythonGameThreadExecutor:
+        pass
+
+    class AssetRegistry:
+        @staticmethod
+        def is_loading_assets() -> bool:
+            return False
+
+    def __init__(self):
+        super().__init__("unreal")
+        self.quit_requested = False
+        self.game_thread_executors: list[type] = []
+        self.AssetRegistryHelpers = SimpleNamespace(get_asset_registry=lambda: self.AssetRegistry)
+        self.SystemLibrary = SimpleNamespace(quit_editor=self.quit_editor)
+
+    def __getattr__(self, name: str) -> type:
+        # The render step handler subclasses and annotates the MRQ classes at import,
+        # the fake editor doesn't render so the placeholder classes are enough
+        if not name[:1].isupper():
+            raise AttributeError(f"module 'unreal' has no attribute '{name}'")
+        placeholder_class = type(name, (), {})
+        setattr(self, name, placeholder_class)
+        return placeholder_class
+
+    @staticmethod
+    def log(message):
+        print(f"LogPython: {message}", flush=True)
+
+    @staticmethod
+    def log_warning(message):
+        print(f"LogPython: Warning: {message}", flush=True)
+
+    @staticmethod
+    def log_error(message):
+        print(f"LogPython: Error: {message}", flush=True)
+
+    def uclass(self):
+        def register(cls):
+            if issubclass(cls, self.PythonGameThreadExecutor):
+                self.game_thread_executors.append(cls)
+            return cls
+
+        return register
+
+    @staticmethod
+    def ufunction(**kwargs):
+        return lambda func: func
+
+    @staticmethod
+    def uproperty(property_type, **kwargs):
+        return property_type()
+
+    def quit_editor(self):
+        self.quit_requested = True
+
+
+def get_python_commands(args: list[str]) -> list[str]:
+    """Returns the script paths of the "py" commands of the -execcmds argument"""
+    scripts = []
+    for arg in args:
+        if not arg.startswith("-execcmds="):
+            continue
+        for command in arg[len("-execcmds=") :].split(","):
+            command = command.strip()
+            if command.startswith("py "):
+                scripts.append(command[len("py ") :].strip())
+    return scripts
+
+
+def main(args: list[str]) -> int:
+    unreal = FakeUnrealEngine()
+    sys.modules["unreal"] = unreal
+
+    print(f"LogInit: Fake UnrealEditor-Cmd {' '.join(args)}", flush=True)
+    for script in get_python_commands(args):
+        runpy.run_path(script, run_name="__main__")
+
+    executors = [executor_class() for executor_class in unreal.game_thread_executors]
+    if not executors:
+        print("LogPython: Error: No game thread executor was registered", flush=True)
+        return 1
+
+    # The client handles SIGTERM only if it was created before, keep the default handler otherwise
+    if signal.getsignal(signal.SIGTERM) is signal.SIG_DFL:
+        signal.signal(signal.SIGTERM, lambda signum, frame: unreal.quit_editor())
+
+    last_tick_time = time.monotonic()
+    while not unreal.quit_requested:
+        time.sleep(TICK_SECONDS)
+        tick_time = time.monotonic()
+        for executor in executors:
+            executor.execute(tick_time - last_tick_time)
+        last_tick_time = tick_time
+
+    print("LogExit: Exiting.", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,18 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""Custom step script that emits the scripted progress and completes or fails"""
+
+import time
+
+import unreal
+
+
+def main(progress_steps: int = 4, step_seconds: float = 0.0, error: str = ""):
+    for step in range(1, progress_steps + 1):
+        time.sleep(step_seconds)
+        unreal.log(f"Custom Step Executor: Progress: {step / progress_steps * 100}")
+
+    if error:
+        raise RuntimeError(error)
+
+    return "done"
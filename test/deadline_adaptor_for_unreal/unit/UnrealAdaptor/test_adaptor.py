@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
+import os
 import re
-from unittest.mock import Mock, PropertyMock, patch
+import json
+import tempfile
+import threading
+import time
+from unittest.mock import MagicMock, Mock, PropertyMock, call, patch
 
+import psutil
 import pytest
 import jsonschema  # type: ignore
 
 
 from deadline.unreal_adaptor.UnrealAdaptor import UnrealAdaptor
-from deadline.unreal_adaptor.UnrealAdaptor.adaptor import UnrealNotRunningError
+from deadline.unreal_adaptor.UnrealAdaptor.adaptor import (
+    ActivityRegexHandler,
+    UnrealNotRunningError,
+    UnrealStalledError,
+)
+from deadline.unreal_adaptor.UnrealAdaptor.common import ActivityWatchdog, get_process_snapshot
+from openjd.adaptor_runtime.app_handlers import RegexCallback
+
+
+@pytest.fixture(autouse=True)
+def full_log_directory(tmp_path, monkeypatch) -> None:
+    """Pytest Fixture to write the full Unreal logs of the started adaptors to the test directory"""
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
 
 
 @pytest.fixture()
@@ -46,12 +64,13 @@ def run_data() -> dict:
 
 
 class TestUnrealAdaptor_on_start:
+    @patch.object(UnrealAdaptor, "_unreal_client_ready", True)
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_no_error(
         self,
         mock_server: Mock,
@@ -65,13 +84,92 @@ class TestUnrealAdaptor_on_start:
         mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
 
+    @patch.object(UnrealAdaptor, "_unreal_client_ready", True)
+    @patch.dict("os.environ", {}, clear=True)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_max_retry_interval(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+    ) -> None:
+        """Tests that the max retry interval from init_data is passed to the Unreal client"""
+        # GIVEN
+        init_data["max_retry_interval"] = 0.25
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        # WHEN
+        adaptor.on_start()
+
+        # THEN
+        assert os.environ["UNREAL_CLIENT_MAX_RETRY_INTERVAL"] == "0.25"
+
+    @patch.object(UnrealAdaptor, "_unreal_client_ready", True)
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_startup_timings(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        tmp_path,
+    ) -> None:
+        """Tests that the startup phases are recorded once and written to the startup timings file"""
+        # GIVEN
+        startup_timings_file = tmp_path / "startup-timings.json"
+        init_data["startup_timings_file"] = str(startup_timings_file)
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        startup_phase_regex = adaptor._get_regex_callbacks()[-1].regex_list[0]
+
+        # WHEN
+        adaptor.on_start()
+        for phase in ["first_client_poll", "asset_registry_ready", "handler_set", "handler_set"]:
+            match = startup_phase_regex.search(f"LogPython: UnrealClient: Startup phase: {phase}")
+            assert match is not None
+            adaptor._handle_startup_phase(match)
+
+        # THEN
+        expected_phases = [
+            "init_data_validated",
+            "server_socket_ready",
+            "editor_process_spawned",
+            "first_client_poll",
+            "asset_registry_ready",
+            "handler_set",
+        ]
+        timings = json.loads(startup_timings_file.read_text())
+        assert [phase["name"] for phase in timings["phases"]] == expected_phases
+        assert all(phase["duration"] <= phase["elapsed"] for phase in timings["phases"])
+        startup_events = [
+            call.kwargs["event_details"]["name"]
+            for call in mock_telemetry_client.return_value.record_event.call_args_list
+            if call.kwargs["event_type"].endswith("startup_phase")
+        ]
+        assert startup_events == expected_phases
+
+    @patch.object(UnrealAdaptor, "_unreal_client_ready", True)
     @patch("time.sleep")
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test__wait_for_socket(
         self,
         mock_server: Mock,
@@ -95,8 +193,30 @@ class TestUnrealAdaptor_on_start:
         # THEN
         assert mock_sleep.call_count == 3
 
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.CLIENT_EVENTS_UNAVAILABLE_REASON", "reason"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.CLIENT_EVENTS_SUPPORTED", False)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_client_events_unavailable(
+        self, mock_server: Mock, init_data: dict, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Tests that the adaptor warns that the tasks are finished by the log matching"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+
+        # WHEN
+        adaptor._start_unreal_server_thread()
+
+        # THEN
+        assert (
+            "UnrealClient events are not available: reason. "
+            "Progress and completion of the tasks are matched in the Unreal log"
+        ) in caplog.messages
+
     @patch("threading.Thread")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_server_init_fail(self, mock_server: Mock, mock_thread: Mock, init_data: dict) -> None:
         """Tests that an error is raised if no socket becomes available"""
         # GIVEN
@@ -120,7 +240,7 @@ class TestUnrealAdaptor_on_start:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_unreal_init_timeout(
         self,
         mock_server: Mock,
@@ -158,7 +278,7 @@ class TestUnrealAdaptor_on_start:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_unreal_init_fail(
         self,
         mock_server: Mock,
@@ -184,10 +304,81 @@ class TestUnrealAdaptor_on_start:
         )
         assert str(exc_info.value) == error_msg
 
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_unreal_startup_stalled(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+    ) -> None:
+        """
+        Tests that on_start terminates Unreal and fails fast if Unreal does not output anything
+        longer than the startup stall timeout before the UnrealClient is ready
+        """
+        # GIVEN
+        init_data["startup_stall_timeout"] = 0.1
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        mock_logging_subprocess.return_value.pid = 1234
+
+        with pytest.raises(UnrealStalledError) as exc_info:
+            # WHEN
+            adaptor.on_start()
+
+        # THEN
+        assert str(exc_info.value) == "Unreal stalled during startup: no output for 0.1 seconds"
+        mock_logging_subprocess.return_value.terminate.assert_called_once_with(grace_time_s=0)
+        stall_events = [
+            call.kwargs["event_details"]
+            for call in mock_telemetry_client.return_value.record_event.call_args_list
+            if call.kwargs["event_type"].endswith("stall")
+        ]
+        assert [event["phase"] for event in stall_events] == ["startup"]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
+    def test_unreal_client_ready(
+        self,
+        mock_server: Mock,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+    ) -> None:
+        """Tests that on_start waits until the UnrealClient reports that it reached the server"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        mock_server.return_value.server_path = "/tmp/9999"
+        startup_phase_regex = adaptor._get_regex_callbacks()[-1].regex_list[0]
+        match = startup_phase_regex.search(
+            "LogPython: UnrealClient: Startup phase: first_client_poll"
+        )
+        assert match is not None
+        client_poll = threading.Timer(0.2, adaptor._handle_startup_phase, args=(match,))
+
+        # WHEN
+        client_poll.start()
+        adaptor.on_start()
+
+        # THEN
+        assert adaptor._startup_timings.has_phase("first_client_poll")
+        mock_logging_subprocess.return_value.terminate.assert_not_called()
+
     @patch.object(UnrealAdaptor, "_unreal_is_running", False)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_init_data_wrong_schema(
         self,
         mock_server: Mock,
@@ -210,6 +401,8 @@ class TestUnrealAdaptor_on_start:
         assert error_msg in exc_info.value.message
 
 
+# The mocked Unreal doesn't output the startup phases of the UnrealClient
+@patch.object(UnrealAdaptor, "_unreal_client_ready", True)
 class TestUnrealAdaptor_on_run:
     @patch("time.sleep")
     @patch(
@@ -217,7 +410,7 @@ class TestUnrealAdaptor_on_run:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_run(
         self,
         mock_server: Mock,
@@ -232,16 +425,102 @@ class TestUnrealAdaptor_on_run:
         # GIVEN
         adaptor = UnrealAdaptor(init_data)
         mock_server.return_value.server_path = "/tmp/9999"
+        # Keep the mocked Unreal process alive, so the exit watcher does not finish the run
+        unreal_exited = threading.Event()
+        mock_logging_subprocess.return_value.wait.side_effect = unreal_exited.wait
         # First side_effect value consumed by setter
         is_rendering_mock = PropertyMock(side_effect=[None, True, False])
         UnrealAdaptor._is_rendering = is_rendering_mock
         adaptor.on_start()
 
         # WHEN
-        adaptor.on_run(run_data)
+        with (
+            patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01),
+            patch.object(adaptor._action_queue, "enqueue_action") as mock_enqueue_action,
+        ):
+            adaptor.on_run(run_data)
+        unreal_exited.set()
+
+        # THEN
+        # Only the actions of the task are sent, the render is not interleaved with wait_result
+        assert [c.args[0].name for c in mock_enqueue_action.call_args_list] == [
+            "set_handler",
+            "run_script",
+        ]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_on_run_returns_on_complete(
+        self,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """Tests that on_run returns as soon as the render is complete"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_client = mock_logging_subprocess.return_value
+        complete_regex = adaptor._get_regex_callbacks()[1].regex_list[0]
+        match = complete_regex.search("Render Executor: Rendering is complete")
+        complete_timer = threading.Timer(0.1, adaptor._handle_complete, args=(match,))
+
+        # WHEN
+        with (
+            patch.object(UnrealAdaptor, "_is_rendering", False),
+            patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 30),
+            patch.object(adaptor, "update_status") as mock_update_status,
+        ):
+            start_time = time.monotonic()
+            complete_timer.start()
+            adaptor.on_run(run_data)
+            elapsed_time = time.monotonic() - start_time
+
+        # THEN
+        assert elapsed_time < 5
+        mock_update_status.assert_called_once_with(progress=100)
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_on_run_reused_after_error(
+        self,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """
+        Tests that the error of the previous task does not fail the next one
+        when the Unreal session is reused in the daemon mode
+        """
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        adaptor._unreal_client = mock_logging_subprocess.return_value
+        adaptor._exc_info = RuntimeError("Unreal Encountered an Error: previous task")
+        complete_regex = adaptor._get_regex_callbacks()[1].regex_list[0]
+        match = complete_regex.search("Render Executor: Rendering is complete")
+        complete_timer = threading.Timer(0.1, adaptor._handle_complete, args=(match,))
+
+        # WHEN
+        with (
+            patch.object(UnrealAdaptor, "_is_rendering", False),
+            patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 30),
+            patch.object(adaptor, "update_status") as mock_update_status,
+        ):
+            complete_timer.start()
+            adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(1)
+        assert adaptor._exc_info is None
+        mock_update_status.assert_called_once_with(progress=100)
 
     @patch("time.sleep")
     @patch(
@@ -257,7 +536,7 @@ class TestUnrealAdaptor_on_run:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_run_render_fail(
         self,
         mock_server: Mock,
@@ -280,23 +559,176 @@ class TestUnrealAdaptor_on_run:
         adaptor.on_start()
 
         # WHEN
-        with pytest.raises(RuntimeError) as exc_info:
+        with (
+            patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01),
+            pytest.raises(RuntimeError) as exc_info,
+        ):
             adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(1)
         assert str(exc_info.value) == (
             "Unreal exited early and did not render successfully, please check render logs. "
             "Exit code 1"
         )
 
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
+    def test_on_run_stalled(
+        self,
+        mock_logging_subprocess: Mock,
+        mock_actions_queue: Mock,
+        mock_telemetry_client: Mock,
+        init_data: dict,
+        run_data: dict,
+    ) -> None:
+        """
+        Tests that on_run terminates Unreal and fails fast if Unreal does not output anything
+        longer than the render stall timeout
+        """
+        # GIVEN
+        init_data["render_stall_timeout"] = 0.1
+        adaptor = UnrealAdaptor(init_data)
+        mock_logging_subprocess.return_value.pid = 1234
+        adaptor._unreal_client = mock_logging_subprocess.return_value
+        adaptor._activity_watchdog.touch("LogRenderer: Compiling shaders")
+
+        # WHEN
+        with (
+            patch.object(UnrealAdaptor, "_is_rendering", True),
+            patch.object(adaptor, "_WAIT_RESULT_INTERVAL_SECONDS", 0.01),
+            pytest.raises(UnrealStalledError) as exc_info,
+        ):
+            adaptor.on_run(run_data)
+
+        # THEN
+        assert str(exc_info.value) == "Unreal stalled during render: no output for 0.1 seconds"
+        mock_logging_subprocess.return_value.terminate.assert_called_once_with(grace_time_s=0)
+        mock_telemetry_client.return_value.record_event.assert_called_once()
+        event_details = mock_telemetry_client.return_value.record_event.call_args.kwargs[
+            "event_details"
+        ]
+        assert event_details["phase"] == "render"
+        assert event_details["process"]["pid"] == 1234
+        assert event_details["last_line"] == "LogRenderer: Compiling shaders"
+
+    def test_output_restarts_stall_timer(self) -> None:
+        """Tests that each output line of Unreal is recorded before it is matched by the callbacks"""
+        # GIVEN
+        watchdog = ActivityWatchdog(max_lines=2)
+        callback = Mock()
+        handler = ActivityRegexHandler(
+            [RegexCallback([re.compile("Progress")], callback)], watchdog
+        )
+        time.sleep(0.05)
+        assert watchdog.is_stalled(0.01)
+
+        # WHEN
+        for line in ["LogInit: Display", "LogPython: Progress", "LogPython: Idle"]:
+            handler.emit(Mock(msg=line))
+
+        # THEN
+        assert not watchdog.is_stalled(0.01)
+        assert watchdog.last_lines == ["LogPython: Progress", "LogPython: Idle"]
+        callback.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "handler_name, line, callback_name",
+        [
+            ("render", "LogPython: Render Executor: Progress: 10.0 frame=1/10", "_handle_progress"),
+            ("render", "LogPython: Render Executor: Rendering is complete", "_handle_complete"),
+            (
+                "render",
+                "LogMovieRenderPipeline: Render queue finished 1 jobs in 12.5 seconds",
+                "_handle_complete",
+            ),
+            (
+                "render",
+                "LogPython: Render Executor: Frame summary: frames=10 mean=1.250",
+                "_handle_summary",
+            ),
+            ("render", "LogPython: Error: Traceback", "_handle_error"),
+            ("render", "LogPython: ValueError Exception: failed", "_handle_error"),
+            ("custom", "LogPython: Custom Step Executor: Progress: 50.0", "_handle_progress"),
+            ("custom", "LogPython: Custom Step Executor: Complete: done", "_handle_complete"),
+            ("custom", "LogPython: Custom Step Executor: Error: failed", "_handle_error"),
+            ("custom", "LogPython: ValueError Exception: failed", "_handle_error"),
+            (
+                "custom",
+                "LogPython: UnrealClient: Startup phase: handler_set",
+                "_handle_startup_phase",
+            ),
+        ],
+    )
+    def test_log_handler_markers(
+        self, init_data: dict, handler_name: str, line: str, callback_name: str
+    ) -> None:
+        """Tests that the lines matched by the regex patterns of the step handlers pass the prefilter"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        callback = Mock()
+        with patch.object(adaptor, callback_name, callback):
+            handler = adaptor._create_log_handler()
+        handler.set_step_handler(handler_name)
+
+        # WHEN
+        handler.emit(Mock(msg=line))
+
+        # THEN
+        callback.assert_called_once()
+        assert handler.stats.matches == 1
+
+    def test_log_handler_step_handler(self, init_data: dict) -> None:
+        """Tests that only the lines with the markers are matched against the active step handler patterns"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_callback = Mock()
+        with patch.object(adaptor, "_handle_progress", progress_callback):
+            handler = adaptor._create_log_handler()
+        handler.set_step_handler("custom")
+
+        # WHEN
+        for line in [
+            "LogShaderCompilers: Display: Compiling shader autogen file",
+            "LogPython: Render Executor: Progress: 10.0",
+            "LogPython: Custom Step Executor: Progress: 20.0",
+        ]:
+            handler.emit(Mock(msg=line))
+
+        # THEN
+        progress_callback.assert_called_once()
+        assert progress_callback.call_args.args[0].group(1) == "20.0"
+        assert handler.stats.lines == 3
+        assert handler.stats.candidate_lines == 1
+        # Progress, complete and error patterns of the custom step handler
+        assert handler.stats.regex_evaluations == 3
+        assert handler.stats.matches == 1
+
+    def test_log_handler_unknown_step_handler(self, init_data: dict) -> None:
+        """Tests that the patterns of all the step handlers are active for the unknown step handler"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_callback = Mock()
+        with patch.object(adaptor, "_handle_progress", progress_callback):
+            handler = adaptor._create_log_handler()
+        handler.set_step_handler("custom")
+
+        # WHEN
+        handler.set_step_handler("base")
+        handler.emit(Mock(msg="LogPython: Render Executor: Progress: 10.0"))
+
+        # THEN
+        progress_callback.assert_called_once()
+
     @patch("time.sleep")
     @patch(
         "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_run_data_wrong_schema(
         self,
         mock_server: Mock,
@@ -325,6 +757,8 @@ class TestUnrealAdaptor_on_run:
         assert error_msg in exc_info.value.message
 
 
+# The mocked Unreal doesn't output the startup phases of the UnrealClient
+@patch.object(UnrealAdaptor, "_unreal_client_ready", True)
 class TestUnrealAdaptor_on_stop:
     @patch("time.sleep")
     @patch(
@@ -332,7 +766,7 @@ class TestUnrealAdaptor_on_stop:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_stop(
         self,
         mock_server: Mock,
@@ -356,6 +790,8 @@ class TestUnrealAdaptor_on_stop:
         adaptor.on_stop()
 
 
+# The mocked Unreal doesn't output the startup phases of the UnrealClient
+@patch.object(UnrealAdaptor, "_unreal_client_ready", True)
 class TestUnrealAdaptor_on_cleanup:
     @patch("time.sleep")
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.logger")
@@ -414,7 +850,7 @@ class TestUnrealAdaptor_on_cleanup:
     )
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
     @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealSubprocessWithLogs")
-    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.AdaptorServer")
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptorServer")
     def test_on_cleanup(
         self,
         mock_server: Mock,
@@ -487,6 +923,92 @@ class TestUnrealAdaptor_on_cleanup:
         assert match is not None
         mock_update_status.assert_called_once_with(progress=expected_progress)
 
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_progress_frame_stats(self, mock_update_status: Mock, init_data: dict) -> None:
+        """Tests that the frame stats following the progress are reported as the status message"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_regex = adaptor._get_regex_callbacks()[0].regex_list[0]
+
+        # WHEN
+        match = progress_regex.search(
+            "LogPython: Render Executor: Progress: 30.0 "
+            "frame=3/10 frame_time=1.250 fpm=48.00 eta=8.8"
+        )
+        assert match is not None
+        adaptor._handle_progress(match)
+
+        # THEN
+        mock_update_status.assert_called_once_with(
+            progress=30,
+            status_message=(
+                "Rendered frame 3/10, 1.250s per frame, 48.00 frames per minute, ETA 8.8s"
+            ),
+        )
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor.update_status")
+    def test_handle_progress_coalesced(self, mock_update_status: Mock, init_data: dict) -> None:
+        """Tests that the unchanged progress is not sent to the worker agent again"""
+        # GIVEN
+        adaptor = UnrealAdaptor(init_data)
+        progress_regex = adaptor._get_regex_callbacks()[0].regex_list[0]
+
+        # WHEN
+        for progress in ["10.2", "10.7", "11.0", "11.0"]:
+            match = progress_regex.search(f"LogPython: Render Executor: Progress: {progress}")
+            assert match is not None
+            adaptor._handle_progress(match)
+
+        # THEN
+        assert mock_update_status.call_args_list == [
+            call(progress=10),
+            call(progress=11),
+        ]
+
+    @patch(
+        "deadline.unreal_adaptor.UnrealAdaptor.adaptor.UnrealAdaptor._get_deadline_telemetry_client"
+    )
+    def test_handle_summary(
+        self, mock_telemetry_client: Mock, init_data: dict, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Tests that the render summary is logged and sent as the telemetry event"""
+        # GIVEN
+        caplog.set_level(0)
+        adaptor = UnrealAdaptor(init_data)
+        summary_callbacks = [
+            callback
+            for callback in adaptor._get_regex_callbacks()
+            if callback.callback == adaptor._handle_summary
+        ]
+        assert len(summary_callbacks) == 1
+
+        # WHEN
+        match = (
+            summary_callbacks[0]
+            .regex_list[0]
+            .search(
+                "LogPython: Render Executor: Frame summary: frames=10 total=12.500 mean=1.250 "
+                "p50=1.200 p95=1.900 max=2.000"
+            )
+        )
+        assert match is not None
+        adaptor._handle_summary(match)
+
+        # THEN
+        expected_summary = {
+            "frames": "10",
+            "total": "12.500",
+            "mean": "1.250",
+            "p50": "1.200",
+            "p95": "1.900",
+            "max": "2.000",
+        }
+        assert f"Render summary: {expected_summary}" in caplog.text
+        mock_telemetry_client.return_value.record_event.assert_called_once_with(
+            event_type="com.amazon.rum.deadline.adaptor.runtime.render_summary",
+            event_details=expected_summary,
+        )
+
     @pytest.mark.parametrize(
         "stdout, error_regex",
         [
@@ -582,3 +1104,164 @@ class TestUnrealAdaptor_on_cancel:
         # THEN
         assert "CANCEL REQUESTED" in caplog.text
         assert "Nothing to cancel because Unreal is not running" in caplog.text
+
+
+class TestUnrealAdaptor_client_events:
+    @pytest.fixture()
+    def adaptor(self, init_data: dict) -> UnrealAdaptor:
+        """UnrealAdaptor running the first task with the event channel open"""
+        adaptor = UnrealAdaptor(init_data)
+        adaptor.handle_client_event({"type": "channel_open"})
+        adaptor._task_id = 1
+        adaptor._log_task_id = 1
+        return adaptor
+
+    @staticmethod
+    def emit(adaptor: UnrealAdaptor, line: str) -> None:
+        adaptor._create_log_handler().emit(Mock(msg=line))
+
+    def test_progress_events(self, adaptor: UnrealAdaptor) -> None:
+        """Tests that the progress from the log is ignored after the progress event of the task"""
+        with patch.object(adaptor, "update_status") as mock_update_status:
+            # WHEN
+            self.emit(adaptor, "LogPython: Render Executor: Progress: 5.0")
+            adaptor.handle_client_event({"type": "progress", "task_id": 1, "progress": 10.0})
+            self.emit(adaptor, "LogPython: Render Executor: Progress: 10.0")
+            adaptor.handle_client_event(
+                {
+                    "type": "frame_done",
+                    "task_id": 1,
+                    "progress": 30.0,
+                    "stats": "frame=3/10 frame_time=1.250 fpm=48.00 eta=8.8",
+                }
+            )
+
+        # THEN
+        assert mock_update_status.call_args_list == [
+            call(progress=5),
+            call(progress=10),
+            call(
+                progress=30,
+                status_message=(
+                    "Rendered frame 3/10, 1.250s per frame, 48.00 frames per minute, ETA 8.8s"
+                ),
+            ),
+        ]
+
+    def test_complete_reported_once(self, adaptor: UnrealAdaptor) -> None:
+        """Tests that the task completed by the event is not completed again by the log"""
+        adaptor._is_rendering = True
+
+        with patch.object(adaptor, "update_status") as mock_update_status:
+            # WHEN
+            adaptor.handle_client_event({"type": "complete", "task_id": 1})
+            self.emit(adaptor, "LogPython: Render Executor: Rendering is complete")
+
+        # THEN
+        mock_update_status.assert_called_once_with(progress=100)
+        assert not adaptor._is_rendering
+        assert adaptor._run_finished_event.is_set()
+
+    def test_error_event(self, adaptor: UnrealAdaptor) -> None:
+        """Tests that the error event fails the task"""
+        # WHEN
+        adaptor.handle_client_event(
+            {"type": "error", "task_id": 1, "message": "Render Executor: Error: GPU crashed"}
+        )
+
+        # THEN
+        assert str(adaptor._exc_info) == (
+            "Unreal Encountered an Error: Render Executor: Error: GPU crashed"
+        )
+        assert adaptor._run_finished_event.is_set()
+
+    def test_events_of_previous_task_ignored(self, adaptor: UnrealAdaptor) -> None:
+        """Tests that the events and the log of the previous task do not finish the next task"""
+        # GIVEN
+        adaptor._task_id = 2
+
+        with patch.object(adaptor, "update_status") as mock_update_status:
+            # WHEN
+            adaptor.handle_client_event({"type": "complete", "task_id": 1})
+            self.emit(adaptor, "LogPython: Render Executor: Error: previous task")
+            self.emit(adaptor, "LogPython: Render Executor: Rendering is complete")
+
+            # THEN
+            mock_update_status.assert_not_called()
+            assert adaptor._exc_info is None
+            assert not adaptor._run_finished_event.is_set()
+
+            # WHEN
+            self.emit(
+                adaptor,
+                'Performing action: {"name": "set_handler", '
+                '"args": {"handler": "render", "task_id": 2}}',
+            )
+            self.emit(adaptor, "LogPython: Render Executor: Rendering is complete")
+
+            # THEN
+            mock_update_status.assert_called_once_with(progress=100)
+
+    def test_log_error_after_next_task_started(self, adaptor: UnrealAdaptor) -> None:
+        """Tests that the error matched in the log of the finished task doesn't fail the next task"""
+        # GIVEN
+        log_task = adaptor._log_task
+
+        # WHEN
+        adaptor._task_id = 2
+        adaptor._fail_task(log_task, "LogPython: Custom Step Executor: Error: previous task")
+        adaptor._complete_task(log_task)
+
+        # THEN
+        assert adaptor._exc_info is None
+        assert not adaptor._task_completed
+        assert not adaptor._run_finished_event.is_set()
+
+
+class TestGetProcessSnapshot:
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.common.psutil.Process")
+    def test_process_stats(self, mock_process_class: Mock) -> None:
+        """Tests that the stats of the process and its children are reported"""
+        # GIVEN
+        process = MagicMock()
+        process.status.return_value = "sleeping"
+        process.memory_info.return_value.rss = 4096
+        process.num_threads.return_value = 42
+        process.cpu_percent.return_value = 12.5
+        child = Mock(pid=1235)
+        child.name.return_value = "ShaderCompileWorker"
+        child.status.return_value = "running"
+        child.memory_info.return_value.rss = 1024
+        exited_child = Mock(pid=1236)
+        exited_child.name.side_effect = psutil.NoSuchProcess(1236)
+        process.children.return_value = [child, exited_child]
+        mock_process_class.return_value = process
+
+        # WHEN
+        snapshot = get_process_snapshot(1234)
+
+        # THEN
+        mock_process_class.assert_called_once_with(1234)
+        process.children.assert_called_once_with(recursive=True)
+        assert snapshot == {
+            "pid": 1234,
+            "status": "sleeping",
+            "rss": 4096,
+            "num_threads": 42,
+            "cpu_percent": 12.5,
+            "children": [
+                {"pid": 1235, "name": "ShaderCompileWorker", "status": "running", "rss": 1024}
+            ],
+        }
+
+    @patch("deadline.unreal_adaptor.UnrealAdaptor.common.psutil.Process")
+    def test_process_error(self, mock_process_class: Mock) -> None:
+        """Tests that the error is reported if the process stats cannot be read"""
+        # GIVEN
+        mock_process_class.side_effect = psutil.AccessDenied(1234)
+
+        # WHEN
+        snapshot = get_process_snapshot(1234)
+
+        # THEN
+        assert snapshot == {"pid": 1234, "error": str(psutil.AccessDenied(1234))}
@@ -0,0 +1,243 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import os
+import sys
+import gzip
+import time
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from openjd.adaptor_runtime.process import LoggingSubprocess
+
+from deadline.unreal_adaptor.UnrealAdaptor.log_policy import (
+    STDERR_LEVEL,
+    STDOUT_LEVEL,
+    TEMP_FULL_LOG_MAX_AGE,
+    LogPolicyStats,
+    UnrealLogPolicy,
+    UnrealLogPolicyHandler,
+)
+
+
+class RecordsHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(record.getMessage())
+
+
+@pytest.fixture()
+def target():
+    """Pytest Fixture to return the logger of the task log and the handler of its messages"""
+    logger = logging.Logger("task_log", level=logging.INFO)
+    handler = RecordsHandler()
+    logger.addHandler(handler)
+    return logger, handler
+
+
+def create_handler(target: logging.Logger, tmp_path, **policy) -> UnrealLogPolicyHandler:
+    policy.setdefault("full_log_file", str(tmp_path / "UnrealEditor.log.gz"))
+    return UnrealLogPolicyHandler(UnrealLogPolicy(**policy), target)
+
+
+class TestUnrealLogPolicyHandler:
+    def test_category_verbosity(self, target, tmp_path) -> None:
+        """Tests that the lines below the minimum verbosity of their category are suppressed"""
+        # GIVEN
+        logger, records = target
+        handler = create_handler(logger, tmp_path, category_verbosity={"LogStreaming": "Warning"})
+        lines = [
+            "[2024.05.01-10.11.12:123][  0]LogStreaming: Display: Loaded package",
+            "LogStreaming: Verbose package",
+            "LogStreaming: Warning: Missing package",
+            "[2024.05.01-10.11.12:124][  1]LogStreaming: Error: Failed to load package",
+            "LogShaderCompilers: Display: Compiling shader",
+            "Traceback (most recent call last):",
+        ]
+
+        # WHEN
+        for line in lines:
+            handler.logger.log(STDOUT_LEVEL, line)
+        handler.close()
+
+        # THEN
+        assert records.messages[1:] == [
+            lines[2],
+            lines[3],
+            lines[4],
+            lines[5],
+            "Unreal log policy: suppressed 2 lines (LogStreaming: 2), "
+            f"full log: {tmp_path / 'UnrealEditor.log.gz'}",
+        ]
+        assert handler.stats == LogPolicyStats(lines=6, forwarded_lines=4, suppressed_lines=2)
+
+    def test_collapse_repeats(self, target, tmp_path) -> None:
+        """Tests that the repeated lines are logged once followed by the number of the repeats"""
+        # GIVEN
+        logger, records = target
+        handler = create_handler(logger, tmp_path, full_log_file="")
+
+        # WHEN
+        for frame in range(4):
+            handler.logger.log(
+                STDOUT_LEVEL, f"[2024.05.01-10.11.12:123][{frame:3}]LogRenderer: Warning: Slow"
+            )
+        handler.logger.log(STDERR_LEVEL, "LogRenderer: Display: Done")
+        handler.logger.log(STDERR_LEVEL, "LogRenderer: Display: Done")
+        handler.close()
+
+        # THEN
+        assert records.messages == [
+            "[2024.05.01-10.11.12:123][  0]LogRenderer: Warning: Slow",
+            "Unreal log policy: last line repeated 3 more times",
+            "LogRenderer: Display: Done",
+            "Unreal log policy: last line repeated 1 more times",
+        ]
+        assert handler.stats == LogPolicyStats(lines=6, forwarded_lines=2, collapsed_lines=4)
+
+    def test_periodic_summary(self, target, tmp_path) -> None:
+        """Tests that the suppressed lines are summarized every summary interval"""
+        # GIVEN
+        logger, records = target
+
+        with patch(
+            "deadline.unreal_adaptor.UnrealAdaptor.log_policy.time.monotonic",
+            side_effect=[0, 30, 61, 61],
+        ):
+            handler = create_handler(logger, tmp_path, full_log_file="", summary_interval=60)
+
+            # WHEN
+            handler.logger.log(STDOUT_LEVEL, "LogShaderCompilers: Display: Compiling 1")
+            handler.logger.log(STDOUT_LEVEL, "LogShaderCompilers: Display: Compiling 2")
+
+        # THEN
+        assert records.messages == ["Unreal log policy: suppressed 2 lines (LogShaderCompilers: 2)"]
+
+    def test_full_log(self, target, tmp_path) -> None:
+        """Tests that all the lines are written to the full log"""
+        # GIVEN
+        logger, records = target
+        handler = create_handler(logger, tmp_path)
+
+        # WHEN
+        handler.logger.info("Running command: UnrealEditor-Cmd")
+        handler.logger.log(STDOUT_LEVEL, "LogShaderCompilers: Display: Compiling")
+        handler.logger.log(STDERR_LEVEL, "LogPython: Error: Failed")
+        handler.logger.log(STDERR_LEVEL, "LogPython: Error: Failed")
+        handler.close()
+        handler.logger.log(STDOUT_LEVEL, "LogExit: Exiting.")
+
+        # THEN
+        with gzip.open(tmp_path / "UnrealEditor.log.gz", "rt", encoding="utf-8") as f:
+            assert f.read().splitlines() == [
+                "INFO: Running command: UnrealEditor-Cmd",
+                "STDOUT: LogShaderCompilers: Display: Compiling",
+                "STDERR: LogPython: Error: Failed",
+                "STDERR: LogPython: Error: Failed",
+            ]
+        assert "Running command: UnrealEditor-Cmd" in records.messages
+        # The output after the close is logged without the policy
+        assert records.messages[-1] == "LogExit: Exiting."
+
+    def test_target_level(self, target, tmp_path) -> None:
+        """Tests that only the records enabled for the target logger are forwarded"""
+        # GIVEN
+        logger, records = target
+        handler = create_handler(logger, tmp_path, full_log_file="")
+
+        # WHEN
+        handler.logger.debug("Asked to terminate the subprocess")
+
+        # THEN
+        assert records.messages == []
+
+    def test_full_log_not_writable(self, target, tmp_path) -> None:
+        """Tests that the output is logged if the full log can't be written"""
+        # GIVEN
+        logger, records = target
+
+        # WHEN
+        handler = create_handler(logger, tmp_path, full_log_file=str(tmp_path / "missing/log.gz"))
+        handler.logger.log(STDOUT_LEVEL, "LogInit: Display: Starting")
+
+        # THEN
+        assert handler.full_log_file == ""
+        assert records.messages[-1] == "LogInit: Display: Starting"
+
+    def test_subprocess_output(self, target, tmp_path) -> None:
+        """Tests that the output of the LoggingSubprocess is handled as the Unreal output"""
+        # GIVEN
+        logger, records = target
+        handler = create_handler(logger, tmp_path, category_verbosity={"LogStreaming": "Warning"})
+        script = (
+            "import sys; "
+            "print('LogStreaming: Display: Loaded package'); "
+            "print('LogInit: Display: Starting'); "
+            "print('LogPython: Error: Failed', file=sys.stderr); "
+            # Keep running until wait() closes the stdin, so it joins the output threads
+            "sys.stdin.read()"
+        )
+
+        # WHEN
+        process = LoggingSubprocess(args=[sys.executable, "-c", script], logger=handler.logger)
+        process.wait()
+        handler.close()
+
+        # THEN
+        assert handler.stats.lines == 3
+        assert handler.stats.suppressed_lines == 1
+        assert "LogInit: Display: Starting" in records.messages
+        assert "LogPython: Error: Failed" in records.messages
+
+    def test_openjd_output_levels(self) -> None:
+        """
+        Tests that openjd-adaptor-runtime still defines the levels of the subprocess output,
+        update the fallback levels of the log policy if it fails
+        """
+        from openjd.adaptor_runtime.process._logging import _STDERR_LEVEL, _STDOUT_LEVEL
+
+        assert (STDOUT_LEVEL, STDERR_LEVEL) == (_STDOUT_LEVEL, _STDERR_LEVEL)
+
+
+class TestUnrealLogPolicy:
+    def test_default_full_log_file(self, tmp_path) -> None:
+        """Tests that the full log is written to the temp directory by default"""
+        with patch(
+            "deadline.unreal_adaptor.UnrealAdaptor.log_policy.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ):
+            full_log_file = UnrealLogPolicy.from_init_data({}).get_full_log_file()
+
+        assert full_log_file.startswith(str(tmp_path))
+        assert full_log_file.endswith(".log.gz")
+        assert UnrealLogPolicy.from_init_data({"full_log_file": ""}).get_full_log_file() == ""
+
+    def test_old_temp_full_logs_removed(self, tmp_path) -> None:
+        """Tests that the full logs older than the max age are removed from the temp directory"""
+        # GIVEN
+        old_full_log = tmp_path / "UnrealEditor-20240501-101112-123.log.gz"
+        recent_full_log = tmp_path / "UnrealEditor-20240508-101112-456.log.gz"
+        other_file = tmp_path / "other.log.gz"
+        for file_path in (old_full_log, recent_full_log, other_file):
+            file_path.write_bytes(b"")
+        old_time = time.time() - TEMP_FULL_LOG_MAX_AGE - 60
+        os.utime(old_full_log, (old_time, old_time))
+        os.utime(other_file, (old_time, old_time))
+
+        # WHEN
+        with patch(
+            "deadline.unreal_adaptor.UnrealAdaptor.log_policy.tempfile.gettempdir",
+            return_value=str(tmp_path),
+        ):
+            UnrealLogPolicy.from_init_data({}).get_full_log_file()
+
+        # THEN
+        assert not old_full_log.exists()
+        assert recent_full_log.exists()
+        assert other_file.exists()
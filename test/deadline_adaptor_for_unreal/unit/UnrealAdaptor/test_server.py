@@ -0,0 +1,97 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import json
+import threading
+from http import HTTPStatus
+from typing import Iterator, Optional
+from unittest.mock import Mock
+from urllib.parse import urlencode
+
+import pytest
+
+from openjd.adaptor_runtime.application_ipc import ActionsQueue
+from openjd.adaptor_runtime_client import Action
+from openjd.adaptor_runtime_client.connection import UnixHTTPConnection
+
+from deadline.unreal_adaptor.UnrealAdaptor.server import (
+    CLIENT_EVENTS_SUPPORTED,
+    UnrealAdaptorServer,
+)
+from deadline.unreal_adaptor.UnrealClient.events import EVENT_PATH
+
+pytestmark = pytest.mark.skipif(
+    not CLIENT_EVENTS_SUPPORTED, reason="Adaptor server doesn't receive the events"
+)
+
+
+@pytest.fixture()
+def server() -> Iterator[UnrealAdaptorServer]:
+    """Pytest Fixture to return the running adaptor server of the mocked Adaptor"""
+    server = UnrealAdaptorServer(ActionsQueue(), Mock())
+    server_thread = threading.Thread(target=server.serve_forever, daemon=True)
+    server_thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server_thread.join(timeout=5)
+
+
+def send_request(
+    server: UnrealAdaptorServer, method: str, path: str, query: Optional[dict] = None
+) -> tuple[HTTPStatus, str]:
+    connection = UnixHTTPConnection(server.server_path, timeout=5)
+    if query:
+        path += "?" + urlencode(query)
+    connection.request(method, path)
+    response = connection.getresponse()
+    try:
+        return HTTPStatus(response.status), response.read().decode()
+    finally:
+        connection.close()
+
+
+class TestUnrealAdaptorServer:
+    def test_event_routed(self, server: UnrealAdaptorServer) -> None:
+        """Tests that PUT /event passes the event to the Adaptor"""
+        # WHEN
+        status, _ = send_request(
+            server, "PUT", EVENT_PATH, {"event": json.dumps({"type": "progress", "progress": 50})}
+        )
+
+        # THEN
+        assert status == HTTPStatus.OK
+        server.adaptor.handle_client_event.assert_called_once_with(  # type: ignore[attr-defined]
+            {"type": "progress", "progress": 50}
+        )
+
+    def test_invalid_event(self, server: UnrealAdaptorServer) -> None:
+        """Tests that the event that is not JSON is rejected"""
+        # WHEN
+        status, _ = send_request(server, "PUT", EVENT_PATH, {"event": "not json"})
+
+        # THEN
+        assert status == HTTPStatus.BAD_REQUEST
+        server.adaptor.handle_client_event.assert_not_called()  # type: ignore[attr-defined]
+
+    def test_event_not_blocked_by_action_request(self, server: UnrealAdaptorServer) -> None:
+        """Tests that the event is received while the action request is held by the server"""
+        # GIVEN
+        action_responses: list[tuple[HTTPStatus, str]] = []
+        action_request = threading.Thread(
+            target=lambda: action_responses.append(send_request(server, "GET", "/action"))
+        )
+        action_request.start()
+
+        # WHEN
+        status, _ = send_request(server, "PUT", EVENT_PATH, {"event": '{"type": "complete"}'})
+
+        # THEN
+        assert status == HTTPStatus.OK
+        assert action_request.is_alive()
+
+        server.actions_queue.enqueue_action(Action("close"))
+        action_request.join(timeout=5)
+        assert action_responses == [(HTTPStatus.OK, str(Action("close")))]
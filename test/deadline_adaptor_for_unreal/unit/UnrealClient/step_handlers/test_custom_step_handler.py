@@ -87,3 +87,25 @@ class TestUnrealCustomStepHandler:
         real_result = unreal_custom_step_handler.run_script(args=script_path_map["args"])
 
         assert real_result == script_path_map["expected_result"]
+
+    def test_validate_script_reimport(
+        self, unreal_custom_step_handler: UnrealCustomStepHandler, tmp_path: Path
+    ) -> None:
+        """
+        Tests that the script with the same name is imported from the given path
+        when the Unreal session is reused by the next task
+        """
+        # GIVEN
+        first_script = tmp_path / "first" / "step_script.py"
+        second_script = tmp_path / "second" / "step_script.py"
+        for script, result in [(first_script, "first"), (second_script, "second")]:
+            script.parent.mkdir()
+            script.write_text(f"def main():\n    return '{result}'\n")
+
+        # WHEN
+        first_module = unreal_custom_step_handler.validate_script(script_path=str(first_script))
+        second_module = unreal_custom_step_handler.validate_script(script_path=str(second_script))
+
+        # THEN
+        assert first_module.main() == "first"
+        assert second_module.main() == "second"
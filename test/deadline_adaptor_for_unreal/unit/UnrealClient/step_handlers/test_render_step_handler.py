@@ -0,0 +1,208 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from deadline.unreal_adaptor.UnrealClient.step_handlers import unreal_render_step_handler
+from deadline.unreal_adaptor.UnrealClient.step_handlers.unreal_render_step_handler import (
+    RenderFrameTimings,
+    RenderProgressTracker,
+    UnrealRenderStepHandler,
+)
+
+
+class TestRenderFrameTimings:
+    def test_frame_times(self) -> None:
+        """Tests that the frame times are measured between the frame beginnings"""
+        # GIVEN
+        frame_timings = RenderFrameTimings(total_frames=10)
+
+        # WHEN
+        first_frame_time = frame_timings.begin_frame(now=100.0)
+        for now in [101.0, 103.0, 104.0, 105.0]:
+            frame_timings.begin_frame(now=now)
+
+        # THEN
+        assert first_frame_time is None
+        assert frame_timings.frame_times == [1.0, 2.0, 1.0, 1.0]
+        assert frame_timings.frames_per_minute == 48.0
+        assert frame_timings.eta == 7.5
+        assert frame_timings.format_stats() == "frame=4/10 frame_time=1.000 fpm=48.00 eta=7.5"
+
+    @pytest.mark.parametrize("frames_count", [1, 4])
+    def test_last_frame_timed(self, frames_count: int) -> None:
+        """Tests that the last output frame is timed when the render is finished"""
+        # GIVEN
+        frame_timings = RenderFrameTimings(total_frames=frames_count)
+        render_progress = RenderProgressTracker(fallback_total_frames=frames_count)
+        executor = SimpleNamespace(frame_timings=frame_timings, render_progress=render_progress)
+
+        # WHEN
+        # MRQ ticks twice per output frame, the frame is timed when the next one begins
+        now = 0.0
+        for output_frame in range(frames_count):
+            for _ in range(2):
+                if render_progress.update((output_frame, frames_count), None):
+                    frame_timings.begin_frame(now=now)
+                now += 1.5
+        with (
+            patch.object(unreal_render_step_handler, "unreal", Mock()) as mock_unreal,
+            patch.object(
+                unreal_render_step_handler,
+                "RemoteRenderMoviePipelineEditorExecutor",
+                executor,
+                create=True,
+            ),
+            patch.object(unreal_render_step_handler.time, "monotonic", return_value=now),
+        ):
+            UnrealRenderStepHandler.executor_finished_callback()
+
+        # THEN
+        logged = [c.args[0] for c in mock_unreal.log.call_args_list]
+        assert frame_timings.frame_times == [3.0] * frames_count
+        assert f"frame={frames_count}/{frames_count} frame_time=3.000" in logged[0]
+        assert logged[1] == (
+            f"Render Executor: Frame summary: frames={frames_count} "
+            f"total={3.0 * frames_count:.3f} mean=3.000 p50=3.000 p95=3.000 max=3.000"
+        )
+        assert logged[2] == "Render Executor: Rendering is complete"
+
+    def test_end_frame(self) -> None:
+        """Tests that only the running frame is ended"""
+        # GIVEN
+        frame_timings = RenderFrameTimings(total_frames=2)
+
+        # WHEN
+        not_started = frame_timings.end_frame(now=1.0)
+        frame_timings.begin_frame(now=2.0)
+        frame_timings.begin_frame(now=4.0)
+        last_frame_time = frame_timings.end_frame(now=7.0)
+        ended_twice = frame_timings.end_frame(now=8.0)
+
+        # THEN
+        assert not_started is None
+        assert last_frame_time == 3.0
+        assert ended_twice is None
+        assert frame_timings.frame_times == [2.0, 3.0]
+        assert frame_timings.eta == 0.0
+
+    def test_rolling_window(self) -> None:
+        """Tests that the frames per minute are calculated over the last minute only"""
+        # GIVEN
+        frame_timings = RenderFrameTimings()
+        for now in [0.0, 30.0, 60.0, 61.0, 100.0]:
+            frame_timings.begin_frame(now=now)
+
+        # THEN
+        # The frame ended at 30s is out of the window
+        assert frame_timings.frames_per_minute == pytest.approx(3 * 60 / 70)
+        # Total frames is unknown
+        assert frame_timings.eta is None
+        assert "eta" not in frame_timings.format_stats()
+
+    @pytest.mark.parametrize(
+        "frame_times, expected_p50, expected_p95",
+        [
+            ([], 0.0, 0.0),
+            ([5.0], 5.0, 5.0),
+            ([float(i) for i in range(1, 101)], 50.0, 95.0),
+            ([1.0, 1.0, 1.0, 10.0], 1.0, 10.0),
+        ],
+    )
+    def test_percentiles(
+        self, frame_times: list[float], expected_p50: float, expected_p95: float
+    ) -> None:
+        """Tests the nearest-rank frame time percentiles"""
+        # GIVEN
+        frame_timings = RenderFrameTimings()
+        frame_timings.frame_times = frame_times
+
+        # THEN
+        assert frame_timings.percentile(50) == expected_p50
+        assert frame_timings.percentile(95) == expected_p95
+
+    def test_summary_matches_regex(self) -> None:
+        """Tests that the summary can be parsed by the summary regex of the handler"""
+        # GIVEN
+        frame_timings = RenderFrameTimings(total_frames=3)
+        for now in [0.0, 1.0, 3.0, 4.0]:
+            frame_timings.begin_frame(now=now)
+
+        # WHEN
+        summary = frame_timings.format_summary()
+        match = UnrealRenderStepHandler.regex_pattern_summary()[0].search(
+            f"LogPython: Render Executor: Frame summary: {summary}"
+        )
+
+        # THEN
+        assert summary == "frames=3 total=4.000 mean=1.333 p50=1.000 p95=2.000 max=2.000"
+        assert match is not None
+        assert match.groups()[0] == summary
+
+
+class TestRenderProgressTracker:
+    def test_completion_has_priority(self) -> None:
+        """Tests that the MRQ completion percentage is used when it is available"""
+        # GIVEN
+        tracker = RenderProgressTracker(fallback_total_frames=10)
+
+        # WHEN
+        tracker.update(output_frames=(1, 4), completion=0.1)
+
+        # THEN
+        assert tracker.progress == pytest.approx(10.0)
+        assert tracker.uses_output_frames
+
+    def test_output_frames(self) -> None:
+        """Tests that the progress is based on the output frames without the completion percentage"""
+        # GIVEN
+        tracker = RenderProgressTracker(fallback_total_frames=100)
+
+        # WHEN
+        began = [tracker.update(output_frames=(frame, 4)) for frame in [0, 0, 0, 1, 1, 2]]
+
+        # THEN
+        # Warm-up and sample ticks of the same output frame don't begin the new frame
+        assert began == [True, False, False, True, False, True]
+        assert tracker.progress == 50.0
+
+    def test_ticks_fallback(self) -> None:
+        """Tests that the progress is estimated from the ticks and clamped without the pipeline state"""
+        # GIVEN
+        tracker = RenderProgressTracker(fallback_total_frames=4)
+
+        # WHEN
+        progress = []
+        for _ in range(6):
+            tracker.update()
+            progress.append(tracker.progress)
+
+        # THEN
+        assert progress == [25.0, 50.0, 75.0, 100.0, 100.0, 100.0]
+        assert not tracker.uses_output_frames
+
+    def test_unknown_total(self) -> None:
+        """Tests that the progress stays 0 if the number of the frames is unknown"""
+        # GIVEN
+        tracker = RenderProgressTracker()
+
+        # WHEN
+        tracker.update()
+
+        # THEN
+        assert tracker.progress == 0.0
+
+    def test_reset(self) -> None:
+        """Tests that the reset starts tracking the new render"""
+        # GIVEN
+        tracker = RenderProgressTracker()
+        tracker.update(output_frames=(3, 4), completion=0.8)
+
+        # WHEN
+        tracker.reset(fallback_total_frames=2)
+
+        # THEN
+        assert (tracker.ticks, tracker.output_frame, tracker.progress) == (0, -1, 0.0)
+        assert tracker.update(output_frames=(0, 2))
@@ -2,11 +2,16 @@
 
 import os
 import sys
+import json
 import pytest
+from http import HTTPStatus
+from typing import Any
 from unittest import SkipTest
 from unittest.mock import Mock, patch
 
 try:
+    from openjd.adaptor_runtime_client import Action
+    from deadline.unreal_adaptor.UnrealClient import events
     from deadline.unreal_adaptor.UnrealClient.unreal_client import UnrealClient, main
 except ModuleNotFoundError:
     # TODO: properly mock out deps to ensure they work within and without unreal
@@ -22,7 +27,7 @@ sys.modules["unreal"] = UnrealPackageMock()
 
 
 class TestUnrealClient:
-    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.ClientInterface")
     def test_unreal_client(self, mock_winclient: Mock) -> None:
         """Tests that the unreal client can initialize, set a renderer and close"""
 
@@ -30,11 +35,156 @@ class TestUnrealClient:
         client.set_handler(handler_dict=dict(handler="render"))
         client.close()
 
+    def test_tick_requests_in_background(self) -> None:
+        """Tests that the tick performs the action only once the background request is done"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._perform_action = Mock()  # type: ignore[method-assign]
+        client._request_next_action = Mock(  # type: ignore[method-assign]
+            return_value=(HTTPStatus.OK, "OK", Action("run_script", {}))
+        )
+
+        # WHEN
+        client.tick(0.01)
+        client._pending_request.result(timeout=5)  # type: ignore[union-attr]
+        client.tick(0.01)
+
+        # THEN
+        client._request_next_action.assert_called_once()
+        client._perform_action.assert_called_once()
+        assert client._pending_request is None
+        assert client.retry_interval == 0.0
+
+    def test_retry_interval_backoff(self) -> None:
+        """Tests that the retry interval backs off while the requests fail and resets on success"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999), max_retry_interval=0.5)
+        client._perform_action = Mock()  # type: ignore[method-assign]
+
+        # WHEN
+        intervals = []
+        for _ in range(6):
+            client._handle_response(HTTPStatus.INTERNAL_SERVER_ERROR, "", None)
+            intervals.append(client.retry_interval)
+        client._handle_response(HTTPStatus.OK, "OK", Action("run_script", {}))
+        intervals.append(client.retry_interval)
+
+        # THEN
+        assert intervals == pytest.approx([0.05, 0.1, 0.2, 0.4, 0.5, 0.5, 0.0])
+
+    def test_retry_interval_on_request_error(self) -> None:
+        """Tests that the retry interval backs off if the server cannot be reached"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._request_next_action = Mock(  # type: ignore[method-assign]
+            side_effect=ConnectionRefusedError("refused")
+        )
+
+        # WHEN
+        client.tick(0.0)
+        client._pending_request.exception(timeout=5)  # type: ignore[union-attr]
+        client.tick(0.0)
+
+        # THEN
+        assert client._pending_request is None
+        assert client.retry_interval == UnrealClient.MIN_RETRY_INTERVAL_SECONDS
+
+    def test_tick_waits_retry_interval(self) -> None:
+        """Tests that the failed request is not retried until the retry interval is elapsed"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._request_next_action = Mock(  # type: ignore[method-assign]
+            return_value=(HTTPStatus.OK, "OK", None)
+        )
+        client.retry_interval = 0.5
+
+        # WHEN
+        client.tick(0.2)
+        client.tick(0.2)
+
+        # THEN
+        assert client._pending_request is None
+
+        # WHEN
+        client.tick(0.2)
+
+        # THEN
+        assert client._pending_request is not None
+        client._pending_request.result(timeout=5)
+        client._request_next_action.assert_called_once()
+
+    def test_startup_phases_reported_once(self, capsys: pytest.CaptureFixture) -> None:
+        """Tests that each startup phase is printed once for the Adaptor"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._perform_action = Mock()  # type: ignore[method-assign]
+        client._request_next_action = Mock(  # type: ignore[method-assign]
+            return_value=(HTTPStatus.OK, "OK", Action("wait_result", {}))
+        )
+        asset_registry = sys.modules["unreal"].AssetRegistryHelpers.get_asset_registry()
+        asset_registry.is_loading_assets.side_effect = [True, False]
+
+        # WHEN
+        for _ in range(3):
+            client.tick(client.max_retry_interval)
+            assert client._pending_request is not None
+            client._pending_request.result(timeout=5)
+            client.tick(0.0)
+        client.set_handler(handler_dict=dict(handler="render"))
+        client.set_handler(handler_dict=dict(handler="custom"))
+
+        # THEN
+        phases = [
+            line.split("UnrealClient: Startup phase: ")[1]
+            for line in capsys.readouterr().out.splitlines()
+            if "UnrealClient: Startup phase: " in line
+        ]
+        assert phases == ["first_client_poll", "asset_registry_ready", "handler_set"]
+
+    @pytest.mark.parametrize(
+        "status, expected_open",
+        [(HTTPStatus.OK, True), (HTTPStatus.NOT_FOUND, False)],
+    )
+    def test_open_event_channel(
+        self, status: HTTPStatus, expected_open: bool, capsys: pytest.CaptureFixture
+    ) -> None:
+        """Tests that the events are sent only if the Adaptor accepts the channel_open event"""
+        # GIVEN
+        client = UnrealClient(socket_path=str(999))
+        client._send_request = Mock(  # type: ignore[method-assign]
+            return_value=Mock(status=status, reason=status.phrase)
+        )
+
+        try:
+            # WHEN
+            opened = client.open_event_channel()
+            client.set_handler(handler_dict=dict(handler="render", task_id=3))
+            sent = events.send_event(events.EVENT_PROGRESS, progress=50.0)
+            client._event_executor.shutdown(wait=True)
+
+            # THEN
+            assert opened == expected_open
+            assert sent == expected_open
+            # The server is reached even if it doesn't accept the events
+            assert "UnrealClient: Startup phase: first_client_poll" in capsys.readouterr().out
+            sent_events = [
+                json.loads(c.kwargs["query_string_params"]["event"])
+                for c in client._send_request.call_args_list
+            ]
+            expected_events: list[dict[str, Any]] = [{"type": events.EVENT_CHANNEL_OPEN}]
+            if expected_open:
+                expected_events.append(
+                    {"type": events.EVENT_PROGRESS, "progress": 50.0, "task_id": 3}
+                )
+            assert sent_events == expected_events
+        finally:
+            events.set_event_sender(None)
+
     @pytest.mark.skip(reason="mocks not set up properly")
     @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.os.path.exists")
     @patch.dict(os.environ, {"UNREAL_ADAPTOR_SOCKET_PATH": "socket_path"})
     @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.UnrealClient.poll")
-    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.WinClientInterface")
+    @patch("deadline.unreal_adaptor.UnrealClient.unreal_client.ClientInterface")
     def test_main(
         self,
         mock_httpclient: Mock,
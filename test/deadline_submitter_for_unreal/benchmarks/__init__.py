@@ -0,0 +1 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
@@ -0,0 +1,172 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Benchmarks of the submission steps on the synthetic projects of 1k to 100k packages
+without the Unreal Editor, see :mod:`..fake_unreal`.
+
+The benchmarks are deselected by default, run them with:
+
+    hatch run benchmark
+
+Each benchmark takes the median time of a few rounds and is compared with its baseline
+from baselines.json, see :mod:`...benchmark_utils`.
+"""
+
+import os
+import itertools
+from typing import Callable
+from unittest.mock import patch
+
+import pytest
+
+from ...benchmark_utils import UPDATE_BASELINES, BenchmarkBaselines, measure
+from ..fake_unreal import (
+    LEVEL_PATH,
+    LEVEL_SEQUENCE_PATH,
+    FakeMoviePipelineExecutorJob,
+    FakeUnreal,
+    create_package_files,
+    create_synthetic_graph,
+    patch_unreal,
+)
+
+
+pytestmark = pytest.mark.benchmark
+
+BASELINES_PATH = f"{os.path.dirname(__file__)}/baselines.json"
+
+PACKAGES_COUNTS = [1_000, 10_000, 100_000]
+
+COLLECTOR_MODULE = "deadline.unreal_submitter.unreal_dependency_collector.collector"
+DEPENDENCY_COMMON_MODULE = "deadline.unreal_submitter.unreal_dependency_collector.common"
+DEPENDENCY_CACHE_MODULE = "deadline.unreal_submitter.unreal_dependency_collector.dependency_cache"
+OPEN_JOB_MODULE = "deadline.unreal_submitter.unreal_open_job.open_job_description"
+
+
+@pytest.fixture(scope="module")
+def baselines():
+    benchmark_baselines = BenchmarkBaselines(BASELINES_PATH)
+    yield benchmark_baselines
+    if UPDATE_BASELINES:
+        benchmark_baselines.save()
+
+
+@pytest.fixture(scope="module", params=PACKAGES_COUNTS, ids=lambda count: f"{count // 1000}k")
+def fake_unreal(request, tmp_path_factory) -> FakeUnreal:
+    """Fake project with the package files of the synthetic dependency graph on the disk"""
+    graph, asset_classes = create_synthetic_graph(request.param)
+    fake = FakeUnreal(str(tmp_path_factory.mktemp("FakeProject")), graph, asset_classes)
+    create_package_files(fake)
+    return fake
+
+
+@pytest.fixture()
+def create_job_bundle_dir(tmp_path) -> Callable[[str, str], str]:
+    """Replacement of create_job_history_bundle_dir() that creates the job bundles in the temporary directory"""
+    bundle_counter = itertools.count()
+
+    def _create_job_bundle_dir(submitter_name: str, job_name: str) -> str:
+        job_bundle_dir = tmp_path / f"{job_name}-{next(bundle_counter)}"
+        job_bundle_dir.mkdir()
+        return str(job_bundle_dir)
+
+    return _create_job_bundle_dir
+
+
+def get_packages_count(fake_unreal: FakeUnreal) -> int:
+    # Level and level sequence are not counted
+    return len(fake_unreal.asset_registry.graph) - 2
+
+
+def get_benchmark_name(name: str, fake_unreal: FakeUnreal) -> str:
+    return f"{name}[{get_packages_count(fake_unreal) // 1000}k]"
+
+
+def test_collect_dependencies(fake_unreal: FakeUnreal, baselines: BenchmarkBaselines):
+    """DependencyCollector walk of the whole graph without the dependency cache"""
+    with patch_unreal(fake_unreal) as modules:
+        collector = modules[COLLECTOR_MODULE].DependencyCollector()
+        dependency_filter = modules[
+            DEPENDENCY_COMMON_MODULE
+        ].DependencyFilters.dependency_in_game_folder
+
+        seconds, dependencies = measure(
+            lambda: collector.collect_many(
+                [LEVEL_SEQUENCE_PATH, LEVEL_PATH], filter_method=dependency_filter
+            )
+        )
+
+    # All the packages and the level that the sequence depends on
+    assert len(dependencies) == get_packages_count(fake_unreal) + 1
+    baselines.check(get_benchmark_name("collect_dependencies", fake_unreal), seconds)
+
+
+def test_collect_dependencies_cached(
+    fake_unreal: FakeUnreal, baselines: BenchmarkBaselines, tmp_path
+):
+    """DependencyCollector walk of the unchanged graph with the dependency cache loaded from the disk"""
+    cache_path = str(tmp_path / "DependencyCache.json")
+
+    with patch_unreal(fake_unreal) as modules:
+        dependency_cache_class = modules[DEPENDENCY_CACHE_MODULE].DependencyCache
+        collector_class = modules[COLLECTOR_MODULE].DependencyCollector
+        dependency_filter = modules[
+            DEPENDENCY_COMMON_MODULE
+        ].DependencyFilters.dependency_in_game_folder
+
+        def collect():
+            collector = collector_class(dependency_cache=dependency_cache_class(cache_path))
+            return collector.collect_many(
+                [LEVEL_SEQUENCE_PATH, LEVEL_PATH], filter_method=dependency_filter
+            )
+
+        collect()
+        get_dependencies_calls = fake_unreal.asset_registry.get_dependencies_calls
+        seconds, dependencies = measure(collect)
+
+    assert len(dependencies) == get_packages_count(fake_unreal) + 1
+    # The Asset Registry is not queried for the unchanged packages
+    assert fake_unreal.asset_registry.get_dependencies_calls == get_dependencies_calls
+    baselines.check(get_benchmark_name("collect_dependencies_cached", fake_unreal), seconds)
+
+
+def test_open_job_description(
+    fake_unreal: FakeUnreal, baselines: BenchmarkBaselines, create_job_bundle_dir
+):
+    """OpenJobDescription of the MRQ job built from scratch, without the dependency cache"""
+    dependency_cache_path = (
+        f"{fake_unreal.Paths.project_saved_dir()}DeadlineCloud/DependencyCache.json"
+    )
+
+    def remove_dependency_cache():
+        if os.path.exists(dependency_cache_path):
+            os.remove(dependency_cache_path)
+
+    with patch_unreal(fake_unreal) as modules:
+        open_job_module = modules[OPEN_JOB_MODULE]
+        mrq_job = FakeMoviePipelineExecutorJob()
+
+        with patch.object(open_job_module, "create_job_history_bundle_dir", create_job_bundle_dir):
+            seconds, open_job = measure(
+                lambda: open_job_module.OpenJobDescription(mrq_job),
+                setup=remove_dependency_cache,
+            )
+
+    # The package files, the level, the level sequence and the queue manifest
+    assert len(open_job.asset_references.input_filenames) == get_packages_count(fake_unreal) + 3
+    baselines.check(get_benchmark_name("open_job_description", fake_unreal), seconds)
+
+
+def test_build_job_bundle(
+    fake_unreal: FakeUnreal, baselines: BenchmarkBaselines, create_job_bundle_dir
+):
+    """Writing the job bundle files of the built OpenJobDescription"""
+    with patch_unreal(fake_unreal) as modules:
+        open_job_module = modules[OPEN_JOB_MODULE]
+
+        with patch.object(open_job_module, "create_job_history_bundle_dir", create_job_bundle_dir):
+            open_job = open_job_module.OpenJobDescription(FakeMoviePipelineExecutorJob())
+            seconds, job_bundle_path = measure(open_job._build_job_bundle)
+
+    assert os.path.getsize(f"{job_bundle_path}/asset_references.yaml") > 0
+    baselines.check(get_benchmark_name("build_job_bundle", fake_unreal), seconds)
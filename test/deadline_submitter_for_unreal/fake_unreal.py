@@ -0,0 +1,486 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+"""
+Fake of the unreal module to run the submitter code without the Unreal Editor.
+
+Unlike Mock, the fake returns the real values: the Asset Registry walks the given synthetic
+dependency graph, the paths point to the given project directory on the disk, MRQ jobs have
+the configuration and the preset overrides the OpenJob is built from. The calls are not recorded,
+so the fake is cheap enough to benchmark the submission on the large graphs.
+"""
+
+import os
+import sys
+import copy
+import random
+import importlib
+from types import ModuleType, SimpleNamespace
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, Optional
+from unittest.mock import patch
+
+
+#: Submitter modules that import unreal
+SUBMITTER_MODULES = [
+    "deadline.unreal_submitter.common",
+    "deadline.unreal_submitter.submission_history",
+    "deadline.unreal_submitter.unreal_dependency_collector.common",
+    "deadline.unreal_submitter.unreal_dependency_collector.dependency_cache",
+    "deadline.unreal_submitter.unreal_dependency_collector.collector",
+    "deadline.unreal_submitter.unreal_open_job.job_step",
+    "deadline.unreal_submitter.unreal_open_job.open_job_description",
+]
+
+LEVEL_SEQUENCE_PATH = "/Game/Sequences/Shot"
+LEVEL_PATH = "/Game/Maps/Level"
+
+
+class FakeName(str):
+    """unreal.Name"""
+
+    def is_none(self) -> bool:
+        return self == "None"
+
+
+class FakeSoftObjectPath(str):
+    """unreal.SoftObjectPath, the path string itself"""
+
+
+class FakeAssetData:
+    """unreal.AssetData of the package's main asset"""
+
+    def __init__(self, package_name: str, asset_class: str = "None"):
+        self.package_name = FakeName(package_name)
+        self.asset_name = FakeName(package_name.rsplit("/", 1)[-1])
+        self.asset_class_path = SimpleNamespace(
+            package_name=FakeName("/Script/Engine"), asset_name=FakeName(asset_class)
+        )
+
+
+class FakeAssetRegistry:
+    """Asset Registry of the packages of the synthetic dependency graph"""
+
+    def __init__(self, graph: dict[str, list[str]], asset_classes: dict[str, str]):
+        """
+        :param graph: Package name -> names of the packages it directly depends on
+        :param asset_classes: Package name -> class of the package's main asset, e.g. "World"
+        """
+        self.graph = graph
+        self.asset_classes = asset_classes
+        self.get_dependencies_calls = 0
+        self.scanned_paths_count = 0
+
+    def has_package(self, package_name: str) -> bool:
+        return package_name in self.asset_classes or package_name in self.graph
+
+    def get_dependencies(self, package_name, dependency_options):
+        self.get_dependencies_calls += 1
+        return list(self.graph.get(str(package_name), []))
+
+    def get_assets(self, ar_filter: dict) -> list[FakeAssetData]:
+        return [
+            FakeAssetData(package_name, self.asset_classes.get(package_name, "Object"))
+            for package_name in ar_filter.get("package_names", [])
+            if self.has_package(package_name)
+        ]
+
+    def scan_modified_asset_files(self, file_paths):
+        pass
+
+    def scan_paths_synchronous(self, paths, force_rescan, ignore_deny_list_scan_filters):
+        self.scanned_paths_count += len(paths)
+
+
+class FakeLevelSequence:
+    def __init__(self, playback_start: int = 0, playback_end: int = 100):
+        self.playback_start = playback_start
+        self.playback_end = playback_end
+
+    def get_playback_start(self) -> int:
+        return self.playback_start
+
+    def get_playback_end(self) -> int:
+        return self.playback_end
+
+
+class FakeEditorAssetLibrary:
+    def __init__(self, asset_registry: FakeAssetRegistry):
+        self.asset_registry = asset_registry
+
+    def does_asset_exist(self, asset_path: str) -> bool:
+        return self.asset_registry.has_package(str(asset_path))
+
+    def find_asset_data(self, asset_path: str) -> FakeAssetData:
+        asset_path = str(asset_path)
+        if not self.asset_registry.has_package(asset_path):
+            return FakeAssetData(asset_path)
+        return FakeAssetData(
+            asset_path, self.asset_registry.asset_classes.get(asset_path, "Object")
+        )
+
+    def load_asset(self, asset_path: str):
+        asset_path = str(asset_path)
+        if self.asset_registry.asset_classes.get(asset_path) == "LevelSequence":
+            return FakeLevelSequence()
+        return SimpleNamespace() if self.asset_registry.has_package(asset_path) else None
+
+
+class FakePaths:
+    """unreal.Paths of the project in the given directory. Directories end with "/" like in Unreal"""
+
+    def __init__(self, project_dir: str):
+        self._project_dir = project_dir.replace("\\", "/").rstrip("/") + "/"
+
+    def project_dir(self) -> str:
+        return self._project_dir
+
+    def project_content_dir(self) -> str:
+        return self._project_dir + "Content/"
+
+    def project_saved_dir(self) -> str:
+        return self._project_dir + "Saved/"
+
+    def get_project_file_path(self) -> str:
+        return self._project_dir + "FakeProject.uproject"
+
+    def is_project_file_path_set(self) -> bool:
+        return True
+
+    @staticmethod
+    def convert_relative_path_to_full(path: str) -> str:
+        return path
+
+
+class FakeMoviePipelineSetting:
+    """unreal.MoviePipelineSetting, the Python class plays the role of unreal.Class"""
+
+    @classmethod
+    def static_class(cls):
+        return cls
+
+    def get_class(self):
+        return type(self)
+
+
+class FakeMoviePipelineOutputSetting(FakeMoviePipelineSetting):
+    def __init__(self):
+        self.output_directory = SimpleNamespace(path="{project_dir}/Saved/MovieRenders")
+        self.use_custom_playback_range = False
+        self.custom_start_frame = 0
+        self.custom_end_frame = 0
+
+
+class FakeDeadlineCloudRenderStepSetting(FakeMoviePipelineSetting):
+    def __init__(self, chunk_size: int = 0):
+        self.name = "Render"
+        self.depends_on: list[str] = []
+        self.chunk_size = chunk_size
+
+
+class FakeDeadlineCloudCustomScriptStepSetting(FakeMoviePipelineSetting):
+    def __init__(self):
+        self.deadline_cloud_steps: list = []
+
+
+class FakeMoviePipelineConfiguration:
+    def __init__(self, settings: Optional[list[FakeMoviePipelineSetting]] = None):
+        self.settings = settings if settings is not None else []
+
+    def find_setting_by_class(self, setting_class):
+        return next(
+            (setting for setting in self.settings if isinstance(setting, setting_class)), None
+        )
+
+    def find_or_add_setting_by_class(self, setting_class):
+        setting = self.find_setting_by_class(setting_class)
+        if setting is None:
+            setting = setting_class()
+            self.settings.append(setting)
+        return setting
+
+    def get_all_settings(self) -> list[FakeMoviePipelineSetting]:
+        return list(self.settings)
+
+
+def create_preset_overrides() -> SimpleNamespace:
+    """unreal.DeadlineCloudJobPresetStruct with the default values"""
+    return SimpleNamespace(
+        job_shared_settings=SimpleNamespace(
+            name="Untitled",
+            description="",
+            initial_state="READY",
+            maximum_failed_tasks_count=1,
+            maximum_retries_per_task=1,
+        ),
+        host_requirements=SimpleNamespace(run_on_all_worker_nodes=True),
+        job_attachments=SimpleNamespace(
+            input_files=SimpleNamespace(files=SimpleNamespace(paths=[]), auto_detected=[]),
+            input_directories=SimpleNamespace(directories=SimpleNamespace(paths=[])),
+            output_directories=SimpleNamespace(directories=SimpleNamespace(paths=[])),
+        ),
+    )
+
+
+class FakeMoviePipelineExecutorJob:
+    def __init__(
+        self,
+        job_name: str = "FakeJob",
+        sequence: str = LEVEL_SEQUENCE_PATH,
+        map: str = LEVEL_PATH,
+        configuration: Optional[FakeMoviePipelineConfiguration] = None,
+    ):
+        self.job_name = job_name
+        self.sequence = FakeSoftObjectPath(sequence)
+        self.map = FakeSoftObjectPath(map)
+        self.preset_overrides = create_preset_overrides()
+        self._configuration = configuration or FakeMoviePipelineConfiguration(
+            [FakeMoviePipelineOutputSetting(), FakeDeadlineCloudRenderStepSetting()]
+        )
+
+    def get_configuration(self) -> FakeMoviePipelineConfiguration:
+        return self._configuration
+
+
+class FakeMoviePipelineQueue:
+    def __init__(self):
+        self.jobs: list[FakeMoviePipelineExecutorJob] = []
+
+    def get_jobs(self) -> list[FakeMoviePipelineExecutorJob]:
+        return list(self.jobs)
+
+    def allocate_new_job(self, job_class=None) -> FakeMoviePipelineExecutorJob:
+        job = FakeMoviePipelineExecutorJob()
+        self.jobs.append(job)
+        return job
+
+    def duplicate_job(self, job: FakeMoviePipelineExecutorJob) -> FakeMoviePipelineExecutorJob:
+        duplicated_job = copy.deepcopy(job)
+        self.jobs.append(duplicated_job)
+        return duplicated_job
+
+
+class FakeMoviePipelineEditorLibrary:
+    def __init__(self, paths: FakePaths):
+        self.paths = paths
+
+    def save_queue_to_manifest_file(self, queue: FakeMoviePipelineQueue):
+        """Write the jobs of the queue to Saved/MovieRenderPipeline/QueueManifest.utxt"""
+        manifest_dir = self.paths.project_saved_dir() + "MovieRenderPipeline"
+        os.makedirs(manifest_dir, exist_ok=True)
+        manifest_path = f"{manifest_dir}/QueueManifest.utxt"
+        with open(manifest_path, "w") as f:
+            for job in queue.get_jobs():
+                f.write(f"{job.job_name} {job.sequence} {job.map}\n")
+        return queue, manifest_path
+
+
+class FakeUnreal(ModuleType):
+    """
+    Fake of the unreal module for the project in the given directory
+    with the Asset Registry of the given synthetic dependency graph
+    """
+
+    SoftObjectPath = FakeSoftObjectPath
+    Name = FakeName
+    AssetData = FakeAssetData
+    Class = type
+    MoviePipelineSetting = FakeMoviePipelineSetting
+    MoviePipelineOutputSetting = FakeMoviePipelineOutputSetting
+    DeadlineCloudRenderStepSetting = FakeDeadlineCloudRenderStepSetting
+    DeadlineCloudCustomScriptStepSetting = FakeDeadlineCloudCustomScriptStepSetting
+    MoviePipelineExecutorJob = FakeMoviePipelineExecutorJob
+    MoviePipelineQueue = FakeMoviePipelineQueue
+    DeadlineCloudJobPresetStruct = SimpleNamespace
+    DeadlineCloudFileAttachmentsArray = list
+    AppMsgType = SimpleNamespace(OK=0)
+
+    class SourceControl:
+        @staticmethod
+        def is_available() -> bool:
+            return False
+
+    class SystemLibrary:
+        @staticmethod
+        def conv_soft_obj_path_to_soft_obj_ref(soft_obj_path):
+            return soft_obj_path
+
+        @staticmethod
+        def conv_soft_object_reference_to_string(soft_obj_ref) -> str:
+            return str(soft_obj_ref)
+
+    class EditorDialog:
+        @staticmethod
+        def show_message(title, message, message_type):
+            pass
+
+    class MoviePipelineQueueSubsystem:
+        pass
+
+    @staticmethod
+    def AssetRegistryDependencyOptions(**kwargs) -> dict:
+        return kwargs
+
+    @staticmethod
+    def ARFilter(**kwargs) -> dict:
+        return kwargs
+
+    @staticmethod
+    def log(message):
+        pass
+
+    @staticmethod
+    def log_warning(message):
+        pass
+
+    @staticmethod
+    def log_error(message):
+        pass
+
+    def __init__(
+        self,
+        project_dir: str,
+        graph: Optional[dict[str, list[str]]] = None,
+        asset_classes: Optional[dict[str, str]] = None,
+    ):
+        """
+        :param project_dir: Directory of the fake project
+        :param graph: Package name -> names of the packages it directly depends on
+        :param asset_classes: Package name -> class of the package's main asset, e.g. "World"
+        """
+        super().__init__("unreal")
+        self.Paths = FakePaths(project_dir)
+        self.asset_registry = FakeAssetRegistry(graph or {}, asset_classes or {})
+        self.AssetRegistryHelpers = SimpleNamespace(get_asset_registry=lambda: self.asset_registry)
+        self.EditorAssetLibrary = FakeEditorAssetLibrary(self.asset_registry)
+        self.MoviePipelineEditorLibrary = FakeMoviePipelineEditorLibrary(self.Paths)
+        self.queue = FakeMoviePipelineQueue()
+
+    def get_editor_subsystem(self, subsystem_class):
+        return SimpleNamespace(get_queue=lambda: self.queue)
+
+
+def create_synthetic_graph(
+    packages_count: int, max_extra_dependencies: int = 3, seed: int = 0
+) -> tuple[dict[str, list[str]], dict[str, str]]:
+    """
+    Create the dependency graph of the shot: the level sequence depends on the level and both depend
+    on the tree of the packages, so all of them are reachable. Each package also depends on a few
+    random packages shared with the other branches and on an engine package that is filtered out.
+
+    :param packages_count: Number of the packages in the Game folder besides the level and the sequence
+    :param max_extra_dependencies: Maximum number of the random dependencies of each package
+    :param seed: Seed of the random dependencies
+
+    :return: Dependency graph and the classes of the packages' assets
+    """
+    rnd = random.Random(seed)
+    package_names = [f"/Game/Assets/Asset_{i}" for i in range(packages_count)]
+
+    graph: dict[str, list[str]] = {}
+    for i, package_name in enumerate(package_names):
+        dependencies = [
+            package_names[child] for child in (2 * i + 1, 2 * i + 2) if child < packages_count
+        ]
+        dependencies += [
+            package_names[rnd.randrange(packages_count)]
+            for _ in range(rnd.randint(0, max_extra_dependencies))
+        ]
+        dependencies.append("/Engine/BasicShapes/Cube")
+        graph[package_name] = dependencies
+
+    graph[LEVEL_PATH] = package_names[:1]
+    graph[LEVEL_SEQUENCE_PATH] = [LEVEL_PATH] + package_names[:1]
+
+    asset_classes = {package_name: "StaticMesh" for package_name in package_names}
+    asset_classes[LEVEL_PATH] = "World"
+    asset_classes[LEVEL_SEQUENCE_PATH] = "LevelSequence"
+
+    return graph, asset_classes
+
+
+def create_package_files(fake_unreal: FakeUnreal):
+    """Create the empty package files (.uasset, .umap) of the Asset Registry in the project's Content folder"""
+    content_dir = fake_unreal.Paths.project_content_dir()
+    for package_name, asset_class in fake_unreal.asset_registry.asset_classes.items():
+        if not package_name.startswith("/Game/"):
+            continue
+        package_path = package_name.replace("/Game/", content_dir, 1)
+        os.makedirs(os.path.dirname(package_path), exist_ok=True)
+        extension = ".umap" if asset_class == "World" else ".uasset"
+        with open(package_path + extension, "wb"):
+            pass
+
+
+@contextmanager
+def patch_unreal(fake_unreal: FakeUnreal) -> Iterator[dict[str, ModuleType]]:
+    """
+    Make the submitter modules use the given fake unreal module.
+
+    The modules keep the unreal module they were imported with, so the references are patched
+    in place. The fake is put to sys.modules only if there is no unreal module at all
+    (e.g. the other tests did not install the Mock), and the submitter modules imported with it
+    are removed from sys.modules on exit.
+
+    :param fake_unreal: Fake unreal module to use
+
+    :return: Submitter module name -> module
+    """
+    with ExitStack() as stack:
+        if "unreal" not in sys.modules:
+            imported_modules = set(sys.modules)
+            sys.modules["unreal"] = fake_unreal
+
+            def remove_fake_modules():
+                for module_name in ["unreal"] + SUBMITTER_MODULES:
+                    if module_name not in imported_modules:
+                        sys.modules.pop(module_name, None)
+
+            stack.callback(remove_fake_modules)
+
+        modules = {
+            module_name: importlib.import_module(module_name) for module_name in SUBMITTER_MODULES
+        }
+        for module in modules.values():
+            stack.enter_context(patch.object(module, "unreal", fake_unreal))
+
+        # Module level values evaluated with the unreal module on import
+        dependency_common = modules["deadline.unreal_submitter.unreal_dependency_collector.common"]
+        content_dir = fake_unreal.Paths.project_content_dir()
+        stack.enter_context(patch.object(dependency_common, "content_dir", content_dir))
+        stack.enter_context(
+            patch.object(dependency_common, "project_dir", fake_unreal.Paths.project_dir())
+        )
+        stack.enter_context(
+            patch.object(
+                modules["deadline.unreal_submitter.unreal_dependency_collector.dependency_cache"],
+                "content_dir",
+                content_dir,
+            )
+        )
+        stack.enter_context(
+            patch.object(
+                modules["deadline.unreal_submitter.unreal_dependency_collector.collector"],
+                "asset_registry",
+                fake_unreal.asset_registry,
+            )
+        )
+
+        job_step = modules["deadline.unreal_submitter.unreal_open_job.job_step"]
+        stack.enter_context(
+            patch.object(
+                job_step.JobStepFactory,
+                "JOB_STEP_MAPPING",
+                [
+                    job_step.JobStepDescriptor(
+                        "Render", job_step.RenderJobStep, FakeDeadlineCloudRenderStepSetting
+                    ),
+                    job_step.JobStepDescriptor(
+                        "CustomScript",
+                        job_step.CustomScriptJobStep,
+                        FakeDeadlineCloudCustomScriptStepSetting,
+                    ),
+                ],
+            )
+        )
+
+        yield modules
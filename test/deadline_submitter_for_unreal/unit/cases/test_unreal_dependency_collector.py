@@ -1,13 +1,19 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
 import sys
+import random
+import tempfile
 import unreal
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
 from deadline.unreal_submitter.unreal_dependency_collector import (
     common,
     collector,
+    dependency_cache,
     dependency_search_options,
 )
 
@@ -22,6 +28,65 @@ UNREAL_ASSET_PATH = "/Game/Test/TestLevelSequence"
 UNREAL_ASSET_DEPENDENCIES_PATHS = ["/Game/Test/Cube"]
 
 
+class FakeAssetRegistry:
+    """Asset registry returning the dependencies from the given synthetic graph"""
+
+    def __init__(self, graph: dict[str, list[str]]):
+        self.graph = graph
+        self.get_dependencies_calls = 0
+        self.scanned_paths: list[list[str]] = []
+
+    def get_dependencies(self, package_name, dependency_options):
+        self.get_dependencies_calls += 1
+        return self.graph.get(str(package_name), [])
+
+    def scan_modified_asset_files(self, file_paths):
+        pass
+
+    def scan_paths_synchronous(self, paths, force_rescan, ignore_deny_list_scan_filters):
+        self.scanned_paths.append(list(paths))
+
+
+class FakeUnreal:
+    """Lightweight replacement of the unreal module that doesn't record calls like Mock does"""
+
+    class SourceControl:
+        @staticmethod
+        def is_available():
+            return False
+
+    @staticmethod
+    def AssetRegistryDependencyOptions(**kwargs):
+        return kwargs
+
+    @staticmethod
+    def log(message):
+        pass
+
+
+def create_synthetic_graph(nodes_count: int, max_dependencies: int = 4, seed: int = 0):
+    """Create the graph where each package depends on a few random packages"""
+    rnd = random.Random(seed)
+    return {
+        f"/Game/Asset_{i}": [
+            f"/Game/Asset_{rnd.randrange(nodes_count)}"
+            for _ in range(rnd.randint(0, max_dependencies))
+        ]
+        for i in range(nodes_count)
+    }
+
+
+def get_reachable(graph: dict[str, list[str]], root: str) -> set[str]:
+    reachable: set[str] = set()
+    stack = [root]
+    while stack:
+        for dependency in graph.get(stack.pop(), []):
+            if dependency not in reachable:
+                reachable.add(dependency)
+                stack.append(dependency)
+    return reachable
+
+
 class TestUnrealDependencyCollector(unittest.TestCase):
     def test_dependency_filter_in_game_folder(self):
         for case in [
@@ -50,6 +115,69 @@ class TestUnrealDependencyCollector(unittest.TestCase):
         ]:
             self.assertEqual(common.os_path_from_unreal_path(case[0], with_ext=case[1]), case[2])
 
+    def test_os_paths_from_unreal_paths(self):
+        mock_unreal = MagicMock()
+        asset_registry = mock_unreal.AssetRegistryHelpers.get_asset_registry.return_value
+        asset_registry.get_assets.return_value = [
+            SimpleNamespace(
+                package_name="/Game/Test/TestLevel",
+                asset_class_path=SimpleNamespace(asset_name="World"),
+            ),
+            SimpleNamespace(
+                package_name="/Game/Test/TestLevelSequence",
+                asset_class_path=SimpleNamespace(asset_name="LevelSequence"),
+            ),
+            # older version of UE python API
+            SimpleNamespace(package_name="/Game/Test/OldLevel", asset_class="World"),
+        ]
+        unreal_paths = [
+            "/Game/Test/TestLevelSequence",
+            "/Game/Test/TestLevel",
+            "/Game/Test/OldLevel",
+            "/Game/JohnDoe",
+        ]
+
+        with (
+            patch.object(common, "unreal", mock_unreal),
+            patch.object(common, "content_dir", "C:/Project/Content/"),
+        ):
+            os_paths = common.os_paths_from_unreal_paths(unreal_paths, with_ext=True)
+            os_paths_without_ext = common.os_paths_from_unreal_paths(unreal_paths)
+
+        self.assertEqual(
+            os_paths,
+            [
+                "C:/Project/Content/Test/TestLevelSequence.uasset",
+                "C:/Project/Content/Test/TestLevel.umap",
+                "C:/Project/Content/Test/OldLevel.umap",
+                "C:/Project/Content/JohnDoe.uasset",
+            ],
+        )
+        self.assertEqual(
+            os_paths_without_ext,
+            [
+                "C:/Project/Content/Test/TestLevelSequence.*",
+                "C:/Project/Content/Test/TestLevel.*",
+                "C:/Project/Content/Test/OldLevel.*",
+                "C:/Project/Content/JohnDoe.*",
+            ],
+        )
+        # asset classes are taken with the single query
+        asset_registry.get_assets.assert_called_once()
+
+    def test_get_existing_paths(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            existing_paths = [f"{tmp_dir}/Asset_{i}.uasset" for i in range(0, 20, 2)]
+            for existing_path in existing_paths:
+                with open(existing_path, "w") as f:
+                    f.write("asset")
+
+            os_paths = [f"{tmp_dir}/Asset_{i}.uasset" for i in range(20)]
+
+            self.assertEqual(common.get_existing_paths(os_paths), existing_paths)
+            self.assertEqual(common.get_existing_paths(os_paths[:1]), existing_paths[:1])
+            self.assertEqual(common.get_existing_paths([]), [])
+
     @unittest.skip("test not set-up properly for mocks")
     def test_os_abs_from_relative(self):
         for case in [
@@ -77,6 +205,231 @@ class TestUnrealDependencyCollector(unittest.TestCase):
             expected_search_options,
         )
 
+    def _collect_from_graph(self, graph: dict[str, list[str]], root: str, **kwargs) -> list[str]:
+        with (
+            patch.object(collector, "unreal", FakeUnreal),
+            patch.object(collector, "asset_registry", FakeAssetRegistry(graph)),
+        ):
+            return collector.DependencyCollector().collect(root, **kwargs)
+
+    def test_dependency_collector_breadth_first_order(self):
+        graph = {
+            "/Game/LevelSequence": ["/Game/Level", "/Game/Cube"],
+            "/Game/Level": ["/Game/StatueSet", "/Game/Cube"],
+            "/Game/StatueSet": ["/Game/HorseAsset", "/Game/RockAsset", "/Engine/Basic"],
+            "/Game/RockAsset": ["/Game/Level"],
+        }
+
+        dependencies = self._collect_from_graph(
+            graph,
+            "/Game/LevelSequence",
+            filter_method=common.DependencyFilters.dependency_in_game_folder,
+        )
+
+        self.assertEqual(
+            dependencies,
+            ["/Game/Level", "/Game/Cube", "/Game/StatueSet", "/Game/HorseAsset", "/Game/RockAsset"],
+        )
+
+    def test_dependency_collector_synthetic_graphs(self):
+        for nodes_count in [10_000, 100_000]:
+            graph = create_synthetic_graph(nodes_count)
+            registry = FakeAssetRegistry(graph)
+            with (
+                patch.object(collector, "unreal", FakeUnreal),
+                patch.object(collector, "asset_registry", registry),
+            ):
+                dependencies = collector.DependencyCollector().collect("/Game/Asset_0")
+
+            self.assertEqual(len(dependencies), len(set(dependencies)))
+            self.assertEqual(set(dependencies), get_reachable(graph, "/Game/Asset_0"))
+            # each collected asset and the root is asked for its dependencies only once
+            self.assertEqual(registry.get_dependencies_calls, len(dependencies) + 1)
+
+    def test_dependency_collector_scan_modes(self):
+        graph = {
+            "/Game/LevelSequence": ["/Game/Level", "/Game/Cube"],
+            "/Game/Level": ["/Game/StatueSet", "/Game/Cube"],
+            "/Game/StatueSet": ["/Game/HorseAsset", "/Game/RockAsset"],
+        }
+        expected_dependencies = [
+            "/Game/Level",
+            "/Game/Cube",
+            "/Game/StatueSet",
+            "/Game/HorseAsset",
+            "/Game/RockAsset",
+        ]
+
+        for scan_mode, expected_scanned_paths in [
+            (
+                dependency_search_options.DependencyScanMode.PER_ASSET,
+                [
+                    ["/Game/Level", "/Game/Cube"],
+                    ["/Game/StatueSet"],
+                    [],
+                    ["/Game/HorseAsset", "/Game/RockAsset"],
+                    [],
+                    [],
+                ],
+            ),
+            (
+                dependency_search_options.DependencyScanMode.BATCHED,
+                [
+                    ["/Game/Level", "/Game/Cube"],
+                    ["/Game/StatueSet"],
+                    ["/Game/HorseAsset", "/Game/RockAsset"],
+                ],
+            ),
+            (dependency_search_options.DependencyScanMode.SKIP, []),
+            # source control is not available
+            (dependency_search_options.DependencyScanMode.AUTO, []),
+        ]:
+            registry = FakeAssetRegistry(graph)
+            found_dependencies: list[str] = []
+
+            with (
+                patch.object(collector, "unreal", FakeUnreal),
+                patch.object(collector, "asset_registry", registry),
+            ):
+                dependencies = collector.DependencyCollector().collect(
+                    "/Game/LevelSequence",
+                    on_found_dependency_callback=found_dependencies.extend,
+                    scan_mode=scan_mode,
+                )
+
+            self.assertEqual(dependencies, expected_dependencies)
+            self.assertEqual(found_dependencies, expected_dependencies)
+            self.assertEqual(registry.scanned_paths, expected_scanned_paths)
+
+    def test_dependency_collector_collect_many(self):
+        graph = {
+            "/Game/LevelSequence": ["/Game/Cube", "/Game/StatueSet"],
+            "/Game/Level": ["/Game/StatueSet", "/Game/Floor"],
+            "/Game/StatueSet": ["/Game/HorseAsset", "/Game/RockAsset"],
+            "/Game/RockAsset": ["/Game/Material"],
+        }
+        registry = FakeAssetRegistry(graph)
+
+        with (
+            patch.object(collector, "unreal", FakeUnreal),
+            patch.object(collector, "asset_registry", registry),
+        ):
+            dependencies = collector.DependencyCollector().collect_many(
+                ["/Game/LevelSequence", "/Game/Level"]
+            )
+
+        self.assertEqual(
+            dependencies,
+            [
+                "/Game/Cube",
+                "/Game/StatueSet",
+                "/Game/Floor",
+                "/Game/HorseAsset",
+                "/Game/RockAsset",
+                "/Game/Material",
+            ],
+        )
+        # shared StatueSet and its dependencies are asked for the dependencies only once
+        self.assertEqual(registry.get_dependencies_calls, len(dependencies) + 2)
+
+    def test_dependency_cache_invalidation(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            content_dir = f"{tmp_dir}/Content/".replace("\\", "/")
+            os.makedirs(content_dir)
+            level_file = f"{content_dir}Level.umap"
+            with open(level_file, "w") as f:
+                f.write("level")
+            cache_path = f"{tmp_dir}/Saved/DependencyCache.json"
+
+            with patch.object(dependency_cache, "content_dir", content_dir):
+                cache = dependency_cache.DependencyCache(cache_path)
+                cache.set("/Game/Level", "options", ["/Game/Cube"])
+                cache.set("/Game/NotOnDisk", "options", ["/Game/Cube"])
+                cache.save()
+
+                cache = dependency_cache.DependencyCache(cache_path)
+                self.assertEqual(cache.get("/Game/Level", "options"), ["/Game/Cube"])
+                self.assertIsNone(cache.get("/Game/Level", "other_options"))
+                self.assertIsNone(cache.get("/Game/NotOnDisk", "options"))
+
+                with open(level_file, "a") as f:
+                    f.write(" changed")
+                self.assertIsNone(cache.get("/Game/Level", "options"))
+
+    def test_dependency_cache_outdated_entries_removed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            content_dir = f"{tmp_dir}/Content/".replace("\\", "/")
+            os.makedirs(content_dir)
+            for package_name in ["Level", "Renamed", "Other"]:
+                with open(f"{content_dir}{package_name}.umap", "w") as f:
+                    f.write(package_name)
+            cache_path = f"{tmp_dir}/Saved/DependencyCache.json"
+
+            with patch.object(dependency_cache, "content_dir", content_dir):
+                cache = dependency_cache.DependencyCache(cache_path)
+                for package_name in ["/Game/Level", "/Game/Renamed", "/Game/Other"]:
+                    cache.set(package_name, "options", ["/Game/Cube"])
+                cache.save()
+
+                os.rename(f"{content_dir}Renamed.umap", f"{content_dir}NewName.umap")
+
+                # Only the Level is visited by the next collection
+                cache = dependency_cache.DependencyCache(cache_path)
+                self.assertEqual(cache.get("/Game/Level", "options"), ["/Game/Cube"])
+                cache.save()
+
+                cache = dependency_cache.DependencyCache(cache_path)
+                self.assertEqual(cache.get("/Game/Level", "options"), ["/Game/Cube"])
+                # Entries of the packages from the other collections are kept
+                self.assertEqual(cache.get("/Game/Other", "options"), ["/Game/Cube"])
+                self.assertNotIn("/Game/Renamed", cache._entries["options"])
+
+    def test_dependency_collector_with_cache(self):
+        graph = {
+            "/Game/LevelSequence": ["/Game/Level", "/Game/Cube"],
+            "/Game/Level": ["/Game/StatueSet", "/Game/Cube"],
+            "/Game/StatueSet": ["/Game/HorseAsset", "/Game/RockAsset"],
+        }
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            content_dir = f"{tmp_dir}/Content/".replace("\\", "/")
+            os.makedirs(content_dir)
+            for package_name in ["LevelSequence", "Level", "Cube", "StatueSet", "RockAsset"]:
+                with open(f"{content_dir}{package_name}.uasset", "w") as f:
+                    f.write(package_name)
+            cache_path = f"{tmp_dir}/Saved/DependencyCache.json"
+
+            results = []
+            for _ in range(2):
+                registry = FakeAssetRegistry(graph)
+                with (
+                    patch.object(collector, "unreal", FakeUnreal),
+                    patch.object(collector, "asset_registry", registry),
+                    patch.object(dependency_cache, "content_dir", content_dir),
+                ):
+                    dependencies = collector.DependencyCollector(
+                        dependency_cache=dependency_cache.DependencyCache(cache_path)
+                    ).collect(
+                        "/Game/LevelSequence",
+                        scan_mode=dependency_search_options.DependencyScanMode.BATCHED,
+                    )
+                results.append((dependencies, registry))
+
+        (first_dependencies, first_registry), (second_dependencies, second_registry) = results
+        self.assertEqual(first_dependencies, second_dependencies)
+        self.assertEqual(first_registry.get_dependencies_calls, 6)
+        # HorseAsset is not on the disk, so it can't be cached
+        self.assertEqual(second_registry.get_dependencies_calls, 1)
+        self.assertEqual(second_registry.scanned_paths, [[], [], ["/Game/HorseAsset"]])
+
+    def test_dependency_collector_deep_chain(self):
+        chain_length = sys.getrecursionlimit() * 5
+        graph = {f"/Game/Asset_{i}": [f"/Game/Asset_{i + 1}"] for i in range(chain_length)}
+
+        dependencies = self._collect_from_graph(graph, "/Game/Asset_0")
+
+        self.assertEqual(dependencies, [f"/Game/Asset_{i + 1}" for i in range(chain_length)])
+
     @unittest.skip("test not set-up properly for mocks")
     def test_dependency_collector(self):
         dependency_collector = collector.DependencyCollector()
@@ -2,14 +2,25 @@
 
 import os
 import sys
+import time
 import yaml
 import unreal
+import tempfile
 import unittest
 from pathlib import Path
 from typing import Optional
-
-from deadline.unreal_submitter.common import soft_obj_path_to_str
-from deadline.unreal_submitter.unreal_open_job import open_job_description
+from unittest.mock import Mock, patch
+
+from deadline.client.job_bundle import deadline_yaml_dump
+from deadline.unreal_submitter import common as submitter_common
+from deadline.unreal_submitter.common import soft_obj_path_to_str, store_content_addressed_file
+from deadline.unreal_submitter.settings import DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
+from deadline.unreal_submitter.unreal_open_job import (
+    open_job_description,
+    job_step,
+    template_registry,
+    job_bundle_writer,
+)
 from deadline.unreal_submitter.unreal_dependency_collector import collector, common
 
 UNREAL_PROJECT_DIRECTORY = str(
@@ -181,6 +192,260 @@ class TestUnrealOpenJob(unittest.TestCase):
         assert len(asset_references["assetReferences"]["outputs"]["directories"]) != 0
 
 
+class TestRenderJobStep(unittest.TestCase):
+    @staticmethod
+    def _build_render_step(chunk_size: int) -> job_step.RenderJobStep:
+        step_template = job_step.JobStepFactory.get_step_template(
+            job_step.JobStepDescriptor("Render", job_step.RenderJobStep, Mock())
+        )
+        return job_step.RenderJobStep(
+            step_template=step_template,
+            step_settings=Mock(depends_on=[], chunk_size=chunk_size),
+            host_requirements=Mock(run_on_all_worker_nodes=True),
+            queue_manifest_path="C:/Project/Saved/MovieRenderPipeline/QueueManifest.utxt",
+            mrq_job=Mock(),
+        )
+
+    def test_get_chunk_count(self):
+        for start_frame, end_frame, chunk_size, expected_count in [
+            (0, 100, 10, 10),
+            (0, 95, 10, 10),
+            (10, 11, 10, 1),
+            (0, 100, 1000, 1),
+        ]:
+            self.assertEqual(
+                job_step.RenderJobStep.get_chunk_count(start_frame, end_frame, chunk_size),
+                expected_count,
+            )
+
+    @patch.object(job_step, "get_mrq_job_frame_range", return_value=(5, 100))
+    def test_render_step_chunked(self, mock_frame_range: Mock):
+        step = self._build_render_step(chunk_size=10).as_dict()
+
+        chunk_parameter = next(
+            p
+            for p in step["parameterSpace"]["taskParameterDefinitions"]
+            if p["name"] == "ChunkStartFrame"
+        )
+        self.assertEqual(chunk_parameter["type"], "INT")
+        self.assertEqual(chunk_parameter["range"], "5-95:10")
+
+        run_data = next(f for f in step["script"]["embeddedFiles"] if f["name"] == "runData")
+        self.assertIn("chunk_size: 10", run_data["data"])
+        self.assertIn("chunk_end_frame: 100", run_data["data"])
+        self.assertIn("chunk_start_frame: {{Task.Param.ChunkStartFrame}}", run_data["data"])
+
+    @patch.object(job_step, "get_mrq_job_frame_range", return_value=(0, 100))
+    def test_render_step_not_chunked(self, mock_frame_range: Mock):
+        step = self._build_render_step(chunk_size=0).as_dict()
+
+        parameter_names = [p["name"] for p in step["parameterSpace"]["taskParameterDefinitions"]]
+        self.assertNotIn("ChunkStartFrame", parameter_names)
+        mock_frame_range.assert_not_called()
+
+
+class TestTemplateRegistry(unittest.TestCase):
+    def setUp(self):
+        template_registry.TemplateRegistry.clear()
+
+    def tearDown(self):
+        template_registry.TemplateRegistry.clear()
+
+    def test_template_parsed_once(self):
+        with patch.object(
+            template_registry.yaml, "safe_load", wraps=template_registry.yaml.safe_load
+        ) as mock_safe_load:
+            first = template_registry.TemplateRegistry.get_template(
+                DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
+            )
+            second = template_registry.TemplateRegistry.get_template(
+                DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH
+            )
+            render_step = template_registry.TemplateRegistry.get_step_template(
+                DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH, "Render"
+            )
+
+        mock_safe_load.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(render_step, first["steps"][0])
+        self.assertIsNone(
+            template_registry.TemplateRegistry.get_step_template(
+                DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH, "NotExistingStep"
+            )
+        )
+
+    def test_template_copies_are_independent(self):
+        first = template_registry.TemplateRegistry.get_step_template(
+            DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH, "Render"
+        )
+        assert first is not None
+        first["name"] = "Changed"
+        first["parameterSpace"]["taskParameterDefinitions"][0]["range"].append("changed")
+
+        second = template_registry.TemplateRegistry.get_step_template(
+            DEFAULT_JOB_STEP_TEMPLATE_FILE_PATH, "Render"
+        )
+        assert second is not None
+        self.assertEqual(second["name"], "Render")
+        self.assertEqual(
+            second["parameterSpace"]["taskParameterDefinitions"][0]["range"], ["render"]
+        )
+
+    def test_modified_template_parsed_again(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            template_path = f"{tmp_dir}/template.yaml"
+            with open(template_path, "w") as f:
+                f.write("steps:\n- name: Render\n")
+            os.utime(template_path, (0, 0))
+            self.assertEqual(
+                template_registry.TemplateRegistry.get_template(template_path),
+                {"steps": [{"name": "Render"}]},
+            )
+
+            with open(template_path, "w") as f:
+                f.write("steps:\n- name: CustomScript\n")
+            os.utime(template_path, (1, 1))
+            self.assertIsNotNone(
+                template_registry.TemplateRegistry.get_step_template(template_path, "CustomScript")
+            )
+
+
+class TestJobBundleWriter(unittest.TestCase):
+    BUNDLE_DATA = {
+        "template.yaml": {
+            "name": "Job",
+            "steps": [{"name": "Render", "script": {"embeddedFiles": [{"data": "line1\nline2"}]}}],
+        },
+        "parameter_values.yaml": {
+            "parameterValues": [
+                {"name": "deadline:priority", "value": 1},
+                {"name": "ChunkSize", "value": 1.5},
+                {"name": "Flag", "value": True},
+            ]
+        },
+        "asset_references.yaml": {
+            "assetReferences": {
+                "inputs": {
+                    "directories": [],
+                    "filenames": [f"C:/Project/Content/Asset_{i}.uasset" for i in range(1000)]
+                    + ["123", "true", "null", "", "a: b"],
+                },
+                "outputs": {"directories": ["C:/Project/Saved/MovieRenders"]},
+                "referencedPaths": [],
+            }
+        },
+    }
+
+    def test_write_files(self):
+        for use_libyaml in [True, False]:
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                writer = job_bundle_writer.JobBundleWriter(tmp_dir, use_libyaml=use_libyaml)
+                file_paths = writer.write_files(self.BUNDLE_DATA)
+
+                self.assertEqual(
+                    file_paths, [f"{tmp_dir}/{file_name}" for file_name in self.BUNDLE_DATA]
+                )
+                for file_name, data in self.BUNDLE_DATA.items():
+                    with open(f"{tmp_dir}/{file_name}", encoding="utf8") as f:
+                        content = f.read()
+                    self.assertEqual(yaml.safe_load(content), data)
+                    self.assertEqual(content, deadline_yaml_dump(data, indent=1))
+
+    def test_write_files_error(self):
+        writer = job_bundle_writer.JobBundleWriter("/not/existing/job/bundle")
+        with self.assertRaises(OSError):
+            writer.write_files(self.BUNDLE_DATA)
+
+
+class TestContentAddressedManifest(unittest.TestCase):
+    def test_store_content_addressed_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manifests_dir = f"{tmp_dir}/Manifests"
+            manifest_path = f"{tmp_dir}/QueueManifest.utxt"
+
+            with open(manifest_path, "w") as f:
+                f.write("Job A")
+            first = store_content_addressed_file(manifest_path, manifests_dir)
+
+            # Editor overwrites the manifest with the next job
+            with open(manifest_path, "w") as f:
+                f.write("Job B")
+            second = store_content_addressed_file(manifest_path, manifests_dir)
+
+            with open(manifest_path, "w") as f:
+                f.write("Job A")
+            third = store_content_addressed_file(manifest_path, manifests_dir)
+
+            self.assertNotEqual(first, second)
+            self.assertEqual(first, third)
+            self.assertTrue(first.endswith(".utxt"))
+            self.assertEqual(os.path.dirname(first), manifests_dir)
+            self.assertEqual(
+                sorted(os.listdir(manifests_dir)),
+                sorted([os.path.basename(first), os.path.basename(second)]),
+            )
+            with open(first) as f:
+                self.assertEqual(f.read(), "Job A")
+            with open(second) as f:
+                self.assertEqual(f.read(), "Job B")
+
+    def test_old_content_addressed_files_removed(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manifests_dir = f"{tmp_dir}/Manifests"
+            manifest_path = f"{tmp_dir}/QueueManifest.utxt"
+            os.makedirs(manifests_dir)
+
+            with open(manifest_path, "w") as f:
+                f.write("Job A")
+            reused = store_content_addressed_file(manifest_path, manifests_dir)
+
+            old = f"{manifests_dir}/{'0' * 64}.utxt"
+            other = f"{manifests_dir}/Notes.txt"
+            for file_path in (old, other):
+                with open(file_path, "w") as f:
+                    f.write("Old")
+
+            old_time = time.time() - submitter_common.CONTENT_ADDRESSED_FILE_MAX_AGE - 60
+            for file_path in (reused, old, other):
+                os.utime(file_path, (old_time, old_time))
+
+            # The old file with the same content is reused and kept by the next submission
+            self.assertEqual(store_content_addressed_file(manifest_path, manifests_dir), reused)
+
+            self.assertEqual(
+                sorted(os.listdir(manifests_dir)),
+                sorted([os.path.basename(reused), os.path.basename(other)]),
+            )
+            self.assertGreater(os.path.getmtime(reused), old_time)
+
+
+class TestMrqJobFrameRange(unittest.TestCase):
+    @patch.object(submitter_common, "soft_obj_path_to_str", return_value="/Game/Sequences/Shot")
+    def test_sequence_playback_range(self, mock_soft_obj_path_to_str: Mock):
+        mrq_job = Mock()
+        mrq_job.get_configuration.return_value.find_setting_by_class.return_value = None
+        level_sequence = Mock()
+        level_sequence.get_playback_start.return_value = 0
+        level_sequence.get_playback_end.return_value = 100
+
+        with patch.object(
+            submitter_common.unreal.EditorAssetLibrary, "load_asset", return_value=level_sequence
+        ):
+            frame_range = submitter_common.get_mrq_job_frame_range(mrq_job)
+
+        self.assertEqual(frame_range, (0, 100))
+        # Artist's job configuration is not modified by the submission
+        mrq_job.get_configuration.return_value.find_or_add_setting_by_class.assert_not_called()
+
+    def test_custom_playback_range(self):
+        mrq_job = Mock()
+        mrq_job.get_configuration.return_value.find_setting_by_class.return_value = Mock(
+            use_custom_playback_range=True, custom_start_frame=10, custom_end_frame=20
+        )
+
+        self.assertEqual(submitter_common.get_mrq_job_frame_range(mrq_job), (10, 20))
+
+
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromTestCase(TestUnrealOpenJob)
     unittest.TextTestRunner(stream=sys.stdout, buffer=True).run(suite)
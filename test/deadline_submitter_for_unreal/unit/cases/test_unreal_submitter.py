@@ -1,12 +1,25 @@
 #  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
+import os
 import sys
 import time
 import unreal
+import tempfile
 import unittest
-from unittest.mock import PropertyMock, Mock, patch
+import threading
+from pathlib import Path
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, PropertyMock, Mock, patch
 
-from deadline.unreal_submitter.submitter import UnrealSubmitter
+from deadline.unreal_submitter.submitter import (
+    UnrealJobSubmission,
+    UnrealSubmitter,
+    UnrealSubmitStatus,
+)
+from deadline.unreal_submitter.submission_history import SubmissionHistory
+from deadline.job_attachments.asset_manifests import HashAlgorithm
+from deadline.job_attachments.caches import HashCache, HashCacheEntry
 from deadline.job_attachments.progress_tracker import ProgressReportMetadata, ProgressStatus
 
 try:
@@ -47,6 +60,11 @@ def create_job_from_bundle_mock(
 
 
 class TestUnrealSubmitter(unittest.TestCase):
+    def setUp(self):
+        # Arguments of the background submission callbacks, see on_progress() and on_finished()
+        self.progress_updates: list[float] = []
+        self.finished_job_ids: list[str] = []
+
     @unittest.skip("mocks not set up properly")
     @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
     def test_add_job(self, mock_telemetry_client: Mock, submitter=None):
@@ -113,6 +131,419 @@ class TestUnrealSubmitter(unittest.TestCase):
 
         create_job_from_bundle_mock.assert_called_once()
 
+    @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
+    def test_submit_jobs_parallel(self, mock_telemetry_client: Mock):
+        running_jobs: list[str] = []
+        max_running_jobs = 0
+        lock = threading.Lock()
+
+        def create_job_mock(
+            job_bundle_dir, hashing_progress_callback, upload_progress_callback, **kwargs
+        ):
+            nonlocal max_running_jobs
+            with lock:
+                running_jobs.append(job_bundle_dir)
+                max_running_jobs = max(max_running_jobs, len(running_jobs))
+            hashing_progress_callback(
+                ProgressReportMetadata(
+                    status=ProgressStatus.PREPARING_IN_PROGRESS,
+                    progress=100.0,
+                    transferRate=1000.0,
+                    progressMessage="Done",
+                )
+            )
+            time.sleep(0.1)
+            with lock:
+                running_jobs.remove(job_bundle_dir)
+            if job_bundle_dir == "bundle_2":
+                raise RuntimeError("Upload failed")
+            upload_progress_callback(
+                ProgressReportMetadata(
+                    status=ProgressStatus.UPLOAD_IN_PROGRESS,
+                    progress=100.0,
+                    transferRate=1000.0,
+                    progressMessage="Done",
+                )
+            )
+            kwargs["create_job_result_callback"]()
+            return f"job_id_{job_bundle_dir[-1]}"
+
+        mock_unreal = MagicMock()
+        slow_task = mock_unreal.ScopedSlowTask.return_value.__enter__.return_value
+        slow_task.should_cancel.return_value = False
+
+        with (
+            patch("deadline.unreal_submitter.submitter.unreal", mock_unreal),
+            patch(
+                "deadline.unreal_submitter.submitter.create_job_from_job_bundle",
+                side_effect=create_job_mock,
+            ),
+        ):
+            submitter = UnrealSubmitter(silent_mode=True, max_parallel_jobs=2)
+            submitter._jobs = [
+                SimpleNamespace(name=f"Job {i}", job_bundle_path=f"bundle_{i}")  # type: ignore
+                for i in range(4)
+            ]
+            submitter.submit_jobs()
+
+        self.assertEqual(max_running_jobs, 2)
+        self.assertEqual(
+            [job_submission.job_id for job_submission in submitter.job_submissions],
+            ["job_id_0", "job_id_1", None, "job_id_3"],
+        )
+        self.assertEqual(submitter.job_submissions[2].failed_message, "Upload failed")
+        self.assertEqual(submitter.submission_failed_message, "Job Job 2: Upload failed")
+        self.assertEqual(
+            [job_submission.status for job_submission in submitter.job_submissions],
+            [
+                UnrealSubmitStatus.COMPLETED,
+                UnrealSubmitStatus.COMPLETED,
+                UnrealSubmitStatus.HASHING,
+                UnrealSubmitStatus.COMPLETED,
+            ],
+        )
+        self.assertEqual(
+            [job_submission.overall_progress for job_submission in submitter.job_submissions],
+            [100.0] * 4,
+        )
+
+    @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
+    def test_submit_jobs_with_history(self, mock_telemetry_client: Mock):
+        def create_job_mock(job_bundle_dir, **kwargs):
+            if job_bundle_dir == "bundle_1":
+                raise RuntimeError("Upload failed")
+            return f"job_id_{job_bundle_dir[-1]}"
+
+        mock_unreal = MagicMock()
+        mock_unreal.ScopedSlowTask.return_value.__enter__.return_value.should_cancel.return_value = (
+            False
+        )
+        mock_history = MagicMock(spec=SubmissionHistory)
+        mock_history.seed_hash_cache.return_value = 0
+
+        with (
+            patch("deadline.unreal_submitter.submitter.unreal", mock_unreal),
+            patch(
+                "deadline.unreal_submitter.submitter.create_job_from_job_bundle",
+                side_effect=create_job_mock,
+            ),
+        ):
+            submitter = UnrealSubmitter(silent_mode=True, submission_history=mock_history)
+            submitter._jobs = [
+                SimpleNamespace(  # type: ignore
+                    name=f"Job {i}",
+                    job_bundle_path=f"bundle_{i}",
+                    submission_history_key=f"shot_{i}",
+                    asset_references=SimpleNamespace(input_filenames={f"file_{i}"}),
+                )
+                for i in range(2)
+            ]
+            submitter.submit_jobs()
+
+        self.assertEqual(mock_history.get_delta.call_count, 2)
+        # Only the created jobs are stored in the history
+        mock_history.record.assert_called_once_with("shot_0", {"file_0"})
+        mock_history.save.assert_called_once()
+
+    @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
+    def test_submit_jobs_share_boto3_session(self, mock_telemetry_client: Mock):
+        from deadline.client import api
+        from deadline.client.api import _session
+
+        session_class = _session.boto3.Session
+        session_threads: list[str] = []
+        worker_sessions = []
+        workers_started = threading.Barrier(2, timeout=5)
+
+        def create_session(*args, **kwargs):
+            session_threads.append(threading.current_thread().name)
+            return session_class(*args, **kwargs)
+
+        def create_job_mock(job_bundle_dir, **kwargs):
+            # Both jobs create their clients at the same time, like create_job_from_job_bundle
+            workers_started.wait()
+            api.get_boto3_client("deadline")
+            worker_sessions.append(api.get_boto3_session())
+            return f"job_id_{job_bundle_dir[-1]}"
+
+        mock_unreal = MagicMock()
+        mock_unreal.ScopedSlowTask.return_value.__enter__.return_value.should_cancel.return_value = (
+            False
+        )
+
+        _session.invalidate_boto3_session_cache()
+        try:
+            with (
+                tempfile.TemporaryDirectory() as config_dir,
+                patch.dict(
+                    os.environ,
+                    {
+                        "DEADLINE_CONFIG_FILE_PATH": os.path.join(config_dir, "config"),
+                        "AWS_ACCESS_KEY_ID": "access-key",
+                        "AWS_SECRET_ACCESS_KEY": "secret-key",
+                        "AWS_DEFAULT_REGION": "us-west-2",
+                    },
+                ),
+                patch.object(_session.boto3, "Session", side_effect=create_session),
+                patch("deadline.unreal_submitter.submitter.unreal", mock_unreal),
+                patch(
+                    "deadline.unreal_submitter.submitter.create_job_from_job_bundle",
+                    side_effect=create_job_mock,
+                ),
+            ):
+                os.environ.pop("AWS_PROFILE", None)
+                submitter = UnrealSubmitter(silent_mode=True, max_parallel_jobs=2)
+                submitter._jobs = [
+                    SimpleNamespace(name=f"Job {i}", job_bundle_path=f"bundle_{i}")  # type: ignore
+                    for i in range(2)
+                ]
+                submitter.submit_jobs()
+        finally:
+            _session.invalidate_boto3_session_cache()
+
+        self.assertEqual(
+            [job_submission.job_id for job_submission in submitter.job_submissions],
+            ["job_id_0", "job_id_1"],
+        )
+        # The session is created once on the submitting thread and shared by the workers
+        self.assertEqual(session_threads, [threading.current_thread().name])
+        self.assertEqual(len(worker_sessions), 2)
+        self.assertIs(worker_sessions[0], worker_sessions[1])
+
+    def test_progress_channel_keeps_latest(self):
+        job_submission = UnrealJobSubmission(job=SimpleNamespace(name="Job"))  # type: ignore
+        self.assertFalse(job_submission.apply_progress())
+
+        for progress in range(100):
+            job_submission.publish_progress(UnrealSubmitStatus.HASHING, progress, "Hashing")
+        job_submission.publish_progress(UnrealSubmitStatus.UPLOADING, 10, "Uploading")
+
+        self.assertTrue(job_submission.apply_progress())
+        self.assertEqual(job_submission.status, UnrealSubmitStatus.UPLOADING)
+        self.assertEqual(job_submission.overall_progress, 55)
+        self.assertFalse(job_submission.apply_progress())
+
+    @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
+    def test_display_progress_frame_rate(self, mock_telemetry_client: Mock):
+        progress_callbacks = 20000
+
+        def create_job_mock(hashing_progress_callback, **kwargs):
+            for i in range(progress_callbacks):
+                hashing_progress_callback(
+                    SimpleNamespace(progress=i * 100 / progress_callbacks, progressMessage="")
+                )
+            time.sleep(0.2)
+            kwargs["create_job_result_callback"]()
+            return "job_id"
+
+        mock_unreal = MagicMock()
+        slow_task = mock_unreal.ScopedSlowTask.return_value.__enter__.return_value
+        slow_task.should_cancel.return_value = False
+
+        with (
+            patch("deadline.unreal_submitter.submitter.unreal", mock_unreal),
+            patch(
+                "deadline.unreal_submitter.submitter.create_job_from_job_bundle",
+                side_effect=create_job_mock,
+            ),
+        ):
+            submitter = UnrealSubmitter(silent_mode=True)
+            submitter._jobs = [
+                SimpleNamespace(name="Job", job_bundle_path="bundle")  # type: ignore
+            ]
+            start_time = time.monotonic()
+            submitter.submit_jobs()
+            elapsed = time.monotonic() - start_time
+
+        # The dialog is updated at the fixed rate, not on every progress callback
+        max_updates = elapsed / UnrealSubmitter.PROGRESS_UPDATE_INTERVAL_SECONDS + 2
+        self.assertLessEqual(slow_task.enter_progress_frame.call_count, max_updates)
+        self.assertEqual(submitter.job_submissions[0].status, UnrealSubmitStatus.COMPLETED)
+        self.assertEqual(submitter.job_submissions[0].overall_progress, 100)
+
+    def run_background_submission(
+        self, submitter: UnrealSubmitter, mock_unreal: MagicMock, cancel_after_ticks: int = -1
+    ):
+        # Tick the editor until the submitter unregisters its tick callback
+        submitter.submit_jobs_in_background(
+            on_progress=self.on_progress, on_finished=self.on_finished
+        )
+        tick_callback = mock_unreal.register_slate_post_tick_callback.call_args.args[0]
+        ticks = 0
+        while not mock_unreal.unregister_slate_post_tick_callback.called:
+            self.assertLess(ticks, 1000)
+            if ticks == cancel_after_ticks:
+                submitter.cancel()
+            tick_callback(0.02)
+            time.sleep(0.01)
+            ticks += 1
+        return ticks
+
+    def on_progress(self, progress: float, message: str):
+        self.progress_updates.append(progress)
+
+    def on_finished(self, job_ids: list[str]):
+        self.finished_job_ids = job_ids
+
+    @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
+    def test_submit_jobs_in_background(self, mock_telemetry_client: Mock):
+        job_started = threading.Event()
+        continue_job = threading.Event()
+
+        def create_job_mock(job_bundle_dir, hashing_progress_callback, **kwargs):
+            job_started.set()
+            continue_job.wait(5)
+            hashing_progress_callback(SimpleNamespace(progress=100.0, progressMessage="Done"))
+            kwargs["create_job_result_callback"]()
+            return f"job_id_{job_bundle_dir[-1]}"
+
+        mock_unreal = MagicMock()
+        with (
+            patch("deadline.unreal_submitter.submitter.unreal", mock_unreal),
+            patch(
+                "deadline.unreal_submitter.submitter.create_job_from_job_bundle",
+                side_effect=create_job_mock,
+            ),
+        ):
+            submitter = UnrealSubmitter(silent_mode=True)
+            submitter._jobs = [
+                SimpleNamespace(name=f"Job {i}", job_bundle_path=f"bundle_{i}")  # type: ignore
+                for i in range(2)
+            ]
+            submitter.submit_jobs_in_background(
+                on_progress=self.on_progress, on_finished=self.on_finished
+            )
+
+            # Call returns while the jobs are being submitted
+            self.assertTrue(job_started.wait(5))
+            self.assertTrue(submitter.is_submitting)
+            tick_callback = mock_unreal.register_slate_post_tick_callback.call_args.args[0]
+            tick_callback(1.0)
+            mock_unreal.unregister_slate_post_tick_callback.assert_not_called()
+            self.assertEqual(self.progress_updates, [0.0])
+            with self.assertRaises(RuntimeError):
+                submitter.submit_jobs_in_background()
+
+            continue_job.set()
+            while not mock_unreal.unregister_slate_post_tick_callback.called:
+                tick_callback(1.0)
+                time.sleep(0.01)
+
+        self.assertFalse(submitter.is_submitting)
+        self.assertEqual(self.finished_job_ids, ["job_id_0", "job_id_1"])
+        self.assertEqual(self.progress_updates[-1], 100.0)
+        self.assertEqual(
+            [job_submission.status for job_submission in submitter.job_submissions],
+            [UnrealSubmitStatus.COMPLETED] * 2,
+        )
+
+    @patch("deadline.unreal_submitter.submitter.get_deadline_cloud_library_telemetry_client")
+    def test_cancel_background_submission(self, mock_telemetry_client: Mock):
+        self.progress_updates = []
+        self.finished_job_ids = ["not called"]
+
+        def create_job_mock(job_bundle_dir, hashing_progress_callback, **kwargs):
+            # Cooperative cancellation, job attachments stop when the callback returns False
+            while hashing_progress_callback(SimpleNamespace(progress=50.0, progressMessage="")):
+                time.sleep(0.01)
+            return None
+
+        mock_unreal = MagicMock()
+        with (
+            patch("deadline.unreal_submitter.submitter.unreal", mock_unreal),
+            patch(
+                "deadline.unreal_submitter.submitter.create_job_from_job_bundle",
+                side_effect=create_job_mock,
+            ),
+        ):
+            submitter = UnrealSubmitter(silent_mode=True, max_parallel_jobs=1)
+            submitter._jobs = [
+                SimpleNamespace(name=f"Job {i}", job_bundle_path=f"bundle_{i}")  # type: ignore
+                for i in range(3)
+            ]
+            self.run_background_submission(submitter, mock_unreal, cancel_after_ticks=5)
+
+        self.assertFalse(submitter.continue_submission)
+        self.assertEqual(self.finished_job_ids, [])
+        self.assertEqual(
+            [job_submission.job_id for job_submission in submitter.job_submissions],
+            [None] * 3,
+        )
+
+
+class TestSubmissionHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.history_path = f"{self.tmp_dir.name}/SubmissionHistory.json"
+        self.hash_cache_dir = f"{self.tmp_dir.name}/cache"
+        self.files = []
+        for i in range(3):
+            file_path = f"{self.tmp_dir.name}/asset_{i}.uasset"
+            with open(file_path, "w") as f:
+                f.write(f"asset {i}")
+            self.files.append(file_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def put_hashes(self, hash_cache_dir: str):
+        # Fill the hash cache like job attachments does on upload
+        with HashCache(hash_cache_dir) as hash_cache:
+            for file_path in self.files:
+                path = Path(file_path)
+                hash_cache.put_entry(
+                    HashCacheEntry(
+                        file_path=str(path.resolve()),
+                        hash_algorithm=HashAlgorithm.XXH128,
+                        file_hash=f"hash_{path.name}",
+                        last_modified_time=str(datetime.fromtimestamp(path.stat().st_mtime)),
+                    )
+                )
+
+    def test_delta(self):
+        history = SubmissionHistory(self.history_path, self.hash_cache_dir)
+        delta = history.get_delta("shot", self.files)
+        self.assertEqual(delta.added, self.files)
+
+        self.put_hashes(self.hash_cache_dir)
+        history.record("shot", self.files[:2])
+        history.save()
+
+        new_file = f"{self.tmp_dir.name}/asset_new.uasset"
+        with open(new_file, "w") as f:
+            f.write("new asset")
+        with open(self.files[1], "w") as f:
+            f.write("modified asset")
+
+        delta = SubmissionHistory(self.history_path, self.hash_cache_dir).get_delta(
+            "shot", [self.files[0], self.files[1], new_file]
+        )
+        self.assertEqual(delta.unchanged, [self.files[0]])
+        self.assertEqual(delta.modified, [self.files[1]])
+        self.assertEqual(delta.added, [new_file])
+        self.assertEqual(delta.removed, [])
+
+        delta = history.get_delta("shot", [self.files[0]])
+        self.assertEqual(delta.removed, [self.files[1]])
+        self.assertEqual(history.get_delta("other_shot", self.files).added, self.files)
+
+    def test_seed_hash_cache(self):
+        self.put_hashes(self.hash_cache_dir)
+        history = SubmissionHistory(self.history_path, self.hash_cache_dir)
+        history.record("shot", self.files)
+
+        # Nothing to seed while the hash cache has the valid entries
+        self.assertEqual(history.seed_hash_cache("shot", self.files), 0)
+
+        history.hash_cache_dir = f"{self.tmp_dir.name}/empty_cache"
+        os.makedirs(history.hash_cache_dir)
+        self.assertEqual(history.seed_hash_cache("shot", self.files), 3)
+
+        with HashCache(history.hash_cache_dir) as hash_cache:
+            entry = hash_cache.get_entry(str(Path(self.files[0]).resolve()), HashAlgorithm.XXH128)
+        assert entry is not None
+        self.assertEqual(entry.file_hash, "hash_asset_0.uasset")
+
 
 if __name__ == "__main__":
     suite = unittest.TestLoader().loadTestsFromTestCase(TestUnrealSubmitter)